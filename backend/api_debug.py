@@ -9,7 +9,7 @@ router = APIRouter()
 
 
 @router.post("/api/crawl/debug-run")
-async def debug_run(
+def debug_run(
     payload: dict,
     db: Session = Depends(get_db),
 ):
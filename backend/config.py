@@ -40,6 +40,18 @@ class Settings:
         self.CRAWL_STOP_ON_SEEN_RATIO: float = float(os.getenv("CRAWL_STOP_ON_SEEN_RATIO", "0.85"))
         self.CRAWL_MAX_QUERIES_PER_SOURCE: int = int(os.getenv("CRAWL_MAX_QUERIES_PER_SOURCE", "3"))
         self.CRAWL_QUERY_VARIANTS: int = int(os.getenv("CRAWL_QUERY_VARIANTS", "3"))
+        self.CRAWL_COMMIT_BATCH_SIZE: int = int(os.getenv("CRAWL_COMMIT_BATCH_SIZE", "200"))
+        # an unfinished run counts as interrupted once neither its heartbeat nor a checkpoint moved for this long
+        self.CRAWL_RESUME_STALE_MINUTES: int = int(os.getenv("CRAWL_RESUME_STALE_MINUTES", "15"))
+        # how often a running crawl stamps crawl_runs.heartbeat_at, even while a fetch is slow
+        self.CRAWL_HEARTBEAT_SECONDS: float = float(os.getenv("CRAWL_HEARTBEAT_SECONDS", "60"))
+        self.NEAR_DUP_WINDOW_DAYS: int = int(os.getenv("NEAR_DUP_WINDOW_DAYS", "30"))
+        # weight of the full-text (BM25) match when ranking /api/jobs?q= results
+        self.SEARCH_BM25_WEIGHT: float = float(os.getenv("SEARCH_BM25_WEIGHT", "1.0"))
+        # broader terms skip BM25 ranking and keep the relevance_score order
+        self.SEARCH_RANK_MAX_HITS: int = int(os.getenv("SEARCH_RANK_MAX_HITS", "5000"))
+        # rendered /api/jobs, /api/stats and /api/runs bodies kept for the current data version
+        self.RESPONSE_CACHE_SIZE: int = int(os.getenv("RESPONSE_CACHE_SIZE", "128"))
         
         self.JOB_SOURCES: dict = {
             "indeed": _as_bool(os.getenv("ENABLE_INDEED"), False),
@@ -70,6 +82,21 @@ class Settings:
         self.PROFILE_TEXT: str = profile_text
         self.NLP_MODEL_NAME: str = os.getenv("NLP_MODEL_NAME", "sentence-transformers/all-MiniLM-L6-v2")
         self.NLP_WEIGHT: float = float(os.getenv("NLP_WEIGHT", "3.0"))
+        self.NLP_BATCH_SIZE: int = int(os.getenv("NLP_BATCH_SIZE", "32"))
+        # engine-wide scoring queue: flush at this many texts or after the deadline
+        self.NLP_SCORING_FLUSH_SIZE: int = int(os.getenv("NLP_SCORING_FLUSH_SIZE", "128"))
+        self.NLP_SCORING_MAX_WAIT_MS: float = float(os.getenv("NLP_SCORING_MAX_WAIT_MS", "25"))
+        # torch (sentence-transformers), onnx (fp32 export) or int8 (quantized export)
+        self.NLP_BACKEND: str = os.getenv("NLP_BACKEND", "torch").lower()
+        self.NLP_ONNX_MODEL_DIR: str | None = os.getenv("NLP_ONNX_MODEL_DIR")
+        self.NLP_MAX_SEQ_LENGTH: int = int(os.getenv("NLP_MAX_SEQ_LENGTH", "256"))
+        # optional shared embedding daemon (python -m backend.embedding_service)
+        self.NLP_SERVICE_SOCKET: str | None = os.getenv("NLP_SERVICE_SOCKET")
+        self.NLP_SERVICE_MAX_BATCH: int = int(os.getenv("NLP_SERVICE_MAX_BATCH", "64"))
+        self.NLP_SERVICE_MAX_WAIT_MS: float = float(os.getenv("NLP_SERVICE_MAX_WAIT_MS", "5"))
+        self.EMBEDDING_CACHE_ENABLED: bool = _as_bool(os.getenv("EMBEDDING_CACHE_ENABLED"), True)
+        # cached vectors not looked up for this many days are pruned after each crawl
+        self.EMBEDDING_CACHE_TTL_DAYS: int = int(os.getenv("EMBEDDING_CACHE_TTL_DAYS", "30"))
 
         self.ENABLE_NOTIFICATIONS: bool = _as_bool(os.getenv("ENABLE_NOTIFICATIONS"))
         self.ENABLE_EMAIL_NOTIFICATIONS: bool = _as_bool(os.getenv("ENABLE_EMAIL_NOTIFICATIONS"))
@@ -87,6 +114,10 @@ class Settings:
 
         self.NOTIFICATION_MIN_SCORE: float = float(os.getenv("NOTIFICATION_MIN_SCORE", "3.0"))
         self.MIN_SCORE_TO_STORE: float = float(os.getenv("MIN_SCORE_TO_STORE", "0.0"))
+        # v2 scoring cascade: only jobs matching a keyword reach the NLP model
+        self.CRAWL_SCORING_CASCADE: bool = _as_bool(os.getenv("CRAWL_SCORING_CASCADE"), True)
+        # additionally require the job location to match one of the configured locations
+        self.CRAWL_CASCADE_MATCH_LOCATION: bool = _as_bool(os.getenv("CRAWL_CASCADE_MATCH_LOCATION"), False)
         self.CRAWL_MODE: str = os.getenv("CRAWL_MODE", "workflow").lower()
         self.INDIA_MODE: bool = _as_bool(os.getenv("INDIA_MODE"), False)
 
@@ -1,24 +1,11 @@
 from backend.models import Job
+from backend.crawl_engine.identity import identity_from_payload
 
 
 def compute_keys(raw_job):
-    job_key = Job.generate_key(
-        raw_job.get("title", ""),
-        raw_job.get("company", ""),
-        raw_job.get("url", ""),
-        raw_job.get("source", ""),
-        raw_job.get("post_date"),
-        raw_job.get("location"),
-    )
-    job_hash = Job.generate_hash(
-        raw_job.get("title", ""),
-        raw_job.get("company", ""),
-        raw_job.get("url", ""),
-        raw_job.get("source", ""),
-        raw_job.get("post_date"),
-        raw_job.get("location"),
-    )
-    return job_key, job_hash
+    """Return (job_key, job_hash); the key is computed once and reused as the hash."""
+    identity = identity_from_payload(raw_job)
+    return identity.job_key, identity.job_hash
 
 
 def fingerprint_from_payload(payload: dict) -> str:
@@ -3,24 +3,39 @@ import json
 import logging
 import os
 import ssl
+import time
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any
 from threading import Thread
 
 import httpx
+import numpy as np
 import requests
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.exc import IntegrityError
 
 from backend.config import settings
+from backend.http_cache import bump_data_version
+from backend.relevance import RelevancePolicy
 from backend.models import Job, CrawlRun
-from backend.nlp import get_nlp_scorer
+from backend.nlp import flush_embedding_cache, get_nlp_scorer, warm_up_nlp_scorer
 from backend.crawl_engine.fetcher import Fetcher
 from backend.crawl_engine.metrics import Metrics
-from backend.crawl_engine.dedupe import compute_keys
-from backend.crawl_engine.normalize import build_normalized, canonical_url
-from backend.crawl_engine.state import load_state, update_state_failure, update_state_success, get_cursor, set_cursor
-from backend.crawl_engine.types import RawJob
+from backend.crawl_engine.key_index import KnownKeyIndex
+from backend.crawl_engine.near_dupes import NearDuplicateIndex, lsh_bands
+from backend.crawl_engine.scoring import ScoringCoordinator
+from backend.profiles import ProfileMatrix, copy_profile_scores, load_profile_matrix, write_profile_scores
+from backend.crawl_engine.identity import canonical_url
+from backend.crawl_engine.state import (
+    load_state,
+    update_state_failure,
+    update_state_success,
+    get_cursor,
+    set_cursor,
+    get_checkpoint,
+    set_checkpoint,
+)
+from backend.crawl_engine.types import JobRecord
 from backend.crawl_engine import state as state_module
 from backend.crawl_engine.errors import (
     SourceBlockedError,
@@ -31,19 +46,50 @@ from backend.crawl_engine.errors import (
 )
 from backend.database import SessionLocal
 from backend.crawl_engine.query_utils import generate_queries
-from backend.crawl_engine.normalize import canonical_url
 
 logger = logging.getLogger(__name__)
 DEBUG_DEDUPE = os.getenv("CRAWL_DEBUG_DEDUPE") == "1"
 
 
 STOP_ON_SEEN_RATIO = settings.CRAWL_STOP_ON_SEEN_RATIO
+# per-source counters passed to the progress callback
+PROGRESS_COUNTS = (
+    "fetched_count",
+    "jobs_parsed_count",
+    "jobs_normalized_count",
+    "jobs_prefilter_passed_count",
+    "jobs_scored_count",
+    "jobs_inserted_count",
+    "jobs_updated_count",
+    "jobs_deduped_count",
+)
+
 
 
+def _stamp(checkpoint: dict) -> dict:
+    """Record when the checkpoint last moved (resume treats quiet runs as interrupted)."""
+    checkpoint["updated_at"] = datetime.now(timezone.utc).isoformat()
+    return checkpoint
+
 class EngineV2:
-    def __init__(self, db: Session, ignore_cooldown: bool = False):
+    def __init__(
+        self,
+        db: Session,
+        ignore_cooldown: bool = False,
+        run_id: str | None = None,
+        resume: bool = False,
+        keywords: List[str] | None = None,
+        locations: List[str] | None = None,
+        min_store_score: float | None = None,
+        progress: Callable[[str, str, dict], None] | None = None,
+    ):
         self.db = db
+        # progress(source, stage, counts) after each stage and committed batch
+        self.progress = progress
         self.ignore_cooldown = ignore_cooldown
+        self.run_id = run_id
+        self.resume = resume
+        self.batch_size = max(1, settings.CRAWL_COMMIT_BATCH_SIZE)
         self.fetcher = Fetcher(
             max_concurrent_global=10,
             per_domain=2,
@@ -51,7 +97,20 @@ class EngineV2:
             max_delay_ms=settings.REQUEST_DELAY_MS_MAX,
         )
         self.metrics = Metrics()
-        self.nlp_scorer = get_nlp_scorer()
+        # keyword prefilter and score combination, shared with re-scoring
+        self.relevance = RelevancePolicy(keywords, locations)
+        self.min_store_score = min_store_score
+        # the model loads while sources fetch; scoring awaits it per source
+        self.nlp_scorer = None
+        self._scorer_future = warm_up_nlp_scorer(get_nlp_scorer)
+        # shared by all sources so their texts reach the model in full batches
+        self.scoring: ScoringCoordinator | None = None
+        self._group_futures: Dict[str, asyncio.Future] = {}
+        self.profile_matrix: ProfileMatrix | None = None
+        self._profile_groups: Dict[str, str] = {}  # job_key -> group whose profile scores it takes
+        self._group_profile_scores: Dict[str, np.ndarray] = {}
+        self.key_index: KnownKeyIndex | None = None
+        self.near_index: NearDuplicateIndex | None = None
 
     async def run_sources(self, source_functions: Dict[str, callable], sources_enabled: dict):
         tasks = []
@@ -63,6 +122,11 @@ class EngineV2:
 
     async def _run_source(self, name: str, fn: callable):
         state = load_state(self.db, name)
+        checkpoint = get_checkpoint(state, self.run_id) if self.resume else {}
+        if checkpoint.get("status") == "done":
+            # finished before the interruption: keep its metrics, do not re-crawl
+            self.metrics.source[name].update(checkpoint.get("metrics") or {})
+            return
         if not self.ignore_cooldown and state.cooldown_until and state.cooldown_until > datetime.utcnow():
             logger.warning("Source %s in cooldown until %s", name, state.cooldown_until)
             return
@@ -70,6 +134,17 @@ class EngineV2:
         cursor_info = cursor_info or {}
         cursor_info.setdefault("http_cache", {})
         since = self._compute_since(cursor_info)
+        resuming = bool(checkpoint.get("items_committed"))
+        checkpoint = {
+            "run_id": self.run_id,
+            "status": "running",
+            "pages_completed": checkpoint.get("pages_completed", 0),
+            "batches_committed": checkpoint.get("batches_committed", 0),
+            "items_committed": checkpoint.get("items_committed", 0),
+            "cursor": checkpoint.get("cursor"),
+        }
+        self._save_checkpoint(state, checkpoint)
+        self._report(name, "started", checkpoint)
         try:
             # Existing sources are sync; run in thread to allow concurrency
             try:
@@ -78,9 +153,11 @@ class EngineV2:
                 jobs_raw = await asyncio.to_thread(fn)
             if os.getenv("CRAWL_TEST_DEBUG") == "1":
                 logger.info("CRAWL_DEBUG source=%s dry_run=%s enabled=%s", name, False, True)
-            parsed_jobs: List[RawJob] = []
+            parsed_jobs: List[JobRecord] = []
             fetched = len(jobs_raw)
             self.metrics.source[name]["fetched_count"] = fetched
+            self.metrics.source[name]["pages_fetched"] += 1
+            checkpoint["pages_completed"] = max(checkpoint["pages_completed"], 1)
             for j in jobs_raw:
                 try:
                     if hasattr(j, "model_dump"):
@@ -91,83 +168,51 @@ class EngineV2:
                         payload = j
                     else:
                         payload = {}
-                    parsed_jobs.append(RawJob(**payload))
+                    parsed_jobs.append(JobRecord.from_payload(payload))
                     self.metrics.source[name]["jobs_parsed_count"] += 1
                 except Exception as exc:
                     self.metrics.source[name]["errors"].append(str(exc))
-            normalized_payloads = []
-            for raw in parsed_jobs:
-                job_key, job_hash = compute_keys(raw.dict())
-                norm = build_normalized(raw, job_hash, job_key)
-                self._update_last_seen(cursor_info, raw)
-                if self.nlp_scorer:
-                    try:
-                        score = self.nlp_scorer.score(f"{norm.title} {norm.description}")
-                        norm.relevance_score = score
-                        self.metrics.source[name]["jobs_scored_count"] += 1
-                        self.metrics.source[name]["jobs_above_threshold_count"] += 1
-                        self.metrics.source[name]["matched_count"] += 1
-                    except Exception as exc:
-                        self.metrics.source[name]["errors"].append(str(exc))
-                normalized_payloads.append(norm)
-                self.metrics.source[name]["jobs_insert_attempted_count"] += 1
-            self.metrics.source[name]["jobs_normalized_count"] = len(normalized_payloads)
-
-            # upsert with optimistic insert, dedupe on IntegrityError
+            self._report(name, "fetched", checkpoint)
+            skipped = 0
+            if resuming:
+                # skip what batches committed before the interruption stored, by
+                # identity: the refetched feed may have gained postings at the top
+                committed = self._keys_committed_this_run()
+                pending = []
+                for raw in parsed_jobs:
+                    if raw.job_key in committed:
+                        self._update_last_seen(cursor_info, raw)
+                    else:
+                        pending.append(raw)
+                skipped = len(parsed_jobs) - len(pending)
+                self.metrics.source[name]["jobs_resumed_skipped_count"] = skipped
+            else:
+                pending = parsed_jobs
+
             updated_jobs = 0
             dedup_count = 0
             inserted_count = 0
-            for norm in normalized_payloads:
-                # Ensure keys/hashes are present and deterministic
-                if not norm.job_key or not norm.job_hash:
-                    k, h = compute_keys(norm.dict())
-                    norm.job_key = k
-                    norm.job_hash = h
-                if DEBUG_DEDUPE:
-                    logger.info(
-                        "DEDUPE_DEBUG source=%s key=%s url=%s canonical=%s",
-                        name,
-                        norm.job_key,
-                        norm.url,
-                        canonical_url(norm.url),
-                    )
-                payload = norm.dict()
-                if payload.get("source_meta") is not None:
-                    payload["source_meta"] = json.dumps(payload["source_meta"])
-                payload["last_seen_at"] = datetime.now(timezone.utc)
-                payload["updated_at"] = datetime.now(timezone.utc)
-                try:
-                    new_job = Job(**payload)
-                    self.db.add(new_job)
-                    self.db.flush()
-                    inserted_count += 1
-                except IntegrityError:
-                    # Already exists: update last_seen and, if fingerprint changed, fields.
-                    self.db.rollback()
-                    existing = self.db.query(Job).filter(Job.job_key == norm.job_key).first()
-                    if existing:
-                        if existing.job_fingerprint != norm.job_fingerprint:
-                            existing.title = norm.title
-                            existing.company = norm.company
-                            existing.location = norm.location
-                            existing.description = norm.description
-                            existing.source_meta = json.dumps(norm.source_meta) if norm.source_meta else None
-                            existing.relevance_score = norm.relevance_score
-                            existing.updated_at = datetime.now(timezone.utc)
-                            existing.last_seen_at = datetime.now(timezone.utc)
-                            updated_jobs += 1
-                            self.metrics.source[name]["jobs_updated_count"] += 1
-                        else:
-                            existing.last_seen_at = datetime.now(timezone.utc)
-                        dedup_count += 1
-                except Exception as exc:
-                    self.db.rollback()
-                    self.metrics.source[name]["errors"].append(str(exc))
+            normalized_total = 0
+            if pending:
+                await self._await_scorer(name)
+            for start in range(0, len(pending), self.batch_size):
+                batch = pending[start : start + self.batch_size]
+                normalized_payloads = await self._normalize_batch(name, batch, cursor_info)
+                normalized_total += len(normalized_payloads)
+                inserted, deduped, updated = self._upsert_batch(name, normalized_payloads)
+                self._score_profiles(normalized_payloads)
+                inserted_count += inserted
+                dedup_count += deduped
+                updated_jobs += updated
+                checkpoint["batches_committed"] += 1
+                checkpoint["items_committed"] = skipped + start + len(batch)
+                checkpoint["cursor"] = {k: v for k, v in cursor_info.items() if k != "http_cache"}
+                self._save_checkpoint(state, checkpoint)
+                self._report(name, "batch", checkpoint)
+            self.metrics.source[name]["jobs_normalized_count"] = normalized_total
+            self._record_pass_rates(name)
 
-            if inserted_count:
-                self.metrics.source[name]["jobs_inserted_count"] += inserted_count
-            self.metrics.source[name]["jobs_deduped_count"] += dedup_count
-            total_considered = len(normalized_payloads) or 1
+            total_considered = normalized_total or 1
             seen_ratio = dedup_count / total_considered
             if seen_ratio >= STOP_ON_SEEN_RATIO:
                 marker = f"stop_on_seen_ratio_triggered:{seen_ratio:.2f}"
@@ -175,13 +220,18 @@ class EngineV2:
                 if os.getenv("CRAWL_TEST_DEBUG") == "1":
                     logger.info("CRAWL_DEBUG %s %s", name, marker)
             self.db.commit()
+            bump_data_version(self.db)
             self._store_cursor(state, cursor_info)
+            checkpoint["status"] = "done"
+            checkpoint["metrics"] = self.metrics.source[name]
+            set_checkpoint(state, _stamp(checkpoint))
             update_state_success(self.db, state, cursor=cursor_info)
+            self._report(name, "done", checkpoint)
             logger.info(
                 "Crawl source %s: parsed=%d normalized=%d new=%d dedup=%d updated=%d errors=%d seen_ratio=%.2f",
                 name,
                 len(parsed_jobs),
-                len(normalized_payloads),
+                normalized_total,
                 inserted_count,
                 dedup_count,
                 updated_jobs,
@@ -190,13 +240,286 @@ class EngineV2:
             )
         except Exception as exc:
             self.db.rollback()
+            checkpoint["status"] = "failed"
+            set_checkpoint(state, _stamp(checkpoint))
             cooldown_minutes = self._classify_and_cooldown(exc, state)
             suffix = f" (cooldown {cooldown_minutes}m)" if cooldown_minutes else ""
             self.metrics.source[name]["errors"].append(f"{type(exc).__name__}: {exc}{suffix}")
+            self._report(name, "failed", checkpoint)
+
+    def _report(self, name: str, stage: str, checkpoint: dict) -> None:
+        if self.progress is None:
+            return
+        metrics = self.metrics.source[name]
+        counts = {key: metrics[key] for key in PROGRESS_COUNTS}
+        counts["batches_committed"] = checkpoint.get("batches_committed", 0)
+        counts["items_committed"] = checkpoint.get("items_committed", 0)
+        if metrics["errors"]:
+            counts["errors"] = list(metrics["errors"])
+        try:
+            self.progress(name, stage, counts)
+        except Exception as exc:  # progress is best effort; never fail the crawl for it
+            logger.warning("Crawl progress callback failed: %s", exc)
+
+    async def _await_scorer(self, name: str) -> None:
+        """Wait (without blocking other sources) for the background model load."""
+        started = time.perf_counter()
+        try:
+            self.nlp_scorer, load_ms = await asyncio.wrap_future(self._scorer_future)
+        except Exception as exc:
+            logger.error("NLP scorer failed to load; continuing without it: %s", exc)
+            self.nlp_scorer, load_ms = None, None
+        self.metrics.source[name]["nlp_load_ms"] = round(load_ms, 1) if load_ms is not None else None
+        self.metrics.source[name]["nlp_wait_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        if self.nlp_scorer and self.profile_matrix is None:
+            try:
+                self.profile_matrix = load_profile_matrix(self.db, self.nlp_scorer)
+            except Exception as exc:
+                self.db.rollback()
+                logger.error("Failed to load scoring profiles: %s", exc)
+                self.profile_matrix = ProfileMatrix([], np.zeros((0, 0), dtype=np.float32))
+        if self.nlp_scorer and self.scoring is None:
+            self.scoring = ScoringCoordinator(
+                self.nlp_scorer,
+                flush_size=settings.NLP_SCORING_FLUSH_SIZE,
+                max_wait_ms=settings.NLP_SCORING_MAX_WAIT_MS,
+                batch_size=settings.NLP_BATCH_SIZE,
+                profile_matrix=self.profile_matrix.matrix if self.profile_matrix else None,
+            )
+
+    def _score_profiles(self, records: List[JobRecord]) -> None:
+        """Store named-profile scores for the stored records that reached the model.
+
+        The scores come back from the coordinator with the main score (one
+        encode per group); copies of a group scored in an earlier crawl take
+        the representative's stored rows. Prefilter rejects get none.
+        """
+        if not self.profile_matrix:
+            return
+        job_keys, scores, copies = [], [], []
+        for norm in records:
+            group_id = self._profile_groups.pop(norm.job_key, None)
+            if group_id is None:
+                continue
+            if group_id in self._group_profile_scores:
+                job_keys.append(norm.job_key)
+                scores.append(self._group_profile_scores[group_id])
+            elif group_id != norm.job_key:
+                copies.append((norm.job_key, group_id))
+        if job_keys:
+            write_profile_scores(self.db, self.profile_matrix, job_keys, np.stack(scores))
+        copy_profile_scores(self.db, copies)
+
+    def _passes_prefilter(self, norm: JobRecord) -> bool:
+        """Cascade stage 1: keyword (and optionally location) match, no model call.
+
+        Sets the keyword part of the score; a rejected record scores 0.
+        """
+        stage = self.relevance.keyword_stage(norm.title, norm.description, norm.location, norm.remote)
+        if self.relevance.keyword_matcher is not None:
+            norm.relevance_score = stage.score
+            norm.keywords_matched = ", ".join(stage.matched)
+        return stage.passed
+
+    async def _normalize_batch(self, name: str, batch: List[JobRecord], cursor_info: dict) -> List[JobRecord]:
+        """Score and group records in place (identity was computed at parse time).
+
+        Records failing the keyword prefilter are never sent to the model.
+        One representative per new near-duplicate group is queued on the
+        engine-wide scoring coordinator; other members, from any source,
+        reuse that group's semantic score instead of being scored again, while
+        keyword points always come from each record's own text. Only records
+        scoring at least ``min_store_score`` are returned for storing.
+        """
+        metrics = self.metrics.source[name]
+        normalized_payloads = []
+        near_index = self._get_near_index()
+        waiting: List[tuple[JobRecord, asyncio.Future]] = []
+        new_groups: Dict[str, tuple[JobRecord, asyncio.Future]] = {}
+        for norm in batch:
+            self._update_last_seen(cursor_info, norm)
+            metrics["jobs_prefilter_checked_count"] += 1
+            candidate = self._passes_prefilter(norm)
+            metrics["jobs_prefilter_passed_count"] += int(candidate)
+            norm.lsh_bands = lsh_bands(norm.title, norm.company, norm.description)
+            group_id = near_index.lookup(norm.lsh_bands)
+            group_score = near_index.group_score(group_id)
+            if not candidate or self.scoring is None:
+                pass  # keyword points only, like any job scored without the model
+            elif group_score is not None:
+                # cross-posted copy of a job we already scored: skip the model
+                norm.semantic_score = group_score
+                norm.relevance_score = self.relevance.combine(norm.relevance_score, group_score)
+                metrics["jobs_near_duplicate_count"] += 1
+            elif group_id in self._group_futures:
+                waiting.append((norm, self._group_futures[group_id]))
+                metrics["jobs_near_duplicate_count"] += 1
+            else:
+                group_id = group_id or norm.job_key
+                future = self.scoring.submit(f"{norm.title} {norm.description}")
+                self._group_futures[group_id] = future
+                new_groups[group_id] = (norm, future)
+                waiting.append((norm, future))
+            norm.duplicate_group_id = near_index.assign(norm.lsh_bands, group_id or norm.job_key)
+            if candidate and self.scoring:
+                self._profile_groups[norm.job_key] = norm.duplicate_group_id
+            normalized_payloads.append(norm)
+        if waiting:
+            await self._collect_scores(name, waiting, new_groups, near_index)
+        if self.min_store_score is not None:
+            normalized_payloads = [n for n in normalized_payloads if n.relevance_score >= self.min_store_score]
+        metrics["jobs_above_threshold_count"] += len(normalized_payloads)
+        metrics["jobs_insert_attempted_count"] += len(normalized_payloads)
+        return normalized_payloads
+
+    async def _collect_scores(
+        self,
+        name: str,
+        waiting: List[tuple[JobRecord, asyncio.Future]],
+        new_groups: Dict[str, tuple[JobRecord, asyncio.Future]],
+        near_index: NearDuplicateIndex,
+    ) -> None:
+        await asyncio.gather(*{id(f): f for _, f in waiting}.values(), return_exceptions=True)
+        for norm, future in waiting:
+            if future.exception() is None:
+                norm.semantic_score = future.result().score
+                norm.relevance_score = self.relevance.combine(norm.relevance_score, norm.semantic_score)
+        for group_id, (norm, future) in new_groups.items():
+            self._group_futures.pop(group_id, None)
+            if future.exception() is not None:
+                self.metrics.source[name]["errors"].append(str(future.exception()))
+                continue
+            if future.result().profile_scores is not None:
+                self._group_profile_scores[group_id] = future.result().profile_scores
+            near_index.set_score(group_id, future.result().score)
+            self.metrics.source[name]["jobs_scored_count"] += 1
+            self.metrics.source[name]["matched_count"] += 1
+
+    def _record_pass_rates(self, name: str) -> None:
+        """Share of jobs surviving each cascade stage (prefilter -> model -> store)."""
+        metrics = self.metrics.source[name]
+        checked = metrics["jobs_prefilter_checked_count"]
+        passed = metrics["jobs_prefilter_passed_count"]
+        metrics["stage_pass_rates"] = {
+            "prefilter": round(passed / checked, 4) if checked else None,
+            "model": round(metrics["jobs_scored_count"] / passed, 4) if passed else None,
+            "store": round(metrics["jobs_above_threshold_count"] / checked, 4) if checked else None,
+        }
+
+    def _upsert_batch(self, name: str, normalized_payloads: List[JobRecord]) -> tuple[int, int, int]:
+        """Insert/update one batch; returns (inserted, deduped, updated).
+
+        The known-key index decides insert vs update without a SQL lookup;
+        IntegrityError remains the safety net for index misses/races.
+        """
+        key_index = self._get_key_index()
+        updated_jobs = 0
+        dedup_count = 0
+        inserted_count = 0
+        unchanged_keys: List[str] = []
+        for norm in normalized_payloads:
+            if DEBUG_DEDUPE:
+                logger.info(
+                    "DEDUPE_DEBUG source=%s key=%s url=%s canonical=%s",
+                    name,
+                    norm.job_key,
+                    norm.url,
+                    canonical_url(norm.url),
+                )
+            if key_index.contains(norm.job_key):
+                if key_index.is_unchanged(norm.job_key, norm.job_fingerprint):
+                    unchanged_keys.append(norm.job_key)
+                    dedup_count += 1
+                    continue
+                changed = self._update_existing(name, norm)
+                if changed is not None:
+                    key_index.add(norm.job_key, norm.job_fingerprint)
+                    updated_jobs += int(changed)
+                    dedup_count += 1
+                    continue
+            payload = norm.to_row()
+            payload["last_seen_at"] = datetime.now(timezone.utc)
+            payload["updated_at"] = datetime.now(timezone.utc)
+            try:
+                with self.db.begin_nested():
+                    self.db.add(Job(**payload))
+                inserted_count += 1
+                key_index.add(norm.job_key, norm.job_fingerprint)
+            except IntegrityError:
+                # Row exists but the index did not know it (e.g. concurrent writer).
+                updated_jobs += int(bool(self._update_existing(name, norm)))
+                key_index.add(norm.job_key, norm.job_fingerprint)
+                dedup_count += 1
+            except Exception as exc:
+                self.metrics.source[name]["errors"].append(str(exc))
+        self._touch_last_seen(unchanged_keys)
+
+        self.metrics.source[name]["jobs_inserted_count"] += inserted_count
+        self.metrics.source[name]["jobs_deduped_count"] += dedup_count
+        return inserted_count, dedup_count, updated_jobs
+
+    def _save_checkpoint(self, state, checkpoint: dict):
+        """Persist progress together with the rows committed so far."""
+        _stamp(checkpoint)
+        set_checkpoint(state, checkpoint)
+        self.db.add(state)
+        self.db.commit()
+        bump_data_version(self.db)
+        flush_embedding_cache(self.nlp_scorer)
 
     async def close(self):
         await self.fetcher.close()
 
+    def _keys_committed_this_run(self) -> set[str]:
+        """Keys of jobs stored or touched since this run started (for resuming)."""
+        run = self.db.query(CrawlRun).filter(CrawlRun.run_id == self.run_id).first()
+        if run is None or run.started_at is None:
+            return set()
+        return {key for (key,) in self.db.query(Job.job_key).filter(Job.last_seen_at >= run.started_at)}
+
+    def _get_key_index(self) -> KnownKeyIndex:
+        """Load the known-key index once per engine (i.e. once per run)."""
+        if self.key_index is None:
+            self.key_index = KnownKeyIndex.load(self.db)
+        return self.key_index
+
+    def _get_near_index(self) -> NearDuplicateIndex:
+        if self.near_index is None:
+            self.near_index = NearDuplicateIndex.load(self.db, settings.NEAR_DUP_WINDOW_DAYS)
+        return self.near_index
+
+    def _update_existing(self, name: str, norm) -> bool | None:
+        """Refresh a stored row; returns None if missing, True if its content changed."""
+        existing = self.db.query(Job).filter(Job.job_key == norm.job_key).first()
+        if not existing:
+            return None
+        changed = existing.job_fingerprint != norm.job_fingerprint
+        now = datetime.now(timezone.utc)
+        if changed:
+            existing.title = norm.title
+            existing.company = norm.company
+            existing.location = norm.location
+            existing.description = norm.description
+            existing.source_meta = json.dumps(norm.source_meta) if norm.source_meta else None
+            existing.relevance_score = norm.relevance_score
+            existing.semantic_score = norm.semantic_score
+            existing.job_fingerprint = norm.job_fingerprint
+            existing.lsh_bands = norm.lsh_bands
+            existing.duplicate_group_id = norm.duplicate_group_id
+            existing.updated_at = now
+            self.metrics.source[name]["jobs_updated_count"] += 1
+        existing.last_seen_at = now
+        return changed
+
+    def _touch_last_seen(self, job_keys: List[str], chunk_size: int = 500):
+        """Bulk-bump last_seen_at for rows seen again with identical content."""
+        now = datetime.now(timezone.utc)
+        for i in range(0, len(job_keys), chunk_size):
+            chunk = job_keys[i : i + chunk_size]
+            self.db.query(Job).filter(Job.job_key.in_(chunk)).update(
+                {Job.last_seen_at: now}, synchronize_session=False
+            )
+
     def _compute_since(self, cursor: dict) -> datetime:
         now = datetime.now(timezone.utc)
         lookback = now - timedelta(days=settings.CRAWL_LOOKBACK_DAYS)
@@ -213,7 +536,7 @@ class EngineV2:
             return max(lookback, last_seen)
         return lookback
 
-    def _update_last_seen(self, cursor: dict, raw: RawJob):
+    def _update_last_seen(self, cursor: dict, raw: JobRecord):
         post_date = getattr(raw, "post_date", None)
         if not post_date:
             return
@@ -279,6 +602,12 @@ def run_engine_v2(
     source_functions: Dict[str, callable],
     ignore_cooldown: bool = False,
     session_maker: sessionmaker | None = None,
+    run_id: str | None = None,
+    resume: bool = False,
+    keywords: List[str] | None = None,
+    locations: List[str] | None = None,
+    min_store_score: float | None = None,
+    progress: Callable[[str, str, dict], None] | None = None,
 ):
     result_holder = {}
 
@@ -286,7 +615,16 @@ def run_engine_v2(
         local_session = (session_maker or SessionLocal)()
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
-        engine = EngineV2(local_session, ignore_cooldown=ignore_cooldown)
+        engine = EngineV2(
+            local_session,
+            ignore_cooldown=ignore_cooldown,
+            run_id=run_id,
+            resume=resume,
+            keywords=keywords,
+            locations=locations,
+            min_store_score=min_store_score,
+            progress=progress,
+        )
         try:
             loop.run_until_complete(engine.run_sources(source_functions, sources_enabled))
             result_holder["metrics"] = engine.metrics.to_json()
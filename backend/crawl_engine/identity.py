@@ -0,0 +1,111 @@
+"""Single-pass job identity: canonical URL, job_key and content fingerprint.
+
+Every crawled item needs all three, so they are computed together here
+instead of in ``Job.generate_key``/``generate_hash``, ``canonical_url`` and
+``fingerprint`` separately. URL canonicalization is memoized because the
+same URLs reappear on every run of a long-lived process.
+"""
+from __future__ import annotations
+
+import hashlib
+from functools import lru_cache
+from typing import NamedTuple
+from urllib.parse import parse_qsl, urlparse, urlunparse
+
+CANONICAL_URL_CACHE_SIZE = 32768
+
+
+@lru_cache(maxsize=CANONICAL_URL_CACHE_SIZE)
+def canonical_url(url: str) -> str:
+    if not url:
+        return ""
+    parsed = urlparse(url.strip())
+    # drop common tracking params, keep id-like params
+    query_items = []
+    for k, v in parse_qsl(parsed.query, keep_blank_values=True):
+        if k.lower().startswith("utm_"):
+            continue
+        query_items.append((k, v))
+    normalized_query = "&".join(f"{k}={v}" for k, v in query_items)
+    normalized = parsed._replace(fragment="", query=normalized_query)
+    normalized_url = urlunparse(normalized).rstrip("/")
+    return normalized_url.lower()
+
+
+def key_from_canonical(
+    canonical: str,
+    title: str | None,
+    company: str | None,
+    source: str | None = None,
+    post_date: str | None = None,
+    location: str | None = None,
+) -> str:
+    if canonical:
+        content = f"{source or ''}|{canonical}".lower()
+        return hashlib.sha256(content.encode()).hexdigest()
+    # fallback when URL missing
+    parts = [
+        (source or "").strip().lower(),
+        (title or "").strip().lower(),
+        (company or "").strip().lower(),
+        (location or "").strip().lower(),
+        (post_date or "").strip().lower(),
+    ]
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+def content_fingerprint(
+    title: str | None,
+    company: str | None,
+    location: str | None,
+    description: str | None,
+) -> str:
+    content = "|".join(
+        [
+            (title or "").strip().lower(),
+            (company or "").strip().lower(),
+            (location or "").strip().lower(),
+            (description or "")[:200].strip().lower(),
+        ]
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class JobIdentity(NamedTuple):
+    canonical_url: str
+    job_key: str
+    fingerprint: str
+
+    @property
+    def job_hash(self) -> str:
+        # job_hash is kept for compatibility and equals job_key
+        return self.job_key
+
+
+def compute_identity(
+    title: str | None,
+    company: str | None,
+    url: str | None,
+    source: str | None = None,
+    post_date: str | None = None,
+    location: str | None = None,
+    description: str | None = None,
+) -> JobIdentity:
+    canonical = canonical_url(url or "")
+    return JobIdentity(
+        canonical_url=canonical,
+        job_key=key_from_canonical(canonical, title, company, source, post_date, location),
+        fingerprint=content_fingerprint(title, company, location, description),
+    )
+
+
+def identity_from_payload(payload: dict) -> JobIdentity:
+    return compute_identity(
+        payload.get("title"),
+        payload.get("company"),
+        payload.get("url"),
+        payload.get("source"),
+        payload.get("post_date"),
+        payload.get("location"),
+        payload.get("description"),
+    )
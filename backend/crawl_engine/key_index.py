@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import hashlib
+import math
+from typing import Iterable, Tuple
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+_MASK64 = (1 << 64) - 1
+_PAIR_MIX = 0x9E3779B97F4A7C15
+_LOAD_CHUNK = 65536
+
+
+def hash64(value: str) -> int:
+    """Stable 64-bit digest used for compact key storage."""
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+def _pair64(key64: int, fp64: int) -> int:
+    return ((key64 * _PAIR_MIX) & _MASK64) ^ fp64
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 64-bit digests (double hashing)."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(1, capacity)
+        self.num_bits = max(64, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, value: int) -> Iterable[int]:
+        h1 = value & 0xFFFFFFFF
+        h2 = (value >> 32) | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, value: int) -> None:
+        for pos in self._positions(value):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def add_many(self, values: np.ndarray) -> None:
+        """Vectorized bulk insert used when loading the index."""
+        values = np.asarray(values, dtype=np.uint64)
+        if not len(values):
+            return
+        view = np.frombuffer(self.bits, dtype=np.uint8)
+        h1 = values & np.uint64(0xFFFFFFFF)
+        h2 = (values >> np.uint64(32)) | np.uint64(1)
+        for i in range(self.num_hashes):
+            pos = (h1 + np.uint64(i) * h2) % np.uint64(self.num_bits)
+            byte_idx = (pos >> np.uint64(3)).astype(np.intp)
+            bit_mask = (np.uint64(1) << (pos & np.uint64(7))).astype(np.uint8)
+            np.bitwise_or.at(view, byte_idx, bit_mask)
+
+    def __contains__(self, value: int) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+
+class _Uint64Builder:
+    """Collect uint64 values in fixed-size numpy chunks (8 bytes per value, no Python ints kept)."""
+
+    def __init__(self, chunk_size: int | None = None):
+        self._chunks: list[np.ndarray] = []
+        self._current = np.empty(chunk_size or _LOAD_CHUNK, dtype=np.uint64)
+        self._filled = 0
+
+    def append(self, value: int) -> None:
+        if self._filled == len(self._current):
+            self._chunks.append(self._current)
+            self._current = np.empty(len(self._current), dtype=np.uint64)
+            self._filled = 0
+        self._current[self._filled] = value
+        self._filled += 1
+
+    def sorted_unique(self) -> np.ndarray:
+        values = np.concatenate(self._chunks + [self._current[: self._filled]])
+        self._chunks = []
+        values.sort()
+        if len(values) > 1:
+            values = values[np.concatenate(([True], values[1:] != values[:-1]))]
+        return values
+
+
+class KnownKeyIndex:
+    """In-memory index of stored job_keys and (job_key, fingerprint) pairs.
+
+    Keys loaded from the DB live in sorted uint64 arrays (8 bytes per row);
+    keys added during the run go to small Python sets. A Bloom filter in
+    front answers the common "new job" case without touching either.
+    """
+
+    def __init__(self, rows: Iterable[Tuple[str, str | None]] = (), expected: int = 0):
+        keys = _Uint64Builder()
+        pairs = _Uint64Builder()
+        for job_key, fingerprint in rows:
+            if not job_key:
+                continue
+            k = hash64(job_key)
+            keys.append(k)
+            if fingerprint:
+                pairs.append(_pair64(k, hash64(fingerprint)))
+        self._keys = keys.sorted_unique()
+        self._pairs = pairs.sorted_unique()
+        self._added_keys: set[int] = set()
+        self._added_pairs: set[int] = set()
+        # leave headroom for rows inserted while the index is alive
+        self._bloom = BloomFilter(max(expected, len(self._keys)) * 2 + 1024)
+        self._bloom.add_many(self._keys)
+
+    @classmethod
+    def load(cls, db: Session, batch_size: int = 10000) -> "KnownKeyIndex":
+        """Build the index with one streaming scan of the jobs table."""
+        result = db.execute(text("SELECT job_key, job_fingerprint FROM jobs")).yield_per(batch_size)
+        return cls(((row[0], row[1]) for row in result))
+
+    def __len__(self) -> int:
+        return len(self._keys) + len(self._added_keys)
+
+    @staticmethod
+    def _in_sorted(arr: np.ndarray, value: int) -> bool:
+        if not len(arr):
+            return False
+        pos = int(np.searchsorted(arr, np.uint64(value)))
+        return pos < len(arr) and int(arr[pos]) == value
+
+    def contains(self, job_key: str | None) -> bool:
+        """Return True if a row with this job_key is already stored."""
+        if not job_key:
+            return False
+        k = hash64(job_key)
+        if k not in self._bloom:
+            return False
+        return k in self._added_keys or self._in_sorted(self._keys, k)
+
+    def is_unchanged(self, job_key: str | None, fingerprint: str | None) -> bool:
+        """Return True if the stored row for job_key has this exact fingerprint."""
+        if not job_key or not fingerprint or not self.contains(job_key):
+            return False
+        p = _pair64(hash64(job_key), hash64(fingerprint))
+        return p in self._added_pairs or self._in_sorted(self._pairs, p)
+
+    def add(self, job_key: str | None, fingerprint: str | None = None) -> None:
+        """Record a newly inserted (or updated) row."""
+        if not job_key:
+            return
+        k = hash64(job_key)
+        self._bloom.add(k)
+        self._added_keys.add(k)
+        if fingerprint:
+            self._added_pairs.add(_pair64(k, hash64(fingerprint)))
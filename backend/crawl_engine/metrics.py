@@ -11,13 +11,19 @@ class Metrics:
             "http_status_counts": {},
             "jobs_parsed_count": 0,
             "jobs_normalized_count": 0,
+            "jobs_prefilter_checked_count": 0,
+            "jobs_prefilter_passed_count": 0,
             "jobs_scored_count": 0,
             "jobs_above_threshold_count": 0,
             "jobs_insert_attempted_count": 0,
             "jobs_inserted_count": 0,
             "jobs_updated_count": 0,
             "jobs_deduped_count": 0,
+            "jobs_near_duplicate_count": 0,
             "matched_count": 0,
+            "stage_pass_rates": {},
+            "nlp_load_ms": None,
+            "nlp_wait_ms": 0.0,
             "not_modified": False,
             "errors": [],
             "latencies_ms": [],
@@ -0,0 +1,129 @@
+"""MinHash/LSH near-duplicate detection across sources.
+
+The same posting often arrives from several boards with different URLs, so
+``job_key`` (URL based) cannot collapse them. Each job gets a MinHash
+signature over word shingles of its normalized title, company and
+description; the signature is cut into bands and any band collision with an
+earlier job puts both into the same ``duplicate_group_id``. Lookups are a
+handful of dict probes per job regardless of table size.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+NUM_PERM = 64
+BANDS = 8
+ROWS = NUM_PERM // BANDS  # collision likely above ~0.77 Jaccard similarity
+SHINGLE_SIZE = 3
+MAX_TEXT_CHARS = 6000
+
+_PRIME = np.uint64((1 << 61) - 1)
+_rng = np.random.default_rng(0x6A6F62)
+# a, b < 2**32 and shingle hashes < 2**32 keep a * x + b inside uint64
+_A = _rng.integers(1, 2**32, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, 2**32, size=NUM_PERM, dtype=np.uint64)
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def shingles(title: str | None, company: str | None, description: str | None) -> set[int]:
+    body = _TAG_RE.sub(" ", (description or "")[:MAX_TEXT_CHARS])
+    tokens = _WORD_RE.findall(f"{title or ''} {company or ''} {body}".lower())
+    if not tokens:
+        return set()
+    if len(tokens) < SHINGLE_SIZE:
+        return {zlib.crc32(" ".join(tokens).encode())}
+    return {
+        zlib.crc32(" ".join(tokens[i : i + SHINGLE_SIZE]).encode())
+        for i in range(len(tokens) - SHINGLE_SIZE + 1)
+    }
+
+
+def minhash(shingle_set: set[int]) -> np.ndarray:
+    if not shingle_set:
+        return np.full(NUM_PERM, _PRIME, dtype=np.uint64)
+    x = np.fromiter(shingle_set, dtype=np.uint64, count=len(shingle_set))
+    return ((x[:, None] * _A + _B) % _PRIME).min(axis=0)
+
+
+def band_hashes(signature: np.ndarray) -> List[str]:
+    return [
+        hashlib.blake2b(signature[b * ROWS : (b + 1) * ROWS].tobytes(), digest_size=8).hexdigest()
+        for b in range(BANDS)
+    ]
+
+
+def lsh_bands(title: str | None, company: str | None, description: str | None) -> Optional[str]:
+    """Space-separated band hashes for a job, or None if it has no text."""
+    shingle_set = shingles(title, company, description)
+    if not shingle_set:
+        return None
+    return " ".join(band_hashes(minhash(shingle_set)))
+
+
+class NearDuplicateIndex:
+    """Band-bucket lookup from LSH bands to duplicate group ids."""
+
+    def __init__(self):
+        self._buckets: List[Dict[str, str]] = [{} for _ in range(BANDS)]
+        self._scores: Dict[str, float] = {}
+
+    @classmethod
+    def load(cls, db: Session, window_days: int = 30) -> "NearDuplicateIndex":
+        """Index recently seen jobs; cross-posted copies arrive close together."""
+        index = cls()
+        since = datetime.now(timezone.utc) - timedelta(days=window_days)
+        rows = db.execute(
+            text(
+                "SELECT COALESCE(duplicate_group_id, job_key), lsh_bands, semantic_score FROM jobs "
+                "WHERE lsh_bands IS NOT NULL AND COALESCE(last_seen_at, created_at) >= :since"
+            ),
+            {"since": since.strftime("%Y-%m-%d %H:%M:%S")},
+        ).yield_per(10000)
+        for group_id, bands, score in rows:
+            index.add(bands, group_id, score)
+        return index
+
+    def lookup(self, bands: str | None) -> Optional[str]:
+        if not bands:
+            return None
+        for i, bucket in enumerate(bands.split()):
+            group_id = self._buckets[i].get(bucket)
+            if group_id:
+                return group_id
+        return None
+
+    def add(self, bands: str | None, group_id: str, score: float | None = None) -> None:
+        if not bands or not group_id:
+            return
+        for i, bucket in enumerate(bands.split()):
+            self._buckets[i].setdefault(bucket, group_id)
+        if score is not None:
+            self._scores.setdefault(group_id, score)
+
+    def assign(self, bands: str | None, default_group: str, score: float | None = None) -> str:
+        """Return the matching group id (or default_group) and index the job."""
+        group_id = self.lookup(bands) or default_group
+        self.add(bands, group_id, score)
+        return group_id
+
+    def set_score(self, group_id: str, score: float) -> None:
+        """Record a score computed after the group was assigned."""
+        self._scores.setdefault(group_id, score)
+
+    def group_score(self, group_id: str | None) -> Optional[float]:
+        """Semantic score already computed for a group member, if any.
+
+        Only the model part is shared: keyword points depend on each copy's
+        own text and are computed per record.
+        """
+        return self._scores.get(group_id) if group_id else None
@@ -1,42 +1,31 @@
 from __future__ import annotations
 
-import hashlib
-from urllib.parse import urlparse, parse_qsl, urlunparse
-
+from .identity import JobIdentity, canonical_url, content_fingerprint, compute_identity
 from .types import NormalizedJob, RawJob
 
 
-def canonical_url(url: str) -> str:
-    parsed = urlparse(url.strip())
-    query_items = []
-    for k, v in parse_qsl(parsed.query, keep_blank_values=True):
-        if k.lower().startswith("utm_"):
-            continue
-        query_items.append((k, v))
-    normalized_query = "&".join(f"{k}={v}" for k, v in query_items)
-    normalized = parsed._replace(fragment="", query=normalized_query)
-    normalized_url = urlunparse(normalized).rstrip("/")
-    return normalized_url.lower()
+def fingerprint(raw: RawJob) -> str:
+    return content_fingerprint(raw.title, raw.company, raw.location, raw.description)
 
 
-def fingerprint(raw: RawJob) -> str:
-    content = "|".join(
-        [
-            raw.title.strip().lower(),
-            (raw.company or "").strip().lower(),
-            (raw.location or "").strip().lower(),
-            (raw.description or "")[:200].strip().lower(),
-        ]
+def raw_identity(raw: RawJob) -> JobIdentity:
+    return compute_identity(
+        raw.title, raw.company, raw.url, raw.source, raw.post_date, raw.location, raw.description
     )
-    return hashlib.sha256(content.encode()).hexdigest()
 
 
-def build_normalized(raw: RawJob, job_hash: str, job_key: str) -> NormalizedJob:
+def build_normalized(
+    raw: RawJob,
+    job_hash: str | None = None,
+    job_key: str | None = None,
+    identity: JobIdentity | None = None,
+) -> NormalizedJob:
+    identity = identity or raw_identity(raw)
     return NormalizedJob(
         title=raw.title or "Untitled",
         company=raw.company or "Unknown",
         location=raw.location or "Remote",
-        url=canonical_url(raw.url),
+        url=identity.canonical_url,
         description=raw.description or raw.title,
         post_date=raw.post_date,
         source=raw.source,
@@ -44,7 +33,7 @@ def build_normalized(raw: RawJob, job_hash: str, job_key: str) -> NormalizedJob:
         remote=raw.remote,
         relevance_score=0.0,
         keywords_matched=None,
-        job_hash=job_hash,
-        job_key=job_key,
-        job_fingerprint=fingerprint(raw),
+        job_hash=job_hash or identity.job_hash,
+        job_key=job_key or identity.job_key,
+        job_fingerprint=identity.fingerprint,
     )
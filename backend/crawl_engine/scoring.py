@@ -0,0 +1,91 @@
+"""Cross-source micro-batching for semantic scoring.
+
+Sources run concurrently in ``EngineV2`` and each produces a handful of
+texts per commit batch. ``ScoringCoordinator`` queues texts from all of
+them and calls ``score_many`` once the queue holds ``flush_size`` texts or
+the oldest text has waited ``max_wait_ms``, so the model sees full batches
+and each caller awaits only its own futures. With a ``profile_matrix``
+each text is embedded once and scored against the main profile and every
+named profile from the same vector.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class Scored(NamedTuple):
+    score: float
+    profile_scores: Optional[np.ndarray]  # one per named profile, if any
+
+
+_Pending = Tuple[str, "asyncio.Future[Scored]"]
+
+
+class ScoringCoordinator:
+    def __init__(
+        self,
+        scorer,
+        flush_size: int = 128,
+        max_wait_ms: float = 25.0,
+        batch_size: int | None = None,
+        profile_matrix: np.ndarray | None = None,
+    ):
+        self.scorer = scorer
+        self.profile_matrix = profile_matrix  # (dim, n_profiles)
+        self.flush_size = max(1, flush_size)
+        self.max_wait = max_wait_ms / 1000
+        self.batch_size = batch_size
+        self.batch_sizes: List[int] = []
+        self._pending: List[_Pending] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task] = set()
+
+    def submit(self, text: str) -> "asyncio.Future[Scored]":
+        """Queue one text; the future resolves to its scores."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+        if len(self._pending) >= self.flush_size:
+            self._flush(full_only=True)
+        if self._pending and self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return future
+
+    async def score_many(self, texts: Sequence[str]) -> List[float]:
+        futures = [self.submit(text) for text in texts]
+        return [scored.score for scored in await asyncio.gather(*futures)]
+
+    def _flush(self, full_only: bool = False) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending and (len(self._pending) >= self.flush_size or not full_only):
+            batch, self._pending = self._pending[: self.flush_size], self._pending[self.flush_size :]
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[_Pending]) -> None:
+        # one model call at a time; texts queued meanwhile form the next batch
+        async with self._lock:
+            self.batch_sizes.append(len(batch))
+            try:
+                scores, profile_scores = await asyncio.to_thread(self._score, [text for text, _ in batch])
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                return
+        for i, (_, future) in enumerate(batch):
+            if not future.done():
+                future.set_result(Scored(float(scores[i]), None if profile_scores is None else profile_scores[i]))
+
+    def _score(self, texts: List[str]):
+        if self.profile_matrix is None:
+            return self.scorer.score_many(texts, batch_size=self.batch_size), None
+        vectors = self.scorer.embed_many(texts, batch_size=self.batch_size)
+        return self.scorer.score_embeddings(vectors), np.clip(vectors @ self.profile_matrix, 0.0, None)
@@ -1,5 +1,5 @@
 import json
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime, text
 from sqlalchemy.orm import declarative_base, Session
 from datetime import datetime, timedelta
 
@@ -14,10 +14,15 @@ class SourceState(StateBase):
     last_success_at = Column(DateTime(timezone=True), nullable=True)
     consecutive_failures = Column(Integer, default=0)
     cooldown_until = Column(DateTime(timezone=True), nullable=True)
+    checkpoint_json = Column(Text, nullable=True)
 
 
 def ensure_state_table(engine):
     StateBase.metadata.create_all(bind=engine)
+    with engine.connect() as conn:
+        columns = {row[1] for row in conn.execute(text("PRAGMA table_info(source_state)"))}
+        if "checkpoint_json" not in columns:
+            conn.execute(text("ALTER TABLE source_state ADD COLUMN checkpoint_json TEXT"))
 
 
 def load_state(db: Session, source_id: str) -> SourceState:
@@ -62,3 +67,18 @@ def get_cursor(state: SourceState) -> dict:
 
 def set_cursor(state: SourceState, cursor: dict):
     state.cursor_json = json.dumps(cursor)
+
+
+def get_checkpoint(state: SourceState, run_id: str | None = None) -> dict:
+    """Return the stored checkpoint, or {} if it belongs to another run."""
+    try:
+        checkpoint = json.loads(state.checkpoint_json) if state.checkpoint_json else {}
+    except Exception:
+        return {}
+    if run_id is not None and checkpoint.get("run_id") != run_id:
+        return {}
+    return checkpoint
+
+
+def set_checkpoint(state: SourceState, checkpoint: dict):
+    state.checkpoint_json = json.dumps(checkpoint, default=str)
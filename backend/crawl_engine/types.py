@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
 from pydantic import BaseModel, HttpUrl, Field
 
+from .identity import compute_identity
+
 
 @dataclass
 class RequestSpec:
@@ -45,3 +49,136 @@ class NormalizedJob(BaseModel):
     job_hash: str
     job_key: str
     job_fingerprint: str
+    duplicate_group_id: Optional[str] = None
+    lsh_bands: Optional[str] = None
+
+
+class JobRecord:
+    """Slotted per-job record passed between engine stages.
+
+    Validation happens once, in ``from_payload``; afterwards stages mutate
+    attributes in place instead of building new models and dict copies.
+    """
+
+    __slots__ = (
+        "title",
+        "company",
+        "location",
+        "url",
+        "description",
+        "post_date",
+        "source",
+        "source_meta",
+        "remote",
+        "relevance_score",
+        "semantic_score",
+        "keywords_matched",
+        "job_hash",
+        "job_key",
+        "job_fingerprint",
+        "duplicate_group_id",
+        "lsh_bands",
+    )
+
+    ROW_FIELDS = __slots__
+
+    def __init__(
+        self,
+        title: str,
+        company: str,
+        location: str,
+        url: str,
+        description: str,
+        post_date: str | None,
+        source: str,
+        source_meta: Dict[str, Any] | None,
+        remote: bool,
+        job_key: str,
+        job_fingerprint: str,
+    ):
+        self.title = title
+        self.company = company
+        self.location = location
+        self.url = url
+        self.description = description
+        self.post_date = post_date
+        self.source = source
+        self.source_meta = source_meta
+        self.remote = remote
+        self.relevance_score = 0.0
+        self.semantic_score: Optional[float] = None
+        self.keywords_matched: Optional[str] = None
+        self.job_hash = job_key
+        self.job_key = job_key
+        self.job_fingerprint = job_fingerprint
+        self.duplicate_group_id: Optional[str] = None
+        self.lsh_bands: Optional[str] = None
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "JobRecord":
+        """Validate a source item and normalize it; raises ValueError if unusable."""
+        title = payload.get("title")
+        url = payload.get("url")
+        source = payload.get("source")
+        for field, value in (("title", title), ("url", url), ("source", source)):
+            if not isinstance(value, str):
+                raise ValueError(f"{field}: expected a string, got {type(value).__name__}")
+        company = _optional_str(payload.get("company"))
+        location = _optional_str(payload.get("location"))
+        description = _optional_str(payload.get("description"))
+        post_date = payload.get("post_date")
+        if post_date is not None and not isinstance(post_date, str):
+            post_date = post_date.isoformat() if hasattr(post_date, "isoformat") else str(post_date)
+        source_meta = payload.get("source_meta")
+        if source_meta is not None and not isinstance(source_meta, dict):
+            raise ValueError("source_meta: expected a mapping")
+
+        identity = compute_identity(title, company, url, source, post_date, location, description)
+        parsed = urlparse(identity.canonical_url)
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            raise ValueError(f"url: not an absolute http(s) URL: {url!r}")
+
+        return cls(
+            title=title or "Untitled",
+            company=company or "Unknown",
+            location=location or "Remote",
+            url=identity.canonical_url,
+            description=description or title,
+            post_date=post_date,
+            source=source,
+            source_meta=source_meta,
+            remote=_parse_bool(payload.get("remote")),
+            job_key=identity.job_key,
+            job_fingerprint=identity.fingerprint,
+        )
+
+    def to_row(self) -> Dict[str, Any]:
+        """Column values for the jobs table (source_meta serialized)."""
+        row = {name: getattr(self, name) for name in self.ROW_FIELDS}
+        if row["source_meta"] is not None:
+            row["source_meta"] = json.dumps(row["source_meta"])
+        return row
+
+
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "y", "on", "t"})
+_FALSE_STRINGS = frozenset({"0", "false", "no", "n", "off", "f", ""})
+
+
+def _parse_bool(value: Any) -> bool:
+    """Coerce a payload flag like pydantic did: "false"/"0" are False, not truthy strings."""
+    if value is None:
+        return False
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+        raise ValueError(f"remote: not a boolean: {value!r}")
+    return bool(value)
+
+
+def _optional_str(value: Any) -> str | None:
+    if value is None or isinstance(value, str):
+        return value
+    raise ValueError(f"expected a string, got {type(value).__name__}")
@@ -0,0 +1,150 @@
+"""Crawls started from the API, run off the request path.
+
+``CrawlJobManager.submit`` hands back a ``run_id`` at once and runs
+``execute_crawl`` on a single background worker with its own session. A
+request arriving while a crawl is queued or running joins that crawl
+instead of starting another, including a crawl another process (the
+scheduler or ``backend.runner``) is running, as seen in ``crawl_runs``.
+Progress from the engine (per-source stage counts) is appended to the
+job's event list, which ``/api/runs/{run_id}/events`` streams as
+server-sent events. For crawls this process does not run, that endpoint
+polls ``crawl_runs`` until the run finishes or stops being live.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy.orm import Session
+
+from .models import CrawlRun
+
+logger = logging.getLogger(__name__)
+
+# finished jobs kept for late event subscribers
+MAX_FINISHED_JOBS = 20
+EVENT_POLL_SECONDS = 0.5
+# crawl_runs polling for crawls run by another process
+RUN_POLL_SECONDS = 2.0
+KEEPALIVE_SECONDS = 15.0
+
+
+@dataclass
+class CrawlJob:
+    run_id: str
+    status: str = "queued"  # queued, running, done, failed
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed")
+
+
+class CrawlJobManager:
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="crawl-job")
+        self._jobs: Dict[str, CrawlJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, bind, **crawl_options) -> Tuple[CrawlJob, bool]:
+        """Queue a crawl, or return the active one; the flag is True when coalesced."""
+        with self._lock:
+            active = next((job for job in self._jobs.values() if not job.finished), None)
+            if active is not None:
+                return active, True
+            # crawls this process ran are known to have ended, finished row or not
+            running = self._running_elsewhere(bind, ignore=set(self._jobs))
+            if running is not None:
+                return running, True
+            job = CrawlJob(run_id=str(uuid4()))
+            self._jobs[job.run_id] = job
+            self._prune()
+        self._publish(job, "status", {"status": "queued"})
+        self._executor.submit(self._run, job, bind, crawl_options)
+        return job, False
+
+    @staticmethod
+    def _running_elsewhere(bind, ignore: set) -> Optional[CrawlJob]:
+        from .crawl_runner import find_live_run
+
+        with Session(bind=bind) as db:
+            run = find_live_run(db, ignore=ignore)
+            return CrawlJob(run_id=run.run_id, status="running") if run is not None else None
+
+    def get(self, run_id: str) -> Optional[CrawlJob]:
+        with self._lock:
+            return self._jobs.get(run_id)
+
+    def events_since(self, job: CrawlJob, index: int) -> List[Dict[str, Any]]:
+        with self._lock:
+            return job.events[index:]
+
+    def _publish(self, job: CrawlJob, event: str, data: Dict[str, Any], status: Optional[str] = None) -> None:
+        """Append an event; a new ``status`` is set in the same step so readers never see one without the other."""
+        with self._lock:
+            job.events.append({"event": event, "data": data})
+            if status is not None:
+                if status in ("done", "failed"):
+                    job.finished_at = time.time()
+                job.status = status
+
+    def _run(self, job: CrawlJob, bind, crawl_options: dict) -> None:
+        from .crawl_runner import execute_crawl
+
+        def progress(source: str, stage: str, counts: dict) -> None:
+            self._publish(job, "progress", {"source": source, "stage": stage, **counts})
+
+        self._publish(job, "status", {"status": "running"}, status="running")
+        db = Session(bind=bind)
+        try:
+            result = execute_crawl(db, run_id=job.run_id, progress=progress, **crawl_options)
+            job.result = result.model_dump()
+            self._publish(job, "done", job.result, status="done")
+        except Exception as exc:
+            db.rollback()
+            logger.error("Crawl %s failed: %s", job.run_id, exc)
+            job.error = str(exc)
+            self._publish(job, "failed", {"status": "failed", "error": job.error}, status="failed")
+        finally:
+            db.close()
+
+    def _prune(self) -> None:
+        finished = sorted(
+            (job for job in self._jobs.values() if job.finished), key=lambda job: job.finished_at or 0
+        )
+        for job in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job.run_id]
+
+
+def stored_run_event(bind, run_id: str) -> Optional[Dict[str, Any]]:
+    """Terminal event for a ``crawl_runs`` row, or None while it may still be running.
+
+    ``done`` carries the same ``CrawlResult`` payload as a tracked crawl.
+    """
+    from .crawl_runner import run_is_live, run_result
+
+    with Session(bind=bind) as db:
+        run = db.query(CrawlRun).filter(CrawlRun.run_id == run_id).first()
+        if run is None:
+            return {"event": "failed", "data": {"status": "failed", "error": f"Crawl run {run_id} not found"}}
+        if run.finished_at is not None:
+            return {"event": "done", "data": run_result(run).model_dump()}
+        if not run_is_live(db, run):
+            return {"event": "failed", "data": {"status": "failed", "error": "Crawl stopped without finishing"}}
+        return None
+
+
+def format_sse(event: Dict[str, Any]) -> str:
+    return f"event: {event['event']}\ndata: {json.dumps(event['data'], default=str)}\n\n"
+
+
+crawl_jobs = CrawlJobManager()
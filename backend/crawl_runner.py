@@ -1,7 +1,9 @@
 import json
 import logging
-from datetime import datetime, timezone
-from typing import List, Tuple
+import threading
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Collection, Iterator, List, Tuple
 from uuid import uuid4
 
 from sqlalchemy.orm import Session, sessionmaker
@@ -9,11 +11,20 @@ from sqlalchemy.orm import Session, sessionmaker
 from .config import settings
 from .crawler import JobCrawler
 from .http_client import SourceBlockedError
-from .models import CrawlRun, Job, Settings as SettingsModel
-from .nlp import get_nlp_scorer
+from .models import CrawlRun, Job
+from .nlp import flush_embedding_cache, get_nlp_scorer
 from .notifications import NotificationService
 from .schemas import CrawlResult, JobCreate
 from .database import ensure_schema
+from .embedding_store import prune_embeddings
+from .http_cache import bump_data_version
+from .job_counters import job_total
+from .profiles import score_jobs_for_profiles
+from .settings_store import get_settings_snapshot, thaw
+from backend.crawl_engine.identity import identity_from_payload
+from backend.crawl_engine.key_index import KnownKeyIndex
+from backend.crawl_engine.near_dupes import NearDuplicateIndex, lsh_bands
+from backend.crawl_engine.state import SourceState, get_checkpoint
 from .sources import (
     remotive,
     workingnomads,
@@ -30,13 +41,6 @@ from .sources import (
 logger = logging.getLogger(__name__)
 
 
-def _merge_sources(stored_sources: dict | None) -> dict:
-    merged = settings.JOB_SOURCES.copy()
-    if stored_sources:
-        merged.update(stored_sources)
-    return merged
-
-
 def _normalize_greenhouse_boards(raw_boards) -> List[dict]:
     normalized: List[dict] = []
     if not raw_boards:
@@ -57,42 +61,293 @@ def _normalize_greenhouse_boards(raw_boards) -> List[dict]:
 
 
 def _load_runtime_settings(db: Session) -> Tuple[List[str], List[str], dict, List[dict]]:
-    keywords_setting = (
-        db.query(SettingsModel).filter(SettingsModel.key == "keywords").first()
-    )
-    locations_setting = (
-        db.query(SettingsModel).filter(SettingsModel.key == "locations").first()
-    )
-    sources_setting = (
-        db.query(SettingsModel).filter(SettingsModel.key == "sources").first()
-    )
-    greenhouse_boards_setting = (
-        db.query(SettingsModel).filter(SettingsModel.key == "greenhouse_boards").first()
-    )
+    snapshot = get_settings_snapshot(db)
+    greenhouse_boards = _normalize_greenhouse_boards(thaw(snapshot.greenhouse_boards)) or settings.GREENHOUSE_BOARDS
+    return list(snapshot.keywords), list(snapshot.locations), dict(snapshot.sources), greenhouse_boards
 
-    keywords = (
-        json.loads(keywords_setting.value)
-        if keywords_setting and keywords_setting.value
-        else settings.DEFAULT_KEYWORDS
-    )
-    locations = (
-        json.loads(locations_setting.value)
-        if locations_setting and locations_setting.value
-        else settings.DEFAULT_LOCATIONS
+
+def _v2_source_functions(keywords: List[str], locations: List[str]) -> dict:
+    return {
+        "remoteok": lambda: JobCrawler(keywords, locations, settings.MAX_JOBS_PER_SOURCE).crawl_remoteok(),
+        "weworkremotely": lambda: JobCrawler(keywords, locations, settings.MAX_JOBS_PER_SOURCE).crawl_weworkremotely_rss(),
+        "indeed": lambda: JobCrawler(keywords, locations, settings.MAX_JOBS_PER_SOURCE).crawl_indeed(),
+        "greenhouse": lambda: JobCrawler(keywords, locations, settings.MAX_JOBS_PER_SOURCE).crawl_greenhouse_boards(),
+        "remotive": lambda: remotive.fetch_jobs(settings),
+        "workingnomads": lambda: workingnomads.fetch_jobs(settings),
+        "remote_co": lambda: remote_co.fetch_jobs(settings),
+        "naukri": lambda: naukri.fetch_jobs(settings),
+        "shine": lambda: shine.fetch_jobs(settings),
+        "timesjobs": lambda: timesjobs.fetch_jobs(settings),
+        "glassdoor": lambda: glassdoor.fetch_jobs(settings),
+        "wellfound": lambda: wellfound.fetch_jobs(settings),
+        "yc": lambda: yc.fetch_jobs(settings),
+        "linkedin": lambda: linkedin.fetch_jobs(settings),
+    }
+
+
+def _run_v2_engine(
+    db: Session,
+    run_id: str,
+    sources: dict,
+    keywords: List[str],
+    locations: List[str],
+    ignore_cooldown: bool,
+    resume: bool = False,
+    min_store_score: float | None = None,
+    progress: Callable[[str, str, dict], None] | None = None,
+) -> dict:
+    from backend.crawl_engine.engine import run_engine_v2
+
+    return run_engine_v2(
+        db,
+        sources_enabled=sources,
+        source_functions=_v2_source_functions(keywords, locations),
+        ignore_cooldown=ignore_cooldown,
+        session_maker=sessionmaker(bind=db.bind),
+        run_id=run_id,
+        resume=resume,
+        keywords=keywords,
+        locations=locations,
+        min_store_score=min_store_score if min_store_score is not None else settings.MIN_SCORE_TO_STORE,
+        progress=progress,
     )
-    sources = (
-        json.loads(sources_setting.value)
-        if sources_setting and sources_setting.value
-        else settings.JOB_SOURCES
+
+
+def _prune_embeddings(db: Session) -> None:
+    try:
+        prune_embeddings(db)
+    except Exception as exc:
+        db.rollback()
+        logger.warning("Embedding cache prune failed: %s", exc)
+
+
+def _score_profiles(db: Session, nlp_scorer, jobs: List[Job]) -> None:
+    try:
+        score_jobs_for_profiles(db, nlp_scorer, jobs)
+        db.commit()
+    except Exception as exc:
+        db.rollback()
+        logger.error("Profile scoring failed: %s", exc)
+    # vectors from the crawl's scoring and the profile pass, now that both committed
+    flush_embedding_cache(nlp_scorer)
+
+
+def _finalize_v2_run(
+    db: Session,
+    run_entry: CrawlRun,
+    metrics: dict,
+    sources: dict,
+    actual_inserted: int | None = None,
+) -> CrawlResult:
+    # aggregate
+    fetched = sum(m.get("jobs_parsed_count", 0) for m in metrics.values())
+    inserted = sum(m.get("jobs_inserted_count", 0) for m in metrics.values())
+    if actual_inserted is not None and actual_inserted != inserted:
+        inserted = actual_inserted
+    sources_failed = [
+        {"source": src, "error": "; ".join(m.get("errors", []))}
+        for src, m in metrics.items()
+        if m.get("errors")
+    ]
+    sources_succeeded = [
+        src for src in sources.keys() if src in metrics and not metrics[src].get("errors")
+    ]
+    started_at = run_entry.started_at
+    if started_at.tzinfo is None:
+        started_at = started_at.replace(tzinfo=timezone.utc)
+    run_entry.finished_at = datetime.now(timezone.utc)
+    run_entry.duration_ms = int((run_entry.finished_at - started_at).total_seconds() * 1000)
+    run_entry.fetched_count = fetched
+    run_entry.inserted_new_count = inserted
+    run_entry.source_metrics = json.dumps(metrics)
+    run_entry.sources_succeeded = json.dumps(sources_succeeded)
+    run_entry.sources_failed = json.dumps(sources_failed)
+    db.add(run_entry)
+    db.commit()
+    bump_data_version(db)
+    _prune_embeddings(db)
+    return CrawlResult(
+        status="success",
+        jobs_found=fetched,
+        jobs_added=inserted,
+        message=f"Found {fetched} jobs, added {inserted} new jobs",
+        run_id=run_entry.run_id,
     )
-    greenhouse_boards = (
-        json.loads(greenhouse_boards_setting.value)
-        if greenhouse_boards_setting and greenhouse_boards_setting.value
-        else settings.GREENHOUSE_BOARDS
+
+
+@contextmanager
+def _heartbeat(db: Session, run_id: str) -> Iterator[None]:
+    """Stamp ``crawl_runs.heartbeat_at`` every ``CRAWL_HEARTBEAT_SECONDS`` until the block exits.
+
+    A slow fetch moves no checkpoint, so liveness cannot rest on checkpoints
+    alone; the stamp comes from its own thread and session.
+    """
+    stop = threading.Event()
+    make_session = sessionmaker(bind=db.bind)
+
+    def beat():
+        while not stop.wait(settings.CRAWL_HEARTBEAT_SECONDS):
+            session = make_session()
+            try:
+                session.query(CrawlRun).filter(CrawlRun.run_id == run_id).update(
+                    {CrawlRun.heartbeat_at: datetime.now(timezone.utc)}, synchronize_session=False
+                )
+                session.commit()
+            except Exception as exc:
+                session.rollback()
+                logger.warning("Crawl heartbeat for %s failed: %s", run_id, exc)
+            finally:
+                session.close()
+
+    thread = threading.Thread(target=beat, name=f"crawl-heartbeat-{run_id}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _recent(stamp: datetime | None) -> bool:
+    """True when ``stamp`` lies within the last ``CRAWL_RESUME_STALE_MINUTES``."""
+    if stamp is None:
+        return False
+    if stamp.tzinfo is None:
+        stamp = stamp.replace(tzinfo=timezone.utc)
+    return stamp > datetime.now(timezone.utc) - timedelta(minutes=settings.CRAWL_RESUME_STALE_MINUTES)
+
+
+def _run_checkpoints(db: Session, run_id: str) -> List[dict]:
+    """The v2 source checkpoints still recorded for ``run_id`` (v1 runs have none)."""
+    checkpoints = (get_checkpoint(state, run_id) for state in db.query(SourceState).all())
+    return [checkpoint for checkpoint in checkpoints if checkpoint]
+
+
+def _checkpoints_stale(checkpoints: List[dict]) -> bool:
+    """True when no checkpoint moved within ``CRAWL_RESUME_STALE_MINUTES``."""
+    cutoff = datetime.now(timezone.utc) - timedelta(minutes=settings.CRAWL_RESUME_STALE_MINUTES)
+    for checkpoint in checkpoints:
+        try:
+            updated_at = datetime.fromisoformat(checkpoint["updated_at"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if updated_at > cutoff:
+            return False
+    return True
+
+
+def resume_run(db: Session, run_id: str, *, ignore_cooldown: bool = False) -> CrawlResult:
+    """Continue an interrupted v2 run, crawling only sources without a finished checkpoint.
+
+    Sources whose checkpoint for ``run_id`` is done keep their recorded metrics;
+    the others restart after their last committed batch. Raises ValueError for
+    a run without v2 checkpoints (nothing to resume from) and for one whose
+    checkpoints moved recently, since another process may still be crawling it.
+    """
+    from backend.crawl_engine.state import ensure_state_table
+
+    run_entry = db.query(CrawlRun).filter(CrawlRun.run_id == run_id).first()
+    if not run_entry:
+        raise ValueError(f"Unknown crawl run: {run_id}")
+    if run_entry.finished_at is not None:
+        return CrawlResult(
+            status="success",
+            jobs_found=run_entry.fetched_count or 0,
+            jobs_added=run_entry.inserted_new_count or 0,
+            message="Run already finished; nothing to resume",
+            run_id=run_id,
+        )
+
+    ensure_state_table(db.bind)
+    ensure_schema(db.bind)
+    checkpoints = _run_checkpoints(db, run_id)
+    if not checkpoints:
+        raise ValueError(f"Crawl run {run_id} has no v2 checkpoints to resume from; start a new crawl")
+    if _recent(run_entry.heartbeat_at) or not _checkpoints_stale(checkpoints):
+        raise ValueError(
+            f"Crawl run {run_id} was active in the last "
+            f"{settings.CRAWL_RESUME_STALE_MINUTES} minutes and may still be running"
+        )
+    keywords, locations, sources, _ = _load_runtime_settings(db)
+    try:
+        attempted = set(json.loads(run_entry.sources_attempted or "[]"))
+    except Exception:
+        attempted = set()
+    if attempted:
+        sources = {name: enabled for name, enabled in sources.items() if name in attempted}
+
+    logger.info("Resuming crawl run %s", run_id)
+    run_entry.heartbeat_at = datetime.now(timezone.utc)
+    db.commit()
+    with _heartbeat(db, run_id):
+        metrics = _run_v2_engine(db, run_id, sources, keywords, locations, ignore_cooldown, resume=True)
+    db.refresh(run_entry)
+    return _finalize_v2_run(db, run_entry, metrics, sources)
+
+
+def _unfinished_runs(db: Session, max_age_hours: int) -> List[CrawlRun]:
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
+    return (
+        db.query(CrawlRun)
+        .filter(CrawlRun.finished_at.is_(None), CrawlRun.started_at >= cutoff)
+        .order_by(CrawlRun.started_at.desc())
+        .all()
     )
-    greenhouse_boards = _normalize_greenhouse_boards(greenhouse_boards) or settings.GREENHOUSE_BOARDS
 
-    return keywords, locations, _merge_sources(sources), greenhouse_boards
+
+def find_resumable_run(db: Session, max_age_hours: int = 24) -> CrawlRun | None:
+    """Most recent interrupted v2 run started within ``max_age_hours``.
+
+    An unfinished run only counts when it has checkpoints and neither its
+    heartbeat nor any checkpoint moved within ``CRAWL_RESUME_STALE_MINUTES``;
+    otherwise it may still be crawling in the API or scheduler process.
+    """
+    for run in _unfinished_runs(db, max_age_hours):
+        if _recent(run.heartbeat_at):
+            continue
+        checkpoints = _run_checkpoints(db, run.run_id)
+        if checkpoints and _checkpoints_stale(checkpoints):
+            return run
+    return None
+
+
+def run_is_live(db: Session, run: CrawlRun) -> bool:
+    """Whether an unfinished run may still be crawling in some process.
+
+    A run counts as live for its first ``CRAWL_RESUME_STALE_MINUTES`` and
+    after that for as long as its heartbeat (stamped every
+    ``CRAWL_HEARTBEAT_SECONDS``, v1 and v2 alike) or one of its v2
+    checkpoints keeps moving.
+    """
+    if run.finished_at is not None:
+        return False
+    if run.started_at is None or _recent(run.started_at) or _recent(run.heartbeat_at):
+        return True
+    checkpoints = _run_checkpoints(db, run.run_id)
+    return bool(checkpoints) and not _checkpoints_stale(checkpoints)
+
+
+def find_live_run(db: Session, max_age_hours: int = 24, ignore: Collection[str] = ()) -> CrawlRun | None:
+    """Most recent unfinished run that may still be crawling (see ``run_is_live``).
+
+    Runs named in ``ignore`` are skipped, e.g. those whose outcome the caller already knows.
+    """
+    for run in _unfinished_runs(db, max_age_hours):
+        if run.run_id not in ignore and run_is_live(db, run):
+            return run
+    return None
+
+
+def run_result(run: CrawlRun) -> CrawlResult:
+    """The ``CrawlResult`` of a finished ``crawl_runs`` row."""
+    fetched, inserted = run.fetched_count or 0, run.inserted_new_count or 0
+    return CrawlResult(
+        status="success",
+        jobs_found=fetched,
+        jobs_added=inserted,
+        message=f"Found {fetched} jobs, added {inserted} new jobs",
+        run_id=run.run_id,
+    )
 
 
 def execute_crawl(
@@ -104,8 +359,15 @@ def execute_crawl(
     max_pages: int | None = None,
     min_store_score: float | None = None,
     ignore_cooldown: bool = False,
+    run_id: str | None = None,
+    progress: Callable[[str, str, dict], None] | None = None,
 ) -> CrawlResult:
-    """Run the crawler pipeline once."""
+    """Run the crawler pipeline once.
+
+    ``run_id`` names the ``crawl_runs`` row (one is generated otherwise);
+    ``progress(source, stage, counts)`` is called as sources advance.
+    """
+    run_id = run_id or str(uuid4())
     if override_sources is not None:
         # For explicit overrides (tests/dev), avoid merging stored/default sources.
         keywords = settings.DEFAULT_KEYWORDS
@@ -117,7 +379,6 @@ def execute_crawl(
 
     if settings.CRAWL_ENGINE.lower() == "v2":
         # New engine path
-        from backend.crawl_engine.engine import run_engine_v2
         from backend.crawl_engine.state import ensure_state_table
 
         # Ensure source_state exists for the active database bind
@@ -125,13 +386,13 @@ def execute_crawl(
         # Ensure schema/indexes (job_key unique) exist for the active bind
         ensure_schema(db.bind)
 
-        run_id = str(uuid4())
         run_started_at = datetime.now(timezone.utc)
-        before_count = db.query(Job).count()
+        before_count = job_total(db)
 
         run_entry = CrawlRun(
             run_id=run_id,
             started_at=run_started_at,
+            heartbeat_at=run_started_at,
             sources_attempted=json.dumps(list(sources.keys())),
             sources_succeeded=json.dumps([]),
             sources_failed=json.dumps([]),
@@ -141,66 +402,26 @@ def execute_crawl(
         )
         db.add(run_entry)
         db.commit()
-
-        metrics = run_engine_v2(
-            db,
-            sources_enabled=sources,
-            source_functions={
-                "remoteok": lambda: JobCrawler(keywords, locations, settings.MAX_JOBS_PER_SOURCE).crawl_remoteok(),
-                "weworkremotely": lambda: JobCrawler(keywords, locations, settings.MAX_JOBS_PER_SOURCE).crawl_weworkremotely_rss(),
-                "indeed": lambda: JobCrawler(keywords, locations, settings.MAX_JOBS_PER_SOURCE).crawl_indeed(),
-                "greenhouse": lambda: JobCrawler(keywords, locations, settings.MAX_JOBS_PER_SOURCE).crawl_greenhouse_boards(),
-                "remotive": lambda: remotive.fetch_jobs(settings),
-                "workingnomads": lambda: workingnomads.fetch_jobs(settings),
-                "remote_co": lambda: remote_co.fetch_jobs(settings),
-                "naukri": lambda: naukri.fetch_jobs(settings),
-                "shine": lambda: shine.fetch_jobs(settings),
-                "timesjobs": lambda: timesjobs.fetch_jobs(settings),
-                "glassdoor": lambda: glassdoor.fetch_jobs(settings),
-                "wellfound": lambda: wellfound.fetch_jobs(settings),
-                "yc": lambda: yc.fetch_jobs(settings),
-                "linkedin": lambda: linkedin.fetch_jobs(settings),
-            },
-            ignore_cooldown=ignore_cooldown,
-            session_maker=sessionmaker(bind=db.bind),
-        )
-        # aggregate
-        fetched = sum(m.get("jobs_parsed_count", 0) for m in metrics.values())
-        inserted = sum(m.get("jobs_inserted_count", 0) for m in metrics.values())
+        bump_data_version(db)
+
+        with _heartbeat(db, run_id):
+            metrics = _run_v2_engine(
+                db,
+                run_id,
+                sources,
+                keywords,
+                locations,
+                ignore_cooldown,
+                min_store_score=min_store_score,
+                progress=progress,
+            )
         # fallback to actual DB delta to ensure accurate jobs_added
-        after_count = db.query(Job).count()
-        actual_inserted = max(0, after_count - before_count)
-        if actual_inserted != inserted:
-            inserted = actual_inserted
-        sources_failed = [
-            {"source": src, "error": "; ".join(m.get("errors", []))}
-            for src, m in metrics.items()
-            if m.get("errors")
-        ]
-        sources_succeeded = [
-            src for src in sources.keys() if src in metrics and not metrics[src].get("errors")
-        ]
-        run_entry.finished_at = datetime.now(timezone.utc)
-        run_entry.duration_ms = int((run_entry.finished_at - run_started_at).total_seconds() * 1000)
-        run_entry.fetched_count = fetched
-        run_entry.inserted_new_count = inserted
-        run_entry.source_metrics = json.dumps(metrics)
-        run_entry.sources_succeeded = json.dumps(sources_succeeded)
-        run_entry.sources_failed = json.dumps(sources_failed)
-        db.add(run_entry)
-        db.commit()
-        return CrawlResult(
-            status="success",
-            jobs_found=fetched,
-            jobs_added=inserted,
-            message=f"Found {fetched} jobs, added {inserted} new jobs",
-            run_id=run_id,
-        )
+        after_count = job_total(db)
+        return _finalize_v2_run(db, run_entry, metrics, sources, actual_inserted=max(0, after_count - before_count))
 
     # Legacy path (v1)
     nlp_scorer = get_nlp_scorer()
 
-    run_id = str(uuid4())
     run_started_at = datetime.now(timezone.utc)
 
     crawler = JobCrawler(
@@ -234,145 +455,160 @@ def execute_crawl(
         "linkedin": lambda: linkedin.fetch_jobs(settings),
     }
 
-    for source_name, crawl_fn in source_functions.items():
-        if not sources.get(source_name, False):
-            continue
-        attempted_sources.append(source_name)
-
-        metrics = {
-            "source": source_name,
-            "requested_pages": max_pages or settings.MAX_PAGES_PER_SOURCE,
-            "pages_fetched": 0,
-            "http_status_counts": {},
-            "jobs_parsed_count": 0,
-            "jobs_after_normalization_count": 0,
-            "jobs_scored_count": 0,
-            "jobs_above_threshold_count": 0,
-            "jobs_insert_attempted_count": 0,
-            "jobs_inserted_count": 0,
-            "jobs_deduped_count": 0,
-            "errors": [],
-        }
-        try:
-            if source_name == "indeed":
-                logger.warning(
-                    "Indeed scraping is brittle/ToS-sensitive; enable only for personal use."
-                )
-            jobs = crawl_fn()
-            if source_name in {"remotive", "workingnomads", "remote_co", "naukri", "shine", "timesjobs", "linkedin"}:
-                # Normalize dicts into JobCreate-like objects after scoring
-                scored_jobs: List[JobCreate] = []
-                for job_dict in jobs:
-                    metrics["jobs_parsed_count"] += 1
-                    score, keywords_matched = crawler.calculate_relevance_score(job_dict)
-                    metrics["jobs_scored_count"] += 1
-                    if score >= (min_store_score if min_store_score is not None else settings.MIN_SCORE_TO_STORE):
-                        metrics["jobs_above_threshold_count"] += 1
-                    job_hash = Job.generate_hash(
-                        job_dict.get("title", ""),
-                        job_dict.get("company", ""),
-                        job_dict.get("url", ""),
-                        job_dict.get("source", ""),
-                        job_dict.get("post_date"),
-                        job_dict.get("location"),
-                    )
-                    job_key = Job.generate_key(
-                        job_dict.get("title", ""),
-                        job_dict.get("company", ""),
-                        job_dict.get("url", ""),
-                        job_dict.get("source", ""),
-                        job_dict.get("post_date"),
-                        job_dict.get("location"),
-                    )
-                    job_payload = {
-                        **job_dict,
-                        "job_hash": job_hash,
-                        "job_key": job_key,
-                        "relevance_score": score,
-                        "keywords_matched": keywords_matched,
-                    }
-                    scored_jobs.append(JobCreate(**job_payload))
-                jobs_found.extend(scored_jobs)
-            else:
-                jobs_found.extend(jobs)
-            succeeded_sources.append(source_name)
-        except SourceBlockedError as exc:
-            failed_sources.append({"source": source_name, "error": str(exc)})
-            logger.warning("Source %s blocked: %s", source_name, exc)
-            metrics["errors"].append(str(exc))
-        except Exception as exc:
-            failed_sources.append({"source": source_name, "error": str(exc)})
-            logger.error("Source %s failed: %s", source_name, exc)
-            metrics["errors"].append(str(exc))
-        source_metrics.append(metrics)
-
-    jobs_found.sort(key=lambda x: x.relevance_score, reverse=True)
-
-    new_jobs: List[Job] = []
+    # the row exists from the start, so other processes see the crawl while it fetches
     run_entry = CrawlRun(
         run_id=run_id,
         started_at=run_started_at,
-        sources_attempted=json.dumps(attempted_sources),
+        heartbeat_at=run_started_at,
+        sources_attempted=json.dumps([name for name in source_functions if sources.get(name, False)]),
         sources_succeeded=json.dumps([]),
         sources_failed=json.dumps([]),
-        source_metrics=json.dumps(source_metrics),
         fetched_count=0,
         inserted_new_count=0,
     )
     db.add(run_entry)
-    db.commit()
+    if not dry_run:
+        db.commit()
+        bump_data_version(db)
 
-    try:
-        jobs_to_save: List[Job] = []
-        for job_data in jobs_found:
-            existing_job = db.query(Job).filter(Job.job_key == job_data.job_key).first()
-            if existing_job:
+    with nullcontext() if dry_run else _heartbeat(db, run_id):
+        for source_name, crawl_fn in source_functions.items():
+            if not sources.get(source_name, False):
+                continue
+            attempted_sources.append(source_name)
+
+            metrics = {
+                "source": source_name,
+                "requested_pages": max_pages or settings.MAX_PAGES_PER_SOURCE,
+                "pages_fetched": 0,
+                "http_status_counts": {},
+                "jobs_parsed_count": 0,
+                "jobs_after_normalization_count": 0,
+                "jobs_scored_count": 0,
+                "jobs_above_threshold_count": 0,
+                "jobs_insert_attempted_count": 0,
+                "jobs_inserted_count": 0,
+                "jobs_deduped_count": 0,
+                "errors": [],
+            }
+            try:
+                if source_name == "indeed":
+                    logger.warning(
+                        "Indeed scraping is brittle/ToS-sensitive; enable only for personal use."
+                    )
+                jobs = crawl_fn()
+                if source_name in {"remotive", "workingnomads", "remote_co", "naukri", "shine", "timesjobs", "linkedin"}:
+                    # Normalize dicts into JobCreate-like objects after scoring
+                    scored_jobs: List[JobCreate] = []
+                    scores = crawler.calculate_relevance_scores(jobs)
+                    for job_dict, (score, keywords_matched) in zip(jobs, scores):
+                        metrics["jobs_parsed_count"] += 1
+                        metrics["jobs_scored_count"] += 1
+                        if score < (min_store_score if min_store_score is not None else settings.MIN_SCORE_TO_STORE):
+                            continue
+                        metrics["jobs_above_threshold_count"] += 1
+                        identity = identity_from_payload(job_dict)
+                        job_payload = {
+                            **job_dict,
+                            "job_hash": identity.job_hash,
+                            "job_key": identity.job_key,
+                            "job_fingerprint": identity.fingerprint,
+                            "relevance_score": score,
+                            "keywords_matched": keywords_matched,
+                        }
+                        scored_jobs.append(JobCreate(**job_payload))
+                    jobs_found.extend(scored_jobs)
+                else:
+                    jobs_found.extend(jobs)
+                succeeded_sources.append(source_name)
+            except SourceBlockedError as exc:
+                failed_sources.append({"source": source_name, "error": str(exc)})
+                logger.warning("Source %s blocked: %s", source_name, exc)
+                metrics["errors"].append(str(exc))
+            except Exception as exc:
+                failed_sources.append({"source": source_name, "error": str(exc)})
+                logger.error("Source %s failed: %s", source_name, exc)
+                metrics["errors"].append(str(exc))
+            source_metrics.append(metrics)
+            if progress is not None:
+                progress(
+                    source_name,
+                    "failed" if metrics["errors"] else "done",
+                    {key: value for key, value in metrics.items() if key.endswith("_count") or key == "errors"},
+                )
+
+        jobs_found.sort(key=lambda x: x.relevance_score, reverse=True)
+
+        new_jobs: List[Job] = []
+
+        try:
+            jobs_to_save: List[Job] = []
+            key_index = KnownKeyIndex.load(db)
+            near_index = NearDuplicateIndex.load(db, settings.NEAR_DUP_WINDOW_DAYS)
+            for job_data in jobs_found:
+                job_key = job_data.job_key or Job.generate_key(
+                    job_data.title,
+                    job_data.company,
+                    job_data.url,
+                    job_data.source,
+                    job_data.post_date,
+                    job_data.location,
+                )
+                if key_index.contains(job_key):
+                    metrics_entry = next((m for m in source_metrics if m["source"] == job_data.source), None)
+                    if metrics_entry:
+                        metrics_entry["jobs_deduped_count"] += 1
+                    continue
+                payload = job_data.dict()
+                payload["job_key"] = job_key
+                payload["lsh_bands"] = lsh_bands(job_data.title, job_data.company, job_data.description)
+                payload["duplicate_group_id"] = near_index.assign(payload["lsh_bands"], job_key)
+                if payload.get("source_meta") is not None:
+                    payload["source_meta"] = json.dumps(payload["source_meta"])
+                new_job = Job(**payload)
+                key_index.add(job_key, job_data.job_fingerprint)
+                jobs_to_save.append(new_job)
+                new_jobs.append(new_job)
                 metrics_entry = next((m for m in source_metrics if m["source"] == job_data.source), None)
                 if metrics_entry:
-                    metrics_entry["jobs_deduped_count"] += 1
-                continue
-            payload = job_data.dict()
-            if payload.get("source_meta") is not None:
-                payload["source_meta"] = json.dumps(payload["source_meta"])
-            new_job = Job(**payload)
-            jobs_to_save.append(new_job)
-            new_jobs.append(new_job)
-            metrics_entry = next((m for m in source_metrics if m["source"] == job_data.source), None)
-            if metrics_entry:
-                metrics_entry["jobs_insert_attempted_count"] += 1
-
-        if jobs_to_save and not dry_run:
-            db.bulk_save_objects(jobs_to_save)
-        if not dry_run:
-            db.commit()
-    except Exception as exc:
-        db.rollback()
-        failed_sources.append({"source": "pipeline", "error": str(exc)})
-        logger.error("Crawl pipeline failed: %s", exc)
-    finally:
-        finished_at = datetime.now(timezone.utc)
-        run_entry.finished_at = finished_at
-        run_entry.duration_ms = int((finished_at - run_started_at).total_seconds() * 1000)
-        run_entry.fetched_count = len(jobs_found)
-        run_entry.inserted_new_count = len(new_jobs)
-        run_entry.sources_attempted = json.dumps(attempted_sources)
-        run_entry.sources_succeeded = json.dumps(succeeded_sources)
-        run_entry.sources_failed = json.dumps(failed_sources)
-        run_entry.source_metrics = json.dumps(source_metrics)
-        if failed_sources:
-            run_entry.errors_summary = "; ".join(
-                f"{item.get('source')}: {item.get('error')}" for item in failed_sources
-            )
-        db.add(run_entry)
-        if not dry_run:
-            db.commit()
-        else:
+                    metrics_entry["jobs_insert_attempted_count"] += 1
+
+            if jobs_to_save and not dry_run:
+                db.bulk_save_objects(jobs_to_save)
+            if not dry_run:
+                db.commit()
+                _score_profiles(db, nlp_scorer, jobs_to_save)
+                bump_data_version(db)
+        except Exception as exc:
             db.rollback()
+            failed_sources.append({"source": "pipeline", "error": str(exc)})
+            logger.error("Crawl pipeline failed: %s", exc)
+        finally:
+            finished_at = datetime.now(timezone.utc)
+            run_entry.finished_at = finished_at
+            run_entry.duration_ms = int((finished_at - run_started_at).total_seconds() * 1000)
+            run_entry.fetched_count = len(jobs_found)
+            run_entry.inserted_new_count = len(new_jobs)
+            run_entry.sources_attempted = json.dumps(attempted_sources)
+            run_entry.sources_succeeded = json.dumps(succeeded_sources)
+            run_entry.sources_failed = json.dumps(failed_sources)
+            run_entry.source_metrics = json.dumps(source_metrics)
+            if failed_sources:
+                run_entry.errors_summary = "; ".join(
+                    f"{item.get('source')}: {item.get('error')}" for item in failed_sources
+                )
+            db.add(run_entry)
+            if not dry_run:
+                db.commit()
+                bump_data_version(db)
+                _prune_embeddings(db)
+            else:
+                db.rollback()
 
     if send_notifications and settings.ENABLE_NOTIFICATIONS:
         notifier = NotificationService()
         if new_jobs:
-            notifier.send_daily_digest(new_jobs)
+            notifier.send_daily_digest(new_jobs, db)
         notifier.send_run_alerts(run_entry)
 
     logger.info(
@@ -8,6 +8,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from .config import settings
+from .keyword_matcher import get_keyword_matcher
 from .models import Job
 from .nlp import NLPScorer
 from .schemas import JobCreate
@@ -33,31 +34,65 @@ class JobCrawler:
         self.nlp_scorer = nlp_scorer
         self.greenhouse_boards = greenhouse_boards or settings.GREENHOUSE_BOARDS
         
+    def _keyword_score(self, job_data: Dict) -> tuple:
+        matcher = get_keyword_matcher(tuple(self.keywords))
+        return matcher.score(job_data.get("title", ""), job_data.get("description", ""))
+
+    @staticmethod
+    def _semantic_text(job_data: Dict) -> str:
+        return f"{job_data.get('title', '')} {job_data.get('description', '')}"
+
     def calculate_relevance_score(self, job_data: Dict) -> tuple:
         """Calculate relevance score based on keyword matching"""
-        title = job_data.get("title", "").lower()
-        description = job_data.get("description", "").lower()
-        
-        matched_keywords = []
-        score = 0.0
-        
-        for keyword in self.keywords:
-            keyword_lower = keyword.lower()
-            if keyword_lower in title:
-                score += 2.0
-                matched_keywords.append(keyword)
-            elif keyword_lower in description:
-                score += 1.0
-                matched_keywords.append(keyword)
+        score, matched_keywords = self._keyword_score(job_data)
 
         if self.nlp_scorer:
             try:
-                semantic_score = self.nlp_scorer.score(f"{job_data.get('title', '')} {job_data.get('description', '')}")
+                semantic_score = self.nlp_scorer.score(self._semantic_text(job_data))
                 score += semantic_score * settings.NLP_WEIGHT
             except Exception as exc:
                 logger.error("Failed to compute NLP score: %s", exc)
         
         return score, ", ".join(matched_keywords)
+
+    def calculate_relevance_scores(self, jobs: List[Dict]) -> List[tuple]:
+        """Score many jobs; the semantic part runs as one batched model call."""
+        keyword_scores = [self._keyword_score(job_data) for job_data in jobs]
+        semantic_scores = [0.0] * len(jobs)
+        if self.nlp_scorer and jobs:
+            try:
+                semantic_scores = self.nlp_scorer.score_many(
+                    [self._semantic_text(job_data) for job_data in jobs],
+                    batch_size=settings.NLP_BATCH_SIZE,
+                )
+            except Exception as exc:
+                logger.error("Failed to compute NLP scores: %s", exc)
+        return [
+            (score + float(semantic) * settings.NLP_WEIGHT, ", ".join(matched))
+            for (score, matched), semantic in zip(keyword_scores, semantic_scores)
+        ]
+
+    def _relevant_jobs(self, candidates: List[Dict]) -> List[JobCreate]:
+        """Batch-score parsed job dicts and keep the ones with a positive score."""
+        jobs: List[JobCreate] = []
+        for job_data, (score, keywords_matched) in zip(candidates, self.calculate_relevance_scores(candidates)):
+            if score <= 0:
+                continue
+            try:
+                job_hash = Job.generate_hash(
+                    job_data["title"], job_data["company"], job_data["url"], job_data["source"]
+                )
+                jobs.append(
+                    JobCreate(
+                        **job_data,
+                        job_hash=job_hash,
+                        relevance_score=score,
+                        keywords_matched=keywords_matched,
+                    )
+                )
+            except Exception as exc:
+                logger.error("Error building %s job: %s", job_data.get("source"), exc)
+        return jobs
     
     def crawl_remoteok(self) -> List[JobCreate]:
         """Crawl RemoteOK job board"""
@@ -70,6 +105,7 @@ class JobCrawler:
             if response.status_code == 200:
                 soup = BeautifulSoup(response.text, 'html.parser')
                 job_listings = soup.find_all('tr', class_='job', limit=self.max_jobs)
+                candidates = []
                 
                 for job in job_listings[:self.max_jobs]:
                     try:
@@ -89,29 +125,19 @@ class JobCrawler:
                             if tags:
                                 description += " | " + " ".join([tag.text.strip() for tag in tags])
                             
-                            job_data = {
+                            candidates.append({
                                 "title": title,
                                 "company": company,
                                 "location": location,
                                 "description": description,
                                 "url": job_url,
                                 "source": "RemoteOK"
-                            }
-                            
-                            score, keywords_matched = self.calculate_relevance_score(job_data)
-                            
-                            if score > 0:
-                                job_hash = Job.generate_hash(title, company, job_url, "RemoteOK")
-                                jobs.append(JobCreate(
-                                    **job_data,
-                                    job_hash=job_hash,
-                                    relevance_score=score,
-                                    keywords_matched=keywords_matched
-                                ))
+                            })
                     except Exception as e:
                         logger.error(f"Error parsing RemoteOK job: {e}")
                         continue
                 
+                jobs = self._relevant_jobs(candidates)
                 logger.info(f"RemoteOK: Found {len(jobs)} relevant jobs")
             
             time.sleep(2)
@@ -146,6 +172,7 @@ class JobCrawler:
                     soup = BeautifulSoup(response.text, "html.parser")
                     job_cards = soup.select("div.job_seen_beacon")
 
+                    candidates = []
                     for card in job_cards:
                         title_elem = card.select_one("h2.jobTitle span")
                         company_elem = card.select_one("span.companyName")
@@ -162,28 +189,17 @@ class JobCrawler:
                         url = f"https://www.indeed.com{link_elem.get('href')}"
                         description = snippet_elem.get_text(" ", strip=True) if snippet_elem else title
 
-                        job_data = {
-                            "title": title,
-                            "company": company,
-                            "location": location_text,
-                            "description": description,
-                            "url": url,
-                            "source": "Indeed",
-                        }
-
-                        score, keywords_matched = self.calculate_relevance_score(job_data)
-                        if score > 0:
-                            job_hash = Job.generate_hash(title, company, url, "Indeed")
-                            jobs.append(
-                                JobCreate(
-                                    **job_data,
-                                    job_hash=job_hash,
-                                    relevance_score=score,
-                                    keywords_matched=keywords_matched,
-                                )
-                            )
-                            if len(jobs) >= self.max_jobs:
-                                break
+                        candidates.append(
+                            {
+                                "title": title,
+                                "company": company,
+                                "location": location_text,
+                                "description": description,
+                                "url": url,
+                                "source": "Indeed",
+                            }
+                        )
+                    jobs.extend(self._relevant_jobs(candidates)[: self.max_jobs - len(jobs)])
                     time.sleep(2)
         except Exception as exc:
             logger.error("Error crawling Indeed: %s", exc)
@@ -218,6 +234,7 @@ class JobCrawler:
                     continue
 
                 data = response.json()
+                candidates = []
                 for job in data.get("jobs", []):
                     title = job.get("title", "").strip()
                     absolute_url = job.get("absolute_url") or job.get("url") or board_url
@@ -228,30 +245,19 @@ class JobCrawler:
                     company_name = job.get("company", {}).get("name") or board_name
                     post_date = job.get("updated_at") or job.get("created_at")
 
-                    job_data = {
-                        "title": title,
-                        "company": company_name,
-                        "location": location,
-                        "description": description,
-                        "url": absolute_url,
-                        "source": "Greenhouse",
-                        "source_detail": board_name,
-                        "post_date": post_date,
-                    }
-
-                    score, keywords_matched = self.calculate_relevance_score(job_data)
-                    if score > 0:
-                        job_hash = Job.generate_hash(title, company_name, absolute_url, "Greenhouse")
-                        jobs.append(
-                            JobCreate(
-                                **job_data,
-                                job_hash=job_hash,
-                                relevance_score=score,
-                                keywords_matched=keywords_matched,
-                            )
-                        )
-                        if len(jobs) >= self.max_jobs:
-                            break
+                    candidates.append(
+                        {
+                            "title": title,
+                            "company": company_name,
+                            "location": location,
+                            "description": description,
+                            "url": absolute_url,
+                            "source": "Greenhouse",
+                            "source_detail": board_name,
+                            "post_date": post_date,
+                        }
+                    )
+                jobs.extend(self._relevant_jobs(candidates)[: self.max_jobs - len(jobs)])
                 time.sleep(1)
             except Exception as exc:
                 logger.error("Error crawling Greenhouse board %s: %s", board_name, exc)
@@ -277,6 +283,7 @@ class JobCrawler:
             if channel is None:
                 return jobs
 
+            candidates = []
             for item in channel.findall("item")[: self.max_jobs]:
                 title_text = item.findtext("title", default="").strip()
                 link = item.findtext("link", default=feed_url).strip()
@@ -291,27 +298,18 @@ class JobCrawler:
                     company = parts[0].strip() or company
                     job_title = parts[1].strip() or job_title
 
-                job_data = {
-                    "title": job_title,
-                    "company": company,
-                    "location": "Remote",
-                    "description": description or job_title,
-                    "url": link or feed_url,
-                    "source": "WeWorkRemotely",
-                    "post_date": pub_date,
-                }
-
-                score, keywords_matched = self.calculate_relevance_score(job_data)
-                if score > 0:
-                    job_hash = Job.generate_hash(job_title, company, job_data["url"], "WeWorkRemotely")
-                    jobs.append(
-                        JobCreate(
-                            **job_data,
-                            job_hash=job_hash,
-                            relevance_score=score,
-                            keywords_matched=keywords_matched,
-                        )
-                    )
+                candidates.append(
+                    {
+                        "title": job_title,
+                        "company": company,
+                        "location": "Remote",
+                        "description": description or job_title,
+                        "url": link or feed_url,
+                        "source": "WeWorkRemotely",
+                        "post_date": pub_date,
+                    }
+                )
+            jobs = self._relevant_jobs(candidates)
 
             logger.info("WeWorkRemotely RSS: Found %s relevant jobs", len(jobs))
         except Exception as exc:
@@ -50,10 +50,18 @@ def ensure_columns(engine_to_use=None):
             conn.execute(text("ALTER TABLE jobs ADD COLUMN job_fingerprint VARCHAR"))
         if "last_seen_at" not in columns:
             conn.execute(text("ALTER TABLE jobs ADD COLUMN last_seen_at DATETIME"))
+        if "duplicate_group_id" not in columns:
+            conn.execute(text("ALTER TABLE jobs ADD COLUMN duplicate_group_id VARCHAR"))
+        if "lsh_bands" not in columns:
+            conn.execute(text("ALTER TABLE jobs ADD COLUMN lsh_bands TEXT"))
+        if "semantic_score" not in columns:
+            conn.execute(text("ALTER TABLE jobs ADD COLUMN semantic_score FLOAT"))
         result_runs = conn.execute(text("PRAGMA table_info(crawl_runs)"))
         run_cols = {row[1] for row in result_runs}
         if "source_metrics" not in run_cols:
             conn.execute(text("ALTER TABLE crawl_runs ADD COLUMN source_metrics TEXT"))
+        if "heartbeat_at" not in run_cols:
+            conn.execute(text("ALTER TABLE crawl_runs ADD COLUMN heartbeat_at DATETIME"))
 
 
 def ensure_indexes(engine_to_use=None):
@@ -62,11 +70,39 @@ def ensure_indexes(engine_to_use=None):
     with eng.connect() as conn:
         conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_job_hash ON jobs(job_hash);"))
         conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_job_key ON jobs(job_key);"))
-        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_jobs_relevance_score ON jobs(relevance_score);"))
         conn.execute(text("CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs(created_at);"))
-        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_jobs_applied ON jobs(applied);"))
-        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source);"))
-        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_crawl_runs_started_at ON crawl_runs(started_at);"))
+        # /api/jobs shapes: an equality filter, then the listing order
+        # (relevance_score, created_at, rowid), so LIMIT stops early with no sort
+        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_jobs_applied_rank ON jobs(applied, relevance_score, created_at);"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_jobs_source_rank ON jobs(source, relevance_score, created_at);"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_jobs_remote_rank ON jobs(remote, relevance_score, created_at);"))
+        # the triage view: one source's jobs not applied to yet
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_unapplied_source_rank "
+                "ON jobs(source, relevance_score, created_at) WHERE applied = 0;"
+            )
+        )
+        # NearDuplicateIndex.load: recently seen jobs that have LSH bands
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_lsh_recent "
+                "ON jobs(COALESCE(last_seen_at, created_at)) WHERE lsh_bands IS NOT NULL;"
+            )
+        )
+        # superseded by the composites above, which share their leading column
+        conn.execute(text("DROP INDEX IF EXISTS idx_jobs_applied;"))
+        conn.execute(text("DROP INDEX IF EXISTS idx_jobs_source;"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_jobs_duplicate_group_id ON jobs(duplicate_group_id);"))
+        # same column as idx_jobs_duplicate_group_id; older create_all() schemas built both
+        conn.execute(text("DROP INDEX IF EXISTS ix_jobs_duplicate_group_id;"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_jobs_job_fingerprint ON jobs(job_fingerprint);"))
+        # keyset pagination: (relevance_score, created_at, id) / (started_at, run_id)
+        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_jobs_relevance_created ON jobs(relevance_score, created_at);"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_crawl_runs_started_run ON crawl_runs(started_at, run_id);"))
+        # prefixes of idx_jobs_relevance_created / idx_crawl_runs_started_run
+        conn.execute(text("DROP INDEX IF EXISTS idx_jobs_relevance_score;"))
+        conn.execute(text("DROP INDEX IF EXISTS idx_crawl_runs_started_at;"))
 
 
 def ensure_schema(engine_to_use=None):
@@ -74,3 +110,11 @@ def ensure_schema(engine_to_use=None):
     ensure_indexes(engine_to_use)
     from backend.crawl_engine.state import ensure_state_table
     ensure_state_table(engine_to_use or engine)
+    from backend.search import ensure_search_index
+    ensure_search_index(engine_to_use or engine)
+    from backend.job_counters import ensure_job_counters
+    ensure_job_counters(engine_to_use or engine)
+    from backend.settings_store import ensure_settings_version
+    ensure_settings_version(engine_to_use or engine)
+    from backend.embedding_store import ensure_embedding_table
+    ensure_embedding_table(engine_to_use or engine)
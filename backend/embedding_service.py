@@ -0,0 +1,250 @@
+"""Optional local embedding daemon shared by the API, scheduler and runner.
+
+One process loads the model and serves encode requests over a Unix
+socket; requests arriving from concurrent callers within
+``NLP_SERVICE_MAX_WAIT_MS`` are merged into a single forward pass of up to
+``NLP_SERVICE_MAX_BATCH`` texts. When ``NLP_SERVICE_SOCKET`` points at a
+running daemon, ``get_nlp_scorer`` uses an ``EmbeddingClient`` instead of
+loading its own model.
+
+    python -m backend.embedding_service [--socket /tmp/jobcrawler-embed.sock]
+
+Wire format: every message is a 4-byte big-endian length plus payload.
+Requests are JSON (``{"op": "encode", "texts": [...]}`` or
+``{"op": "info"}``); an encode reply is a JSON header ``{"n", "dim"}``
+followed by one frame of float32 row-major embeddings.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import queue
+import socket
+import socketserver
+import struct
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Sequence
+
+import numpy as np
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct(">I")
+
+
+def _send_frame(sock: socket.socket, payload: bytes) -> None:
+    sock.sendall(_HEADER.pack(len(payload)) + payload)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ConnectionError("embedding service connection closed")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _recv_frame(sock: socket.socket) -> bytes:
+    (size,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    return _recv_exact(sock, size)
+
+
+class _DynamicBatcher:
+    """Merges concurrent encode requests into model-sized batches."""
+
+    def __init__(self, encoder, max_batch: int, max_wait_ms: float):
+        self.encoder = encoder
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.requests: "queue.Queue[tuple[List[str], Future]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, name="embedding-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, texts: List[str]) -> np.ndarray:
+        future: Future = Future()
+        self.requests.put((texts, future))
+        return future.result()
+
+    def _loop(self) -> None:
+        while True:
+            pending = [self.requests.get()]
+            size = len(pending[0][0])
+            deadline = time.monotonic() + self.max_wait
+            while size < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self.requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                pending.append(item)
+                size += len(item[0])
+            self._run(pending)
+
+    def _run(self, pending: List[tuple[List[str], Future]]) -> None:
+        texts = [text for chunk, _ in pending for text in chunk]
+        try:
+            embeddings = self.encoder.encode(
+                texts,
+                batch_size=self.max_batch,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False,
+            )
+        except Exception as exc:
+            for _, future in pending:
+                future.set_exception(exc)
+            return
+        start = 0
+        for chunk, future in pending:
+            future.set_result(np.asarray(embeddings[start : start + len(chunk)], dtype=np.float32))
+            start += len(chunk)
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    server: "EmbeddingServer"
+
+    def handle(self) -> None:
+        while True:
+            try:
+                request = json.loads(_recv_frame(self.request))
+            except (ConnectionError, OSError):
+                return
+            try:
+                if request.get("op") == "info":
+                    _send_frame(self.request, json.dumps(self.server.info).encode())
+                    continue
+                texts = [str(t) for t in request.get("texts", [])]
+                embeddings = self.server.batcher.submit(texts) if texts else np.zeros((0, self.server.info["dim"]))
+                header = {"n": int(embeddings.shape[0]), "dim": int(embeddings.shape[1])}
+                _send_frame(self.request, json.dumps(header).encode())
+                _send_frame(self.request, np.ascontiguousarray(embeddings, dtype=np.float32).tobytes())
+            except (ConnectionError, OSError):
+                return
+            except Exception as exc:
+                logger.error("Embedding request failed: %s", exc)
+                _send_frame(self.request, json.dumps({"error": str(exc)}).encode())
+
+
+class EmbeddingServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, encoder, model_id: str, max_batch: int = 64, max_wait_ms: float = 5.0):
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        super().__init__(socket_path, _Handler)
+        os.chmod(socket_path, 0o600)
+        self.socket_path = socket_path
+        self.batcher = _DynamicBatcher(encoder, max_batch, max_wait_ms)
+        dim = encoder.encode(["dimension probe"], normalize_embeddings=True).shape[1]
+        self.info = {"model_id": model_id, "dim": int(dim)}
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+class EmbeddingClient:
+    """``SentenceTransformer.encode``-compatible client for the embedding daemon.
+
+    Embeddings are always unit-normalized. One connection per thread.
+    """
+
+    def __init__(self, socket_path: str, timeout: float = 60.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._local = threading.local()
+        self.info = self._request({"op": "info"})
+        self.model_id: str = self.info["model_id"]
+
+    def _connection(self) -> socket.socket:
+        sock = getattr(self._local, "sock", None)
+        if sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            self._local.sock = sock
+        return sock
+
+    def _drop_connection(self) -> None:
+        sock = getattr(self._local, "sock", None)
+        if sock is not None:
+            sock.close()
+            self._local.sock = None
+
+    def _request(self, payload: dict, expect_body: bool = False):
+        # one retry on a fresh connection covers daemon restarts
+        for attempt in range(2):
+            try:
+                sock = self._connection()
+                _send_frame(sock, json.dumps(payload).encode())
+                header = json.loads(_recv_frame(sock))
+                if "error" in header:
+                    raise RuntimeError(f"embedding service error: {header['error']}")
+                if not expect_body:
+                    return header
+                body = _recv_frame(sock)
+                return np.frombuffer(body, dtype=np.float32).reshape(header["n"], header["dim"])
+            except (ConnectionError, OSError):
+                self._drop_connection()
+                if attempt:
+                    raise
+
+    def encode(
+        self,
+        texts: Sequence[str],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = True,
+        show_progress_bar: bool = False,
+    ) -> np.ndarray:
+        return self._request({"op": "encode", "texts": list(texts)}, expect_body=True)
+
+
+def connect_embedding_service(socket_path: str | None = None) -> EmbeddingClient | None:
+    """Return a client if a daemon is listening on ``socket_path``, else None."""
+    path = socket_path or settings.NLP_SERVICE_SOCKET
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        return EmbeddingClient(path)
+    except (ConnectionError, OSError, RuntimeError) as exc:
+        logger.warning("Embedding service at %s unavailable, loading model locally: %s", path, exc)
+        return None
+
+
+def serve(socket_path: str) -> None:
+    from .nlp import embedding_model_id, load_encoder
+
+    encoder = load_encoder(settings.NLP_MODEL_NAME, settings.NLP_BACKEND)
+    server = EmbeddingServer(
+        socket_path,
+        encoder,
+        embedding_model_id(settings.NLP_MODEL_NAME, settings.NLP_BACKEND),
+        max_batch=settings.NLP_SERVICE_MAX_BATCH,
+        max_wait_ms=settings.NLP_SERVICE_MAX_WAIT_MS,
+    )
+    logger.info("Embedding service for %s listening on %s", server.info["model_id"], socket_path)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve sentence embeddings over a Unix socket.")
+    parser.add_argument("--socket", default=settings.NLP_SERVICE_SOCKET or "/tmp/jobcrawler-embed.sock")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    serve(args.socket)
@@ -0,0 +1,144 @@
+"""Persistent embeddings keyed by a hash of the exact text encoded and the model.
+
+``NLPScorer`` hashes every text it is about to encode (``text_key``),
+looks the hashes up here first and queues the vectors it had to compute.
+Identical input always yields the identical vector for a model, so a hit
+can never be stale, whichever job, profile or code path the text came
+from. Vectors are kept as float16 in ``job_embeddings``.
+
+Writes are queued in memory and written by ``flush`` once the caller has
+committed: lookups happen in the middle of crawl and re-score
+transactions, and a second connection writing then would wait on their
+lock for up to ``busy_timeout``. Hits refresh ``last_used_at``;
+``prune_embeddings`` drops vectors unused for ``EMBEDDING_CACHE_TTL_DAYS``.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable
+
+import numpy as np
+from sqlalchemy import text, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from .config import settings
+from .models import JobEmbedding
+
+logger = logging.getLogger(__name__)
+
+LOOKUP_CHUNK_SIZE = 500
+
+
+def text_key(value: str) -> str:
+    """Cache key for one encoder input (the model is the other half of the key)."""
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def ensure_embedding_table(engine) -> None:
+    """Replace a ``job_embeddings`` table from the fingerprint-keyed layout.
+
+    Its vectors were keyed by the dedupe fingerprint rather than the text
+    encoded, so none of them can be trusted; the cache refills on use.
+    """
+    with engine.begin() as conn:
+        columns = {row[1] for row in conn.execute(text("PRAGMA table_info(job_embeddings)"))}
+        if columns and "text_hash" not in columns:
+            conn.execute(text("DROP TABLE job_embeddings"))
+    JobEmbedding.__table__.create(bind=engine, checkfirst=True)
+    with engine.begin() as conn:
+        conn.execute(
+            text("CREATE INDEX IF NOT EXISTS idx_job_embeddings_last_used ON job_embeddings(last_used_at)")
+        )
+
+
+class EmbeddingStore:
+    def __init__(self, session_factory: Callable[[], Session], model_name: str):
+        self.session_factory = session_factory
+        self.model_name = model_name
+        self._lock = threading.Lock()
+        self._pending: Dict[str, np.ndarray] = {}
+        self._used: set[str] = set()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+        wanted = list(dict.fromkeys(key for key in keys if key))
+        found: Dict[str, np.ndarray] = {}
+        if not wanted:
+            return found
+        with self._lock:
+            for key in wanted:
+                if key in self._pending:
+                    found[key] = self._pending[key]
+        missing = [key for key in wanted if key not in found]
+        with self.session_factory() as db:
+            for start in range(0, len(missing), LOOKUP_CHUNK_SIZE):
+                rows = db.query(JobEmbedding.text_hash, JobEmbedding.vector).filter(
+                    JobEmbedding.model_name == self.model_name,
+                    JobEmbedding.text_hash.in_(missing[start : start + LOOKUP_CHUNK_SIZE]),
+                )
+                for key, vector in rows:
+                    found[key] = np.frombuffer(vector, dtype=np.float16).astype(np.float32)
+        with self._lock:
+            self._used.update(key for key in found if key not in self._pending)
+        return found
+
+    def put_many(self, vectors: Dict[str, np.ndarray]) -> None:
+        """Queue vectors for the next ``flush``."""
+        if not vectors:
+            return
+        with self._lock:
+            self._pending.update(vectors)
+
+    def flush(self) -> int:
+        """Write queued vectors and last-use times; call after the caller's commit."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            used, self._used = self._used, set()
+        if not pending and not used:
+            return 0
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "text_hash": key,
+                "model_name": self.model_name,
+                "dim": int(vector.shape[0]),
+                "vector": np.asarray(vector, dtype=np.float16).tobytes(),
+                "last_used_at": now,
+            }
+            for key, vector in pending.items()
+        ]
+        used_keys = sorted(used)
+        try:
+            with self.session_factory() as db:
+                if rows:
+                    db.execute(insert(JobEmbedding).on_conflict_do_nothing(), rows)
+                for start in range(0, len(used_keys), LOOKUP_CHUNK_SIZE):
+                    db.execute(
+                        update(JobEmbedding)
+                        .where(
+                            JobEmbedding.model_name == self.model_name,
+                            JobEmbedding.text_hash.in_(used_keys[start : start + LOOKUP_CHUNK_SIZE]),
+                        )
+                        .values(last_used_at=now)
+                    )
+                db.commit()
+        except Exception:
+            # keep the vectors for the next flush rather than re-encoding them
+            with self._lock:
+                self._pending = {**pending, **self._pending}
+            raise
+        return len(rows)
+
+
+def prune_embeddings(db: Session, max_age_days: int | None = None) -> int:
+    """Delete embeddings not used within ``max_age_days`` (``EMBEDDING_CACHE_TTL_DAYS``)."""
+    days = settings.EMBEDDING_CACHE_TTL_DAYS if max_age_days is None else max_age_days
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    result = db.execute(JobEmbedding.__table__.delete().where(JobEmbedding.last_used_at < cutoff))
+    db.commit()
+    if result.rowcount:
+        logger.info("Pruned %d cached embeddings unused for %d days", result.rowcount, days)
+    return result.rowcount
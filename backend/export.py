@@ -0,0 +1,112 @@
+"""Streaming export of the jobs table as NDJSON or CSV.
+
+``/api/jobs/export`` takes the listing's filters but no page size: rows are
+read from one SQLite cursor with ``yield_per`` and encoded
+``EXPORT_BATCH_SIZE`` at a time. Memory stays constant however many rows
+match. The stream owns its Session because it is consumed after the
+request handler has returned.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List
+
+from sqlalchemy.orm import Query, Session
+
+from .models import Job
+
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+EXPORT_COLUMNS: Dict[str, object] = {
+    "id": Job.id,
+    "job_key": Job.job_key,
+    "title": Job.title,
+    "company": Job.company,
+    "location": Job.location,
+    "url": Job.url,
+    "source": Job.source,
+    "source_detail": Job.source_detail,
+    "post_date": Job.post_date,
+    "remote": Job.remote,
+    "relevance_score": Job.relevance_score,
+    "keywords_matched": Job.keywords_matched,
+    "duplicate_group_id": Job.duplicate_group_id,
+    "applied": Job.applied,
+    "notes": Job.notes,
+    "created_at": Job.created_at,
+    "updated_at": Job.updated_at,
+    "last_seen_at": Job.last_seen_at,
+    "description": Job.description,
+    "requirements": Job.requirements,
+    "source_meta": Job.source_meta,
+}
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _source_meta(value):
+    if not value:
+        return None
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def encode_ndjson(names: List[str], rows: Iterable) -> Iterator[str]:
+    """One JSON object per line; ``source_meta`` is embedded as an object."""
+    meta = names.index("source_meta") if "source_meta" in names else None
+    batch = []
+    for row in rows:
+        values = list(row)
+        if meta is not None:
+            values[meta] = _source_meta(values[meta])
+        batch.append(json.dumps(dict(zip(names, values)), default=_json_default, ensure_ascii=False))
+        if len(batch) == EXPORT_BATCH_SIZE:
+            yield "\n".join(batch) + "\n"
+            batch = []
+    if batch:
+        yield "\n".join(batch) + "\n"
+
+
+def encode_csv(names: List[str], rows: Iterable) -> Iterator[str]:
+    """Header row, then one record per job; ``source_meta`` stays JSON text."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(names)
+    pending = 0
+    for row in rows:
+        writer.writerow([value.isoformat() if isinstance(value, datetime) else value for value in row])
+        pending += 1
+        if pending == EXPORT_BATCH_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue()
+
+
+_ENCODERS = {"ndjson": encode_ndjson, "csv": encode_csv}
+
+
+def stream_export(bind, query: Query, columns: Dict[str, object], fmt: str) -> Iterator[bytes]:
+    """Encode ``query`` (filtered and ordered, not yet projected) with its own Session."""
+    session = Session(bind=bind)
+    try:
+        rows = query.with_session(session).with_entities(*columns.values()).yield_per(EXPORT_BATCH_SIZE)
+        for chunk in _ENCODERS[fmt](list(columns), rows):
+            yield chunk.encode("utf-8")
+    finally:
+        session.close()
@@ -0,0 +1,149 @@
+"""Validator-based caching for the polled read endpoints.
+
+Every database has a data version that writers bump after committing
+(``bump_data_version``): the crawl engine and runner, ``update_job``,
+re-scoring and profile changes. Versions come from one process-wide
+counter, so a version is never reused, not even by another engine. For a
+file-backed SQLite database the version also includes the size and mtime
+of the database and its WAL, which picks up commits made by another
+process such as ``python -m backend.runner``.
+
+A response's ETag hashes the version with the path and query string. A
+matching ``If-None-Match`` gets a 304 before the listing query runs.
+Endpoints validate their parameters first without building the listing
+(``/api/jobs`` looks up a named profile, nothing more), so a malformed
+request gets its 400 or 404 instead of a 304. Rendered
+bodies for the current version are kept in a small LRU, so several
+dashboards polling the same URL render it once per version.
+"""
+from __future__ import annotations
+
+import hashlib
+import itertools
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from sqlalchemy.orm import Session
+
+from .config import settings
+
+_counter = itertools.count(1)
+_versions: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def _bind(db):
+    return db.get_bind() if isinstance(db, Session) else db
+
+
+def bump_data_version(db) -> None:
+    """Mark data behind ``db`` (a Session or engine) as changed; call after commit."""
+    bind = _bind(db)
+    with _lock:
+        _versions[bind] = next(_counter)
+
+
+def _file_stamp(bind) -> str:
+    database = bind.url.database if bind.url.get_backend_name() == "sqlite" else None
+    if not database or database == ":memory:":
+        return ""
+    stamp = []
+    for path in (database, database + "-wal"):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        stamp.append(f"{stat.st_size}.{stat.st_mtime_ns}")
+    return ":".join(stamp)
+
+
+def data_version(db) -> str:
+    bind = _bind(db)
+    with _lock:
+        version = _versions.get(bind)
+        if version is None:
+            version = _versions[bind] = next(_counter)
+    return f"{version}:{_file_stamp(bind)}"
+
+
+class ResponseCache:
+    """LRU of rendered bodies, keyed by ETag; emptied when the data version moves on."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[bytes, Dict[str, str]]]" = OrderedDict()
+        self._version: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def get(self, version: str, etag: str) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        with self._lock:
+            if version != self._version:
+                return None
+            entry = self._entries.get(etag)
+            if entry is not None:
+                self._entries.move_to_end(etag)
+            return entry
+
+    def put(self, version: str, etag: str, body: bytes, headers: Dict[str, str]) -> None:
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            self._entries[etag] = (body, headers)
+            self._entries.move_to_end(etag)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+
+
+response_cache = ResponseCache(settings.RESPONSE_CACHE_SIZE)
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+class CachedRequest:
+    """Resolve a GET from its validators or the response cache, else render it once.
+
+    Create it after validating the request's parameters. ``response`` is
+    set when no rendering is needed (304 or a cached body); otherwise build
+    the content and return ``finish(...)``.
+    """
+
+    def __init__(self, request: Request, db):
+        self.version = data_version(db)
+        query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        digest = hashlib.blake2b(
+            f"{self.version}|{request.url.path}?{query}".encode(), digest_size=16
+        ).hexdigest()
+        self.etag = f'"{digest}"'
+        self.response: Optional[Response] = None
+        if _etag_matches(request.headers.get("if-none-match"), self.etag):
+            self.response = Response(status_code=304, headers=self._headers({}))
+            return
+        hit = response_cache.get(self.version, self.etag)
+        if hit is not None:
+            body, headers = hit
+            self.response = Response(body, media_type="application/json", headers=self._headers(headers))
+
+    def _headers(self, extra: Dict[str, str]) -> Dict[str, str]:
+        return {**extra, "ETag": self.etag, "Cache-Control": "no-cache"}
+
+    def finish(self, content, adapter, headers: Optional[Dict[str, str]] = None, **dump_options) -> Response:
+        """Serialize ``content`` with the endpoint's ``TypeAdapter``, cache it and return it."""
+        body = adapter.dump_json(adapter.validate_python(content, from_attributes=True), **dump_options)
+        headers = headers or {}
+        response_cache.put(self.version, self.etag, body, headers)
+        return Response(body, media_type="application/json", headers=self._headers(headers))
@@ -0,0 +1,147 @@
+"""Job totals for ``/api/stats`` and crawl accounting without table scans.
+
+``job_counters`` holds the number of jobs overall, applied, remote and per
+source. SQLite triggers on ``jobs`` adjust it in the same transaction as
+every insert, delete and change of ``applied``/``remote``/``source``,
+whichever code path writes the row, so reading the totals is a lookup of a
+handful of rows. Databases without the triggers (not SQLite, or never
+migrated) have no ``total`` row and fall back to ``COUNT`` queries.
+
+    python -m backend.job_counters    # rebuild from jobs and report drift
+"""
+from __future__ import annotations
+
+import logging
+from typing import Dict
+
+from sqlalchemy import func, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from .models import Job, JobCounter
+
+logger = logging.getLogger(__name__)
+
+SOURCE_PREFIX = "source:"
+
+_UPSERT = "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value"
+
+_TRIGGERS = {
+    "job_counters_ai": (
+        "AFTER INSERT ON jobs BEGIN "
+        "INSERT INTO job_counters(name, value) VALUES "
+        "('total', 1), ('applied', coalesce(new.applied, 0)), ('remote', coalesce(new.remote, 0)), "
+        f"('{SOURCE_PREFIX}' || coalesce(new.source, ''), 1) {_UPSERT}; END"
+    ),
+    "job_counters_ad": (
+        "AFTER DELETE ON jobs BEGIN "
+        "INSERT INTO job_counters(name, value) VALUES "
+        "('total', -1), ('applied', -coalesce(old.applied, 0)), ('remote', -coalesce(old.remote, 0)), "
+        f"('{SOURCE_PREFIX}' || coalesce(old.source, ''), -1) {_UPSERT}; END"
+    ),
+    # score/content updates during crawls and re-scores do not fire this
+    "job_counters_au": (
+        "AFTER UPDATE OF applied, remote, source ON jobs BEGIN "
+        "INSERT INTO job_counters(name, value) VALUES "
+        "('applied', coalesce(new.applied, 0) - coalesce(old.applied, 0)), "
+        "('remote', coalesce(new.remote, 0) - coalesce(old.remote, 0)), "
+        f"('{SOURCE_PREFIX}' || coalesce(old.source, ''), -1), "
+        f"('{SOURCE_PREFIX}' || coalesce(new.source, ''), 1) {_UPSERT}; END"
+    ),
+}
+
+_REBUILD = (
+    "INSERT INTO job_counters(name, value) "
+    "SELECT 'total', count(*) FROM jobs "
+    "UNION ALL SELECT 'applied', coalesce(sum(applied), 0) FROM jobs "
+    "UNION ALL SELECT 'remote', coalesce(sum(remote), 0) FROM jobs "
+    f"UNION ALL SELECT '{SOURCE_PREFIX}' || coalesce(source, ''), count(*) FROM jobs GROUP BY source"
+)
+
+
+def ensure_job_counters(engine) -> bool:
+    """Create the counter triggers; fill ``job_counters`` when they are new."""
+    if engine.url.get_backend_name() != "sqlite":
+        return False
+    try:
+        with engine.begin() as conn:
+            existing = {
+                row[0]
+                for row in conn.execute(
+                    text("SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'job_counters_%'")
+                )
+            }
+            for name, body in _TRIGGERS.items():
+                conn.execute(text(f"CREATE TRIGGER IF NOT EXISTS {name} {body}"))
+            if existing != set(_TRIGGERS):
+                # same transaction as the triggers: no insert can slip in between
+                conn.execute(text("DELETE FROM job_counters"))
+                conn.execute(text(_REBUILD))
+    except OperationalError as exc:
+        logger.warning("Job counters unavailable, stats will count rows: %s", exc)
+        return False
+    return True
+
+
+def _read(db: Session) -> Dict[str, int]:
+    return dict(db.query(JobCounter.name, JobCounter.value).all())
+
+
+def rebuild_job_counters(db: Session) -> Dict[str, tuple]:
+    """Recompute every counter from ``jobs``; returns ``{name: (was, now)}`` for drifted ones."""
+    before = _read(db)
+    db.execute(text("DELETE FROM job_counters"))
+    db.execute(text(_REBUILD))
+    db.commit()
+    after = _read(db)
+    return {
+        name: (before.get(name, 0), after.get(name, 0))
+        for name in before.keys() | after.keys()
+        if before.get(name, 0) != after.get(name, 0)
+    }
+
+
+def job_stats(db: Session) -> dict:
+    """Totals for ``/api/stats``: overall, applied, pending, remote and per source."""
+    counters = _read(db)
+    if "total" in counters:
+        total = counters["total"]
+        applied = counters.get("applied", 0)
+        remote = counters.get("remote", 0)
+        sources = {
+            (name[len(SOURCE_PREFIX):] or None): value
+            for name, value in counters.items()
+            if name.startswith(SOURCE_PREFIX) and value
+        }
+    else:
+        total = db.query(Job).count()
+        applied = db.query(Job).filter(Job.applied == True).count()
+        remote = db.query(Job).filter(Job.remote == True).count()
+        sources = dict(db.query(Job.source, func.count(Job.id)).group_by(Job.source).all())
+    return {
+        "total_jobs": total,
+        "applied_jobs": applied,
+        "pending_jobs": total - applied,
+        "remote_jobs": remote,
+        "sources": sources,
+    }
+
+
+def job_total(db: Session) -> int:
+    total = db.query(JobCounter.value).filter(JobCounter.name == "total").scalar()
+    return total if total is not None else db.query(Job).count()
+
+
+if __name__ == "__main__":
+    from .database import SessionLocal, init_db
+
+    logging.basicConfig(level=logging.INFO)
+    init_db()
+    session = SessionLocal()
+    try:
+        drift = rebuild_job_counters(session)
+        for name, (was, now) in sorted(drift.items()):
+            logger.info("%s: %s -> %s", name, was, now)
+        logger.info("Rebuilt job counters (%d drifted)", len(drift))
+    finally:
+        session.close()
@@ -0,0 +1,80 @@
+"""Single-pass, word-boundary-aware keyword matching.
+
+``KeywordMatcher`` compiles a keyword list once into a trie-shaped regular
+expression, so the regex engine walks the text one time and branches on
+shared prefixes instead of re-scanning it per keyword. Matching is
+case-insensitive and only counts whole words/phrases ("AI" no longer hits
+"maintain"), while keywords such as "Node.js" or "C++" still match.
+"""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Sequence, Set, Tuple
+
+_WORD_CHAR = "a-z0-9"
+
+
+def _trie_pattern(node: dict) -> str:
+    end = "" in node
+    branches = [re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    # greedy optional prefers the longer keyword, backtracking to this one
+    return f"(?:{body})?" if end else body
+
+
+class KeywordMatcher:
+    def __init__(self, keywords: Sequence[str]):
+        self.canonical: Dict[str, str] = {}
+        for keyword in keywords:
+            lowered = keyword.strip().lower()
+            if lowered and lowered not in self.canonical:
+                self.canonical[lowered] = keyword
+        self.keywords: List[str] = list(self.canonical.values())
+
+        trie: dict = {}
+        for lowered in self.canonical:
+            node = trie
+            for ch in lowered:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+        # keywords that are whole-word prefixes of a longer keyword, e.g.
+        # "machine" inside "machine learning": the regex reports only the longest
+        self._reported: Dict[str, Tuple[str, ...]] = {
+            longer: tuple(
+                self.canonical[shorter]
+                for shorter in self.canonical
+                if longer.startswith(shorter)
+                and (shorter == longer or not re.match(f"[{_WORD_CHAR}]", longer[len(shorter)]))
+            )
+            for longer in self.canonical
+        }
+        self._pattern = (
+            re.compile(f"(?=(?<![{_WORD_CHAR}])({_trie_pattern(trie)})(?![{_WORD_CHAR}]))")
+            if self.canonical
+            else None
+        )
+
+    def find(self, text: str | None) -> Set[str]:
+        """Return the keywords (as configured) that occur in ``text``."""
+        if not text or self._pattern is None:
+            return set()
+        found: Set[str] = set()
+        for hit in set(self._pattern.findall(text.lower())):
+            found.update(self._reported[hit])
+        return found
+
+    def score(self, title: str | None, description: str | None) -> Tuple[float, List[str]]:
+        """2 points per keyword in the title, else 1 if in the description."""
+        in_title = self.find(title)
+        in_description = self.find(description) - in_title if len(in_title) < len(self.keywords) else set()
+        matched = [k for k in self.keywords if k in in_title or k in in_description]
+        return 2.0 * len(in_title) + 1.0 * len(in_description), matched
+
+
+@lru_cache(maxsize=32)
+def get_keyword_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """Compiled matcher for a keyword set, built once per distinct set."""
+    return KeywordMatcher(keywords)
@@ -0,0 +1,62 @@
+"""Column projection for the ``/api/jobs`` listing.
+
+The list only needs what a job card shows, so it selects those columns
+(and a short prefix of the description for the snippet) instead of
+hydrating full ``Job`` rows with their description HTML, requirements,
+notes and ``source_meta``. ``fields=`` narrows it further; the full record
+stays on ``/api/jobs/{id}``.
+"""
+from __future__ import annotations
+
+import re
+from typing import Dict, List
+
+from sqlalchemy import func
+
+from .models import Job
+
+SNIPPET_CHARS = 240
+# read a little more than the snippet so stripped markup does not shorten it
+_SNIPPET_SOURCE_CHARS = SNIPPET_CHARS * 2
+
+LIST_COLUMNS: Dict[str, object] = {
+    "id": Job.id,
+    "title": Job.title,
+    "company": Job.company,
+    "location": Job.location,
+    "url": Job.url,
+    "source": Job.source,
+    "remote": Job.remote,
+    "post_date": Job.post_date,
+    "relevance_score": Job.relevance_score,
+    "keywords_matched": Job.keywords_matched,
+    "duplicate_group_id": Job.duplicate_group_id,
+    "applied": Job.applied,
+    "created_at": Job.created_at,
+    "snippet": func.substr(Job.description, 1, _SNIPPET_SOURCE_CHARS),
+}
+# not columns of jobs: filled from the query (profile ranking)
+EXTRA_FIELDS = ("profile_score",)
+LIST_FIELDS = tuple(LIST_COLUMNS) + EXTRA_FIELDS
+
+_TAG_RE = re.compile(r"<[^>]*>?")
+
+
+def parse_fields(fields: str | None) -> List[str]:
+    """Requested list fields (``id`` always included); raises ValueError on unknown names."""
+    if not fields:
+        return list(LIST_FIELDS)
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = sorted(set(requested) - set(LIST_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return ["id"] + [name for name in dict.fromkeys(requested) if name != "id"]
+
+
+def make_snippet(description: str | None) -> str | None:
+    if not description:
+        return description
+    text = " ".join(_TAG_RE.sub(" ", description).split())
+    if len(text) <= SNIPPET_CHARS and len(description) < _SNIPPET_SOURCE_CHARS:
+        return text
+    return text[:SNIPPET_CHARS].rsplit(" ", 1)[0] + "…"
@@ -1,17 +1,43 @@
-from fastapi import FastAPI, Depends, HTTPException, Query
+from fastapi import BackgroundTasks, FastAPI, Depends, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from sqlalchemy import func, text
-from typing import List, Optional
+from sqlalchemy.exc import IntegrityError
+from typing import List, Literal, Optional
+import asyncio
 import json
 import logging
+import threading
 
 from .database import get_db, init_db
-from .models import CrawlRun, Job, Settings as SettingsModel
-from .schemas import JobResponse, JobUpdate, SettingsSchema, CrawlResult, CrawlRunSchema
+from .models import CrawlRun, Job, JobProfileScore, Profile, RescoreRun
+from .schemas import (
+    CrawlJobStatus,
+    CrawlRunSchema,
+    JobListItem,
+    JobResponse,
+    JobUpdate,
+    ProfileCreate,
+    ProfileResponse,
+    ProfileUpdate,
+    RescoreStatus,
+    SettingsSchema,
+)
 from .config import settings
 from .scheduler import start_scheduler
-from .crawl_runner import execute_crawl
+from .crawl_jobs import EVENT_POLL_SECONDS, KEEPALIVE_SECONDS, RUN_POLL_SECONDS, crawl_jobs, format_sse, stored_run_event
+from .nlp import embedding_model_id, get_nlp_scorer
+from .profiles import backfill_profile
+from .rescoring import latest_rescore, run_rescore, start_rescore, stored_keywords, stored_locations
+from .pagination import InvalidCursor, after, check_cursor, decode_cursor, encode_cursor, raw
+from .search import apply_search, search_score
+from .listing import LIST_COLUMNS, make_snippet, parse_fields
+from .export import EXPORT_COLUMNS, EXPORT_MEDIA_TYPES, stream_export
+from .http_cache import CachedRequest, bump_data_version
+from .job_counters import job_stats
+from .settings_store import get_settings_snapshot, init_default_settings, save_settings
 from .api_debug import router as debug_router
 from backend.crawl_engine.state import SourceState, get_cursor
 
@@ -43,9 +69,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 app.include_router(debug_router)
 
+# Handlers that use the database are plain ``def``: FastAPI runs them in its
+# threadpool, so one slow query does not stall every other request on the
+# event loop. Sessions from ``get_db`` may therefore cross threads, which
+# the engine allows (``check_same_thread=False``).
+_job_list_adapter = TypeAdapter(List[JobListItem])
+_run_list_adapter = TypeAdapter(List[CrawlRunSchema])
+_stats_adapter = TypeAdapter(dict)
+
 @app.on_event("startup")
 async def startup_event():
     init_db()
@@ -91,6 +126,17 @@ def _serialize_run(run: CrawlRun) -> CrawlRunSchema:
     )
 
 
+def _collapse_duplicate_groups(db: Session, query):
+    """Keep the highest ranked row of each duplicate group within the filtered set."""
+    group_key = func.coalesce(Job.duplicate_group_id, Job.job_key)
+    rank = func.row_number().over(
+        partition_by=group_key,
+        order_by=(Job.relevance_score.desc(), Job.created_at.desc(), Job.id.desc()),
+    )
+    ranked = query.with_entities(Job.id.label("id"), rank.label("group_rank")).subquery()
+    return db.query(Job).join(ranked, Job.id == ranked.c.id).filter(ranked.c.group_rank == 1)
+
+
 def _coerce_source_meta(job: Job):
     if job and isinstance(job.source_meta, str):
         try:
@@ -99,47 +145,8 @@ def _coerce_source_meta(job: Job):
             job.source_meta = None
     return job
 
-def init_default_settings(db: Session):
-    """Initialize default settings if they don't exist"""
-    keywords_setting = db.query(SettingsModel).filter(SettingsModel.key == "keywords").first()
-    if not keywords_setting:
-        keywords_setting = SettingsModel(
-            key="keywords",
-            value=json.dumps(settings.DEFAULT_KEYWORDS)
-        )
-        db.add(keywords_setting)
-    
-    locations_setting = db.query(SettingsModel).filter(SettingsModel.key == "locations").first()
-    if not locations_setting:
-        locations_setting = SettingsModel(
-            key="locations",
-            value=json.dumps(settings.DEFAULT_LOCATIONS)
-        )
-        db.add(locations_setting)
-    
-    sources_setting = db.query(SettingsModel).filter(SettingsModel.key == "sources").first()
-    if sources_setting and sources_setting.value:
-        stored_sources = json.loads(sources_setting.value)
-        merged_sources = settings.JOB_SOURCES.copy()
-        merged_sources.update(stored_sources)
-        sources_setting.value = json.dumps(merged_sources)
-    else:
-        sources_setting = SettingsModel(
-            key="sources",
-            value=json.dumps(settings.JOB_SOURCES)
-        )
-        db.add(sources_setting)
-    
-    schedule_setting = db.query(SettingsModel).filter(SettingsModel.key == "schedule").first()
-    if not schedule_setting:
-        schedule_setting = SettingsModel(
-            key="schedule",
-            value=json.dumps({"hour": settings.CRAWL_SCHEDULE_HOUR, "minute": settings.CRAWL_SCHEDULE_MINUTE})
-        )
-        db.add(schedule_setting)
-
 @app.get("/api/sources/state")
-async def get_sources_state(db: Session = Depends(get_db)):
+def get_sources_state(db: Session = Depends(get_db)):
     states = db.query(SourceState).all()
     latest_run = (
         db.query(CrawlRun)
@@ -169,71 +176,27 @@ async def get_sources_state(db: Session = Depends(get_db)):
         )
     return result
 
-    greenhouse_setting = db.query(SettingsModel).filter(SettingsModel.key == "greenhouse_boards").first()
-    if greenhouse_setting and greenhouse_setting.value:
-        try:
-            stored_boards = json.loads(greenhouse_setting.value)
-        except Exception:
-            stored_boards = settings.GREENHOUSE_BOARDS
-        greenhouse_setting.value = json.dumps(stored_boards or settings.GREENHOUSE_BOARDS)
-    else:
-        greenhouse_setting = SettingsModel(
-            key="greenhouse_boards",
-            value=json.dumps(settings.GREENHOUSE_BOARDS)
-        )
-        db.add(greenhouse_setting)
-
-    india_setting = db.query(SettingsModel).filter(SettingsModel.key == "india_mode").first()
-    if india_setting:
-        india_setting.value = json.dumps(settings.INDIA_MODE)
-    else:
-        india_setting = SettingsModel(key="india_mode", value=json.dumps(settings.INDIA_MODE))
-        db.add(india_setting)
 
-    linkedin_mode_setting = db.query(SettingsModel).filter(SettingsModel.key == "linkedin_mode").first()
-    if linkedin_mode_setting and linkedin_mode_setting.value:
-        linkedin_mode_setting.value = linkedin_mode_setting.value
-    else:
-        db.add(SettingsModel(key="linkedin_mode", value=json.dumps(settings.LINKEDIN_MODE)))
-
-    linkedin_email_setting = db.query(SettingsModel).filter(SettingsModel.key == "linkedin_email").first()
-    if linkedin_email_setting and linkedin_email_setting.value:
-        linkedin_email_setting.value = linkedin_email_setting.value
-    else:
-        db.add(SettingsModel(key="linkedin_email", value=json.dumps(settings.LINKEDIN_EMAIL)))
-
-    linkedin_crawl_setting = db.query(SettingsModel).filter(SettingsModel.key == "linkedin_crawl").first()
-    if linkedin_crawl_setting and linkedin_crawl_setting.value:
-        linkedin_crawl_setting.value = linkedin_crawl_setting.value
-    else:
-        db.add(SettingsModel(key="linkedin_crawl", value=json.dumps(settings.LINKEDIN_CRAWL)))
-    
-    db.commit()
-
-@app.get("/")
-async def root():
-    return {"message": "IT Job Search API", "version": "1.0.0"}
-
-@app.get("/api/jobs", response_model=List[JobResponse])
-async def get_jobs(
-    q: Optional[str] = Query(None, description="Search query"),
-    location: Optional[str] = Query(None, description="Filter by location"),
-    applied: Optional[bool] = Query(None, description="Filter by applied status"),
-    source: Optional[List[str]] = Query(None, description="Filter by source (repeat or comma-separated)"),
-    remote: Optional[bool] = Query(None, description="Filter remote roles"),
-    limit: int = Query(100, le=500),
-    offset: int = Query(0),
-    db: Session = Depends(get_db)
+def _filter_jobs(
+    db: Session,
+    q: Optional[str],
+    location: Optional[str],
+    applied: Optional[bool],
+    source: Optional[List[str]],
+    remote: Optional[bool],
+    collapse: bool,
+    profile: Optional[Profile],
 ):
-    """Get all jobs with optional filtering"""
+    """The ``/api/jobs`` filters: returns the query, its cursor kind and its sort keys (ranked first).
+
+    ``profile`` is the row from ``_find_profile``. With ``q`` this runs the
+    FTS hit count, so call it only once the response is known to be needed.
+    """
     query = db.query(Job)
-    
+    search_hits = None
+
     if q:
-        query = query.filter(
-            (Job.title.ilike(f"%{q}%")) | 
-            (Job.company.ilike(f"%{q}%")) |
-            (Job.description.ilike(f"%{q}%"))
-        )
+        query, search_hits = apply_search(db, query, q)
     
     if location:
         query = query.filter(Job.location.ilike(f"%{location}%"))
@@ -250,20 +213,167 @@ async def get_jobs(
 
     if remote is not None:
         query = query.filter(Job.remote == remote)
-    
-    jobs = query.order_by(Job.relevance_score.desc(), Job.created_at.desc()).offset(offset).limit(limit).all()
-    return [_coerce_source_meta(job) for job in jobs]
+
+    if collapse:
+        query = _collapse_duplicate_groups(db, query)
+        if search_hits is not None:
+            query = query.join(search_hits, search_hits.c.id == Job.id)
+
+    if profile is not None:
+        query = query.join(
+            JobProfileScore,
+            (JobProfileScore.job_key == Job.job_key) & (JobProfileScore.profile_id == profile.id),
+        )
+        kind, sort_keys = f"profile:{profile.id}", [JobProfileScore.score, raw(Job.created_at), Job.id]
+    elif search_hits is not None:
+        kind, sort_keys = "search", [search_score(search_hits), raw(Job.created_at), Job.id]
+    else:
+        kind, sort_keys = "jobs", [Job.relevance_score, raw(Job.created_at), Job.id]
+    return query, kind, sort_keys
+
+
+# every /api/jobs ordering is (rank, created_at, id)
+JOB_SORT_KEY_SIZE = 3
+
+
+def _find_profile(db: Session, name: Optional[str]) -> Optional[Profile]:
+    if not name:
+        return None
+    profile_row = db.query(Profile).filter(Profile.name == name).first()
+    if not profile_row:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return profile_row
+
+
+def _listing_cursor_kinds(profile_row: Optional[Profile], q: Optional[str]) -> tuple:
+    """Cursor kinds ``_filter_jobs`` can produce for these parameters, known without querying."""
+    if profile_row is not None:
+        return (f"profile:{profile_row.id}",)
+    # a search too broad for BM25 ranking pages like the plain listing
+    return ("search", "jobs") if q else ("jobs",)
+
+
+@app.get("/")
+async def root():
+    return {"message": "IT Job Search API", "version": "1.0.0"}
+
+@app.get("/api/jobs", response_model=List[JobListItem], response_model_exclude_unset=True)
+def get_jobs(
+    request: Request,
+    q: Optional[str] = Query(None, description="Search query"),
+    location: Optional[str] = Query(None, description="Filter by location"),
+    applied: Optional[bool] = Query(None, description="Filter by applied status"),
+    source: Optional[List[str]] = Query(None, description="Filter by source (repeat or comma-separated)"),
+    remote: Optional[bool] = Query(None, description="Filter remote roles"),
+    collapse: bool = Query(False, description="Return only the best-scoring job per duplicate group"),
+    profile: Optional[str] = Query(None, description="Rank by this named profile's score"),
+    limit: int = Query(100, le=500),
+    offset: int = Query(0),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page (replaces offset)"),
+    fields: Optional[str] = Query(None, description="Comma-separated list fields to return (id is always included)"),
+    db: Session = Depends(get_db)
+):
+    """Get all jobs with optional filtering.
+
+    Rows are compact list items (see ``JobListItem``); the full record is on
+    ``/api/jobs/{id}``. A full page sets ``X-Next-Cursor``; pass it back as
+    ``cursor`` for the next one. Responses carry an ETag (see ``http_cache``).
+    """
+    # only a valid request may be answered from its validators, but the
+    # search itself (FTS hit count included) waits for a cache miss
+    try:
+        field_names = parse_fields(fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    profile_row = _find_profile(db, profile)
+    if cursor:
+        try:
+            check_cursor(cursor, _listing_cursor_kinds(profile_row, q), JOB_SORT_KEY_SIZE)
+        except InvalidCursor as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+    cached = CachedRequest(request, db)
+    if cached.response is not None:
+        return cached.response
+
+    columns = [name for name in field_names if name in LIST_COLUMNS]
+    query, kind, sort_keys = _filter_jobs(db, q, location, applied, source, remote, collapse, profile_row)
+    if cursor:
+        try:
+            query = query.filter(after(sort_keys, decode_cursor(cursor, kind, len(sort_keys))))
+        except InvalidCursor as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+    rows = (
+        query.with_entities(*(LIST_COLUMNS[name] for name in columns), *sort_keys)
+        .order_by(*(key.desc() for key in sort_keys))
+        .offset(0 if cursor else offset)
+        .limit(limit)
+        .all()
+    )
+    with_profile_score = bool(profile) and "profile_score" in field_names
+    jobs = []
+    for row in rows:
+        item = dict(zip(columns, row))
+        if "snippet" in item:
+            item["snippet"] = make_snippet(item["snippet"])
+        if with_profile_score:
+            item["profile_score"] = row[len(columns)]
+        jobs.append(item)
+    headers = {}
+    if len(rows) == limit:
+        headers["X-Next-Cursor"] = encode_cursor(kind, tuple(rows[-1])[len(columns):])
+    return cached.finish(jobs, _job_list_adapter, headers, exclude_unset=True)
+
+@app.get("/api/jobs/export")
+def export_jobs(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="ndjson (one object per line) or csv"),
+    q: Optional[str] = Query(None, description="Search query"),
+    location: Optional[str] = Query(None, description="Filter by location"),
+    applied: Optional[bool] = Query(None, description="Filter by applied status"),
+    source: Optional[List[str]] = Query(None, description="Filter by source (repeat or comma-separated)"),
+    remote: Optional[bool] = Query(None, description="Filter remote roles"),
+    collapse: bool = Query(False, description="Return only the best-scoring job per duplicate group"),
+    profile: Optional[str] = Query(None, description="Rank by this named profile's score"),
+    db: Session = Depends(get_db),
+):
+    """Stream every job matching the ``/api/jobs`` filters, in the same order.
+
+    Full records (see ``export.EXPORT_COLUMNS``), plus ``profile_score`` when
+    ranking by a profile. Rows are streamed from one cursor, so any table
+    size exports in constant memory.
+    """
+    query, _, sort_keys = _filter_jobs(db, q, location, applied, source, remote, collapse, _find_profile(db, profile))
+    columns = dict(EXPORT_COLUMNS)
+    if profile:
+        columns["profile_score"] = JobProfileScore.score
+    query = query.order_by(*(key.desc() for key in sort_keys))
+    return StreamingResponse(
+        stream_export(db.get_bind(), query, columns, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="jobs.{format}"'},
+    )
 
 @app.get("/api/jobs/{job_id}", response_model=JobResponse)
-async def get_job(job_id: int, db: Session = Depends(get_db)):
+def get_job(
+    job_id: int,
+    profile: Optional[str] = Query(None, description="Include this named profile's score"),
+    db: Session = Depends(get_db),
+):
     """Get a specific job by ID"""
+    profile_row = _find_profile(db, profile)
     job = db.query(Job).filter(Job.id == job_id).first()
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    return _coerce_source_meta(job)
+    response = JobResponse.model_validate(_coerce_source_meta(job))
+    if profile_row is not None:
+        response.profile_score = (
+            db.query(JobProfileScore.score)
+            .filter(JobProfileScore.profile_id == profile_row.id, JobProfileScore.job_key == job.job_key)
+            .scalar()
+        )
+    return response
 
 @app.patch("/api/jobs/{job_id}", response_model=JobResponse)
-async def update_job(job_id: int, job_update: JobUpdate, db: Session = Depends(get_db)):
+def update_job(job_id: int, job_update: JobUpdate, db: Session = Depends(get_db)):
     """Update job (mark as applied, add notes)"""
     job = db.query(Job).filter(Job.id == job_id).first()
     if not job:
@@ -275,26 +385,167 @@ async def update_job(job_id: int, job_update: JobUpdate, db: Session = Depends(g
         job.notes = job_update.notes
     
     db.commit()
+    bump_data_version(db)
     db.refresh(job)
     return _coerce_source_meta(job)
 
-@app.post("/api/rescan", response_model=CrawlResult)
-async def rescan_jobs(db: Session = Depends(get_db)):
-    """Manually trigger job crawling"""
+def _backfill_profile_task(bind, profile_id: int) -> None:
+    """Score stored jobs for a new/changed profile from cached embeddings."""
+    scorer = get_nlp_scorer()
+    if scorer is None:
+        logger.warning("NLP scoring unavailable; profile %s not backfilled", profile_id)
+        return
+    db = Session(bind=bind)
     try:
-        return execute_crawl(db)
-    except Exception as e:
-        logger.error(f"Error during crawl: {e}")
-        raise HTTPException(status_code=500, detail=f"Crawl failed: {str(e)}")
+        profile = db.get(Profile, profile_id)
+        if profile:
+            backfill_profile(db, scorer, profile)
+    except Exception as exc:
+        db.rollback()
+        logger.error("Profile backfill failed for %s: %s", profile_id, exc)
+    finally:
+        db.close()
+
+
+@app.get("/api/profiles", response_model=List[ProfileResponse])
+def list_profiles(db: Session = Depends(get_db)):
+    """List named scoring profiles"""
+    return db.query(Profile).order_by(Profile.name).all()
+
+
+@app.post("/api/profiles", response_model=ProfileResponse, status_code=201)
+def create_profile(
+    profile_data: ProfileCreate, background_tasks: BackgroundTasks, db: Session = Depends(get_db)
+):
+    """Create a profile and score existing jobs against it in the background"""
+    if db.query(Profile).filter(Profile.name == profile_data.name).first():
+        raise HTTPException(status_code=409, detail="Profile already exists")
+    profile = Profile(name=profile_data.name, profile_text=profile_data.profile_text)
+    db.add(profile)
+    db.commit()
+    db.refresh(profile)
+    background_tasks.add_task(_backfill_profile_task, db.get_bind(), profile.id)
+    return profile
+
 
+@app.put("/api/profiles/{profile_id}", response_model=ProfileResponse)
+def update_profile(
+    profile_id: int,
+    profile_data: ProfileUpdate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
+    """Rename a profile or change its text (which re-scores its column)"""
+    profile = db.get(Profile, profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    if profile_data.name is not None:
+        profile.name = profile_data.name
+    text_changed = profile_data.profile_text is not None and profile_data.profile_text != profile.profile_text
+    if text_changed:
+        profile.profile_text = profile_data.profile_text
+        profile.embedding = None
+        profile.embedding_model = None
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Profile already exists")
+    bump_data_version(db)
+    db.refresh(profile)
+    if text_changed:
+        background_tasks.add_task(_backfill_profile_task, db.get_bind(), profile.id)
+    return profile
+
+
+@app.delete("/api/profiles/{profile_id}", status_code=204)
+def delete_profile(profile_id: int, db: Session = Depends(get_db)):
+    """Delete a profile and its scores"""
+    profile = db.get(Profile, profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    db.query(JobProfileScore).filter(JobProfileScore.profile_id == profile_id).delete()
+    db.delete(profile)
+    db.commit()
+    bump_data_version(db)
+
+
+_active_rescores: set[str] = set()
+_active_rescores_lock = threading.Lock()
+
+
+def _rescore_task(bind, run_id: str) -> None:
+    db = Session(bind=bind)
+    try:
+        scorer = get_nlp_scorer()
+        run = db.get(RescoreRun, run_id)
+        if run is None:
+            return
+        if scorer is None:
+            run.status = "failed"
+            run.error = "NLP scoring is not configured"
+            db.commit()
+            return
+        run_rescore(db, run, scorer, keywords=stored_keywords(db), locations=stored_locations(db))
+    finally:
+        with _active_rescores_lock:
+            _active_rescores.discard(run_id)
+        db.close()
+
+
+@app.post("/api/rescore", response_model=RescoreStatus, status_code=202)
+def start_rescore_job(
+    background_tasks: BackgroundTasks,
+    force: bool = Query(False, description="Re-score even if this profile/model already finished"),
+    db: Session = Depends(get_db),
+):
+    """Re-score stored jobs for the current profile text and model (resumes unfinished runs)"""
+    model_id = embedding_model_id(settings.NLP_MODEL_NAME, settings.NLP_BACKEND)
+    run = start_rescore(db, model_id, force=force, keywords=stored_keywords(db), locations=stored_locations(db))
+    if run.status != "done":
+        with _active_rescores_lock:
+            start = run.run_id not in _active_rescores
+            _active_rescores.add(run.run_id)
+        if start:
+            background_tasks.add_task(_rescore_task, db.get_bind(), run.run_id)
+    return run
+
+
+@app.get("/api/rescore", response_model=RescoreStatus)
+def get_latest_rescore(db: Session = Depends(get_db)):
+    """Progress of the most recent re-score"""
+    run = latest_rescore(db)
+    if not run:
+        raise HTTPException(status_code=404, detail="No re-score has run")
+    return run
+
+
+@app.get("/api/rescore/{run_id}", response_model=RescoreStatus)
+def get_rescore(run_id: str, db: Session = Depends(get_db)):
+    """Progress of a specific re-score"""
+    run = db.get(RescoreRun, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Re-score not found")
+    return run
 
-@app.post("/api/crawl/rescan", response_model=CrawlResult)
-async def rescan_jobs_alias(db: Session = Depends(get_db)):
+
+@app.post("/api/rescan", response_model=CrawlJobStatus, status_code=202)
+def rescan_jobs(db: Session = Depends(get_db)):
+    """Queue a crawl and return its run_id at once (a crawl already queued or running is reused).
+
+    Follow it on ``/api/runs/{run_id}/events``.
+    """
+    job, coalesced = crawl_jobs.submit(db.get_bind())
+    return CrawlJobStatus(run_id=job.run_id, status=job.status, coalesced=coalesced)
+
+
+@app.post("/api/crawl/rescan", response_model=CrawlJobStatus, status_code=202)
+def rescan_jobs_alias(db: Session = Depends(get_db)):
     """Alias endpoint for manual crawl"""
-    return await rescan_jobs(db)
+    return rescan_jobs(db)
 
 @app.get("/health")
-async def healthcheck(db: Session = Depends(get_db)):
+def healthcheck(db: Session = Depends(get_db)):
     """Healthcheck for ops dashboards."""
     db_ok = True
     db_error = None
@@ -317,133 +568,121 @@ async def healthcheck(db: Session = Depends(get_db)):
     }
 
 @app.get("/api/settings", response_model=SettingsSchema)
-async def get_settings(db: Session = Depends(get_db)):
+def get_settings(db: Session = Depends(get_db)):
     """Get current settings"""
-    keywords_setting = db.query(SettingsModel).filter(SettingsModel.key == "keywords").first()
-    locations_setting = db.query(SettingsModel).filter(SettingsModel.key == "locations").first()
-    sources_setting = db.query(SettingsModel).filter(SettingsModel.key == "sources").first()
-    schedule_setting = db.query(SettingsModel).filter(SettingsModel.key == "schedule").first()
-    greenhouse_setting = db.query(SettingsModel).filter(SettingsModel.key == "greenhouse_boards").first()
-    india_setting = db.query(SettingsModel).filter(SettingsModel.key == "india_mode").first()
-    linkedin_mode_setting = db.query(SettingsModel).filter(SettingsModel.key == "linkedin_mode").first()
-    linkedin_email_setting = db.query(SettingsModel).filter(SettingsModel.key == "linkedin_email").first()
-    linkedin_crawl_setting = db.query(SettingsModel).filter(SettingsModel.key == "linkedin_crawl").first()
-    
-    keywords = json.loads(keywords_setting.value) if keywords_setting else settings.DEFAULT_KEYWORDS
-    locations = json.loads(locations_setting.value) if locations_setting else settings.DEFAULT_LOCATIONS
-    sources = json.loads(sources_setting.value) if sources_setting else settings.JOB_SOURCES
-    if sources:
-        merged_sources = settings.JOB_SOURCES.copy()
-        merged_sources.update(sources)
-        sources = merged_sources
-    schedule = json.loads(schedule_setting.value) if schedule_setting else {"hour": settings.CRAWL_SCHEDULE_HOUR, "minute": settings.CRAWL_SCHEDULE_MINUTE}
-    greenhouse_boards = json.loads(greenhouse_setting.value) if greenhouse_setting else settings.GREENHOUSE_BOARDS
-    india_mode = json.loads(india_setting.value) if india_setting else settings.INDIA_MODE
-    linkedin_mode = json.loads(linkedin_mode_setting.value) if linkedin_mode_setting else settings.LINKEDIN_MODE
-    linkedin_email = json.loads(linkedin_email_setting.value) if linkedin_email_setting else settings.LINKEDIN_EMAIL
-    linkedin_crawl = json.loads(linkedin_crawl_setting.value) if linkedin_crawl_setting else settings.LINKEDIN_CRAWL
-    
-    return SettingsSchema(
-        keywords=keywords,
-        locations=locations,
-        sources=sources,
-        greenhouse_boards=greenhouse_boards,
-        india_mode=india_mode,
-        linkedin_mode=linkedin_mode,
-        linkedin_email=linkedin_email,
-        linkedin_crawl=linkedin_crawl,
-        crawl_hour=schedule.get("hour", 7),
-        crawl_minute=schedule.get("minute", 0)
-    )
+    return SettingsSchema(**get_settings_snapshot(db).to_dict())
 
 @app.put("/api/settings", response_model=SettingsSchema)
-async def update_settings(settings_data: SettingsSchema, db: Session = Depends(get_db)):
+def update_settings(settings_data: SettingsSchema, db: Session = Depends(get_db)):
     """Update settings"""
-    keywords_setting = db.query(SettingsModel).filter(SettingsModel.key == "keywords").first()
-    if keywords_setting:
-        keywords_setting.value = json.dumps(settings_data.keywords)
-    else:
-        db.add(SettingsModel(key="keywords", value=json.dumps(settings_data.keywords)))
-    
-    locations_setting = db.query(SettingsModel).filter(SettingsModel.key == "locations").first()
-    if locations_setting:
-        locations_setting.value = json.dumps(settings_data.locations)
-    else:
-        db.add(SettingsModel(key="locations", value=json.dumps(settings_data.locations)))
-    
-    sources_setting = db.query(SettingsModel).filter(SettingsModel.key == "sources").first()
-    if sources_setting:
-        sources_setting.value = json.dumps(settings_data.sources)
-    else:
-        db.add(SettingsModel(key="sources", value=json.dumps(settings_data.sources)))
-    
-    greenhouse_setting = db.query(SettingsModel).filter(SettingsModel.key == "greenhouse_boards").first()
-    boards_payload = []
-    for board in settings_data.greenhouse_boards:
-        if hasattr(board, "model_dump"):
-            boards_payload.append(board.model_dump())
-        else:
-            boards_payload.append(board)
-    if greenhouse_setting:
-        greenhouse_setting.value = json.dumps(boards_payload)
-    else:
-        db.add(SettingsModel(key="greenhouse_boards", value=json.dumps(boards_payload)))
-
-    india_setting = db.query(SettingsModel).filter(SettingsModel.key == "india_mode").first()
-    if india_setting:
-        india_setting.value = json.dumps(settings_data.india_mode)
-    else:
-        db.add(SettingsModel(key="india_mode", value=json.dumps(settings_data.india_mode)))
-
-    linkedin_mode_setting = db.query(SettingsModel).filter(SettingsModel.key == "linkedin_mode").first()
-    if linkedin_mode_setting:
-        linkedin_mode_setting.value = json.dumps(settings_data.linkedin_mode)
-    else:
-        db.add(SettingsModel(key="linkedin_mode", value=json.dumps(settings_data.linkedin_mode)))
-
-    linkedin_email_setting = db.query(SettingsModel).filter(SettingsModel.key == "linkedin_email").first()
-    if linkedin_email_setting:
-        linkedin_email_setting.value = json.dumps(settings_data.linkedin_email)
-    else:
-        db.add(SettingsModel(key="linkedin_email", value=json.dumps(settings_data.linkedin_email)))
-
-    linkedin_crawl_setting = db.query(SettingsModel).filter(SettingsModel.key == "linkedin_crawl").first()
-    if linkedin_crawl_setting:
-        linkedin_crawl_setting.value = json.dumps(settings_data.linkedin_crawl)
-    else:
-        db.add(SettingsModel(key="linkedin_crawl", value=json.dumps(settings_data.linkedin_crawl)))
-    
-    schedule_setting = db.query(SettingsModel).filter(SettingsModel.key == "schedule").first()
-    schedule_data = {"hour": settings_data.crawl_hour, "minute": settings_data.crawl_minute}
-    if schedule_setting:
-        schedule_setting.value = json.dumps(schedule_data)
-    else:
-        db.add(SettingsModel(key="schedule", value=json.dumps(schedule_data)))
-    
-    db.commit()
+    save_settings(
+        db,
+        {
+            "keywords": settings_data.keywords,
+            "locations": settings_data.locations,
+            "sources": settings_data.sources,
+            "greenhouse_boards": [
+                board.model_dump() if hasattr(board, "model_dump") else board
+                for board in settings_data.greenhouse_boards
+            ],
+            "india_mode": settings_data.india_mode,
+            "linkedin_mode": settings_data.linkedin_mode,
+            "linkedin_email": settings_data.linkedin_email,
+            "linkedin_crawl": settings_data.linkedin_crawl,
+            "schedule": {"hour": settings_data.crawl_hour, "minute": settings_data.crawl_minute},
+        },
+    )
     
     return settings_data
 
 
 @app.get("/api/runs", response_model=List[CrawlRunSchema])
-async def list_runs(
+def list_runs(
+    request: Request,
     limit: int = Query(10, le=100),
     offset: int = Query(0),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page (replaces offset)"),
     db: Session = Depends(get_db),
 ):
     """List recent crawl runs"""
-    runs = (
-        db.query(CrawlRun)
-        .order_by(CrawlRun.started_at.desc())
-        .offset(offset)
+    sort_keys = [raw(CrawlRun.started_at), CrawlRun.run_id]
+    query = db.query(CrawlRun)
+    if cursor:
+        try:
+            query = query.filter(after(sort_keys, decode_cursor(cursor, "runs", len(sort_keys))))
+        except InvalidCursor as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+    cached = CachedRequest(request, db)
+    if cached.response is not None:
+        return cached.response
+    rows = (
+        query.add_columns(*sort_keys)
+        .order_by(*(key.desc() for key in sort_keys))
+        .offset(0 if cursor else offset)
         .limit(limit)
         .all()
     )
-    return [_serialize_run(run) for run in runs]
+    headers = {}
+    if len(rows) == limit:
+        headers["X-Next-Cursor"] = encode_cursor("runs", tuple(rows[-1])[1:])
+    return cached.finish([_serialize_run(run) for run, *_ in rows], _run_list_adapter, headers)
+
+
+async def _job_events(job):
+    """Events of a crawl run by this process, replayed from the start."""
+    sent, idle = 0, 0.0
+    while True:
+        # read before the events: the terminal event is added in the same step that finishes the job
+        finished = job.finished
+        events = crawl_jobs.events_since(job, sent)
+        for event in events:
+            yield format_sse(event)
+        sent += len(events)
+        if finished:
+            return
+        idle = 0.0 if events else idle + EVENT_POLL_SECONDS
+        if idle >= KEEPALIVE_SECONDS:
+            idle = 0.0
+            yield ": keepalive\n\n"
+        await asyncio.sleep(EVENT_POLL_SECONDS)
+
+
+async def _stored_run_events(bind, run_id: str):
+    """Events of a crawl run elsewhere: ``status`` while crawl_runs shows it live, then the outcome."""
+    event = await asyncio.to_thread(stored_run_event, bind, run_id)
+    if event is None:
+        yield format_sse({"event": "status", "data": {"status": "running"}})
+    idle = 0.0
+    while event is None:
+        await asyncio.sleep(RUN_POLL_SECONDS)
+        idle += RUN_POLL_SECONDS
+        if idle >= KEEPALIVE_SECONDS:
+            idle = 0.0
+            yield ": keepalive\n\n"
+        event = await asyncio.to_thread(stored_run_event, bind, run_id)
+    yield format_sse(event)
+
+
+@app.get("/api/runs/{run_id}/events")
+def stream_run_events(run_id: str, db: Session = Depends(get_db)):
+    """Server-sent events for a crawl: ``status``, per-source ``progress``, then ``done`` or ``failed``
+
+    ``done`` carries a ``CrawlResult``. Crawls run by another process have no ``progress`` events.
+    """
+    job = crawl_jobs.get(run_id)
+    if job is not None:
+        events = _job_events(job)
+    elif db.query(CrawlRun.run_id).filter(CrawlRun.run_id == run_id).first():
+        events = _stored_run_events(db.get_bind(), run_id)
+    else:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return StreamingResponse(
+        events, media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @app.get("/api/runs/{run_id}", response_model=CrawlRunSchema)
-async def get_run(run_id: str, db: Session = Depends(get_db)):
+def get_run(run_id: str, db: Session = Depends(get_db)):
     """Get details for a specific crawl run"""
     run = db.query(CrawlRun).filter(CrawlRun.run_id == run_id).first()
     if not run:
@@ -451,18 +690,9 @@ async def get_run(run_id: str, db: Session = Depends(get_db)):
     return _serialize_run(run)
 
 @app.get("/api/stats")
-async def get_stats(db: Session = Depends(get_db)):
+def get_stats(request: Request, db: Session = Depends(get_db)):
     """Get job statistics"""
-    total_jobs = db.query(Job).count()
-    applied_jobs = db.query(Job).filter(Job.applied == True).count()
-    pending_jobs = total_jobs - applied_jobs
-    
-    sources = db.query(Job.source, func.count(Job.id)).group_by(Job.source).all()
-    source_stats = {source: count for source, count in sources}
-    
-    return {
-        "total_jobs": total_jobs,
-        "applied_jobs": applied_jobs,
-        "pending_jobs": pending_jobs,
-        "sources": source_stats
-    }
+    cached = CachedRequest(request, db)
+    if cached.response is not None:
+        return cached.response
+    return cached.finish(job_stats(db), _stats_adapter)
@@ -1,10 +1,10 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, Float, DateTime, event
+from sqlalchemy import Column, Integer, String, Text, Boolean, Float, DateTime, LargeBinary, Index, event
 from sqlalchemy.sql import func
 from .database import Base
-import hashlib
-from urllib.parse import urlparse, parse_qsl, urlunparse
 from uuid import uuid4
 
+from backend.crawl_engine.identity import canonical_url, key_from_canonical
+
 class Job(Base):
     __tablename__ = "jobs"
     
@@ -23,46 +23,24 @@ class Job(Base):
     remote = Column(Boolean, default=False)
     source_meta = Column(Text, nullable=True)
     relevance_score = Column(Float, default=0.0)
+    semantic_score = Column(Float, nullable=True)  # model part of relevance_score; None if never scored
     keywords_matched = Column(String, nullable=True)
     applied = Column(Boolean, default=False)
     notes = Column(Text, nullable=True)
     job_fingerprint = Column(String, nullable=True)
+    duplicate_group_id = Column(String, nullable=True)
+    lsh_bands = Column(Text, nullable=True)
     last_seen_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     @staticmethod
     def _normalize_url(url: str) -> str:
-        if not url:
-            return ""
-        parsed = urlparse(url.strip())
-        # drop common tracking params, keep id-like params
-        query_items = []
-        for k, v in parse_qsl(parsed.query, keep_blank_values=True):
-            if k.lower().startswith("utm_"):
-                continue
-            query_items.append((k, v))
-        normalized_query = "&".join(f"{k}={v}" for k, v in query_items)
-        normalized = parsed._replace(fragment="", query=normalized_query)
-        normalized_url = urlunparse(normalized).rstrip("/")
-        return normalized_url.lower()
+        return canonical_url(url or "")
 
     @staticmethod
     def generate_key(title: str, company: str, url: str, source: str | None = None, post_date: str | None = None, location: str | None = None) -> str:
-        normalized_url = Job._normalize_url(url)
-        if normalized_url:
-            content = f"{source or ''}|{normalized_url}".lower()
-            return hashlib.sha256(content.encode()).hexdigest()
-        # fallback when URL missing
-        parts = [
-            (source or "").strip().lower(),
-            title.strip().lower(),
-            company.strip().lower(),
-            (location or "").strip().lower(),
-            (post_date or "").strip().lower(),
-        ]
-        content = "|".join(parts)
-        return hashlib.sha256(content.encode()).hexdigest()
+        return key_from_canonical(canonical_url(url or ""), title, company, source, post_date, location)
 
     @staticmethod
     def generate_hash(title: str, company: str, url: str, source: str | None = None, post_date: str | None = None, location: str | None = None) -> str:
@@ -72,6 +50,7 @@ class Job(Base):
 
 @event.listens_for(Job, "before_insert", propagate=True)
 def _set_job_keys(mapper, connection, target: Job):  # pragma: no cover - invoked by SQLAlchemy
+    # Pipelines pass precomputed identities; only fill gaps, computing the key once.
     if not target.job_key:
         target.job_key = Job.generate_key(
             target.title or "",
@@ -82,14 +61,7 @@ def _set_job_keys(mapper, connection, target: Job):  # pragma: no cover - invoke
             target.location,
         )
     if not target.job_hash:
-        target.job_hash = Job.generate_hash(
-            target.title or "",
-            target.company or "",
-            target.url or "",
-            target.source or "",
-            target.post_date,
-            target.location,
-        )
+        target.job_hash = target.job_key
 
 class Settings(Base):
     __tablename__ = "settings"
@@ -106,6 +78,7 @@ class CrawlRun(Base):
     run_id = Column(String, primary_key=True, index=True, default=lambda: str(uuid4()))
     started_at = Column(DateTime(timezone=True), server_default=func.now())
     finished_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
     duration_ms = Column(Integer, nullable=True)
     sources_attempted = Column(Text, nullable=True)
     sources_succeeded = Column(Text, nullable=True)
@@ -114,3 +87,67 @@ class CrawlRun(Base):
     fetched_count = Column(Integer, default=0)
     inserted_new_count = Column(Integer, default=0)
     errors_summary = Column(Text, nullable=True)
+
+
+class JobCounter(Base):
+    """Running totals over ``jobs``, kept current by triggers (see ``backend.job_counters``)."""
+
+    __tablename__ = "job_counters"
+
+    name = Column(String, primary_key=True)  # total, applied, remote, source:<source>
+    value = Column(Integer, nullable=False, default=0)
+
+
+class JobEmbedding(Base):
+    __tablename__ = "job_embeddings"
+
+    text_hash = Column(String, primary_key=True)  # embedding_store.text_key of the encoded text
+    model_name = Column(String, primary_key=True)
+    dim = Column(Integer, nullable=False)
+    vector = Column(LargeBinary, nullable=False)  # float16, unit-normalized
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_used_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class Profile(Base):
+    """A named target role; jobs are scored against every profile."""
+
+    __tablename__ = "profiles"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, index=True, nullable=False)
+    profile_text = Column(Text, nullable=False)
+    embedding = Column(LargeBinary, nullable=True)  # float32, unit-normalized
+    embedding_model = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+
+class JobProfileScore(Base):
+    __tablename__ = "job_profile_scores"
+
+    profile_id = Column(Integer, primary_key=True)
+    job_key = Column(String, primary_key=True)
+    score = Column(Float, nullable=False)
+
+    __table_args__ = (
+        Index("idx_job_profile_scores_profile_score", "profile_id", score.desc()),
+    )
+
+
+class RescoreRun(Base):
+    """Progress of a corpus re-score after PROFILE_TEXT or the model changed."""
+
+    __tablename__ = "rescore_runs"
+
+    run_id = Column(String, primary_key=True, default=lambda: str(uuid4()))
+    status = Column(String, nullable=False, default="queued")  # queued, running, done, failed
+    profile_hash = Column(String, nullable=False)
+    model_id = Column(String, nullable=False)
+    last_job_id = Column(Integer, nullable=False, default=0)
+    processed_count = Column(Integer, nullable=False, default=0)
+    total_count = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
@@ -1,34 +1,100 @@
+"""Semantic relevance scoring against the configured profile.
+
+Model libraries (sentence-transformers/torch, onnxruntime) are imported
+only when a scorer is built, so importing this module from the API process
+stays cheap; crawls start loading it in the background via
+``warm_up_nlp_scorer``.
+"""
 from __future__ import annotations
 
+import importlib.util
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import lru_cache
-from typing import Optional
+from typing import Callable, Optional, Sequence
 
 import numpy as np
 
-try:
-    from sentence_transformers import SentenceTransformer
-except ImportError:  # pragma: no cover - handled gracefully when dependency missing
-    SentenceTransformer = None  # type: ignore
-
 from .config import settings
+from .database import SessionLocal
+from .embedding_service import connect_embedding_service
+from .embedding_store import EmbeddingStore, text_key
 
 logger = logging.getLogger(__name__)
 
+_scorer_lock = threading.Lock()
+_warmup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nlp-warmup")
 
-class NLPScorer:
-    """Wraps a sentence-transformer model for cosine similarity scoring."""
 
-    def __init__(self, profile_text: str, model_name: str | None = None):
-        if SentenceTransformer is None:
+def _module_available(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+NLP_BACKENDS = ("torch", "onnx", "int8")
+
+
+def embedding_model_id(model_name: str, backend: str) -> str:
+    """Cache key for embeddings: the fp32 ONNX export matches torch, int8 does not."""
+    return f"{model_name}:int8" if backend == "int8" else model_name
+
+
+def load_encoder(model_name: str, backend: str, onnx_model_dir: str | None = None):
+    """Load a local encoder exposing ``SentenceTransformer.encode``."""
+    if backend not in NLP_BACKENDS:
+        raise ValueError(f"Unknown NLP backend {backend!r}; expected one of {NLP_BACKENDS}")
+    if backend == "torch":
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as exc:
             raise RuntimeError(
                 "sentence-transformers is not installed. Install it to enable NLP scoring."
-            )
+            ) from exc
+        return SentenceTransformer(model_name)
+
+    from .onnx_encoder import OnnxEncoder
 
+    model_dir = onnx_model_dir or settings.NLP_ONNX_MODEL_DIR
+    if not model_dir:
+        raise RuntimeError("NLP_ONNX_MODEL_DIR must be set for the ONNX backends.")
+    return OnnxEncoder(
+        model_dir,
+        quantized=backend == "int8",
+        max_seq_length=settings.NLP_MAX_SEQ_LENGTH,
+    )
+
+
+class NLPScorer:
+    """Wraps a sentence-transformer model for cosine similarity scoring.
+
+    ``backend`` picks the encoder: ``torch`` loads a ``SentenceTransformer``,
+    ``onnx``/``int8`` run the exported model in ``onnx_model_dir`` through
+    ONNX Runtime. A ready ``encoder`` (e.g. an ``EmbeddingClient`` for the
+    shared embedding service) skips local loading. All return the same
+    unit-normalized embeddings.
+    """
+
+    def __init__(
+        self,
+        profile_text: str,
+        model_name: str | None = None,
+        store: EmbeddingStore | None = None,
+        backend: str | None = None,
+        onnx_model_dir: str | None = None,
+        encoder=None,
+    ):
         self.model_name = model_name or settings.NLP_MODEL_NAME
-        self.model = SentenceTransformer(self.model_name)
+        self.backend = backend or settings.NLP_BACKEND
+        self.model = encoder or load_encoder(self.model_name, self.backend, onnx_model_dir)
+        self.store = store
         self.profile_embedding = self._encode(profile_text)
 
+    @property
+    def model_id(self) -> str:
+        """Identifies the embedding space vectors from this scorer live in."""
+        return getattr(self.model, "model_id", None) or embedding_model_id(self.model_name, self.backend)
+
     def _encode(self, text: str) -> np.ndarray:
         embedding = self.model.encode(
             [text],
@@ -40,28 +106,133 @@ class NLPScorer:
 
     def score(self, text: str) -> float:
         """Return cosine similarity between the profile and job text."""
-        if not text.strip():
-            return 0.0
-        job_embedding = self._encode(text)
-        similarity = float(np.dot(self.profile_embedding, job_embedding))
-        return max(0.0, similarity)
+        return float(self.score_many([text])[0])
+
+    def embed_many(self, texts: Sequence[str], batch_size: int | None = None) -> np.ndarray:
+        """Return unit embeddings for ``texts`` (zero rows for blank texts).
+
+        With a store configured, texts this model already encoded are read
+        back by ``text_key`` instead of encoded; new vectors are queued for
+        ``flush_embedding_cache``. Remaining texts are encoded in
+        length-sorted batches so each forward pass pads to similar lengths.
+        """
+        dim = self.profile_embedding.shape[0]
+        embeddings = np.zeros((len(texts), dim), dtype=np.float32)
+        todo = [i for i, text in enumerate(texts) if text and text.strip()]
+        keys = {i: text_key(texts[i]) for i in todo} if self.store is not None else {}
+        cached = {}
+        if keys:
+            try:
+                cached = self.store.get_many(keys.values())
+            except Exception as exc:
+                logger.warning("Embedding cache lookup failed: %s", exc)
+        misses = []
+        for i in todo:
+            vector = cached.get(keys[i]) if cached else None
+            if vector is not None and vector.shape[0] == dim:
+                embeddings[i] = vector
+            else:
+                misses.append(i)
+        if not misses:
+            return embeddings
+        misses.sort(key=lambda i: len(texts[i]))
+        embeddings[misses] = self.model.encode(
+            [texts[i] for i in misses],
+            batch_size=batch_size or settings.NLP_BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        if keys:
+            self.store.put_many({keys[i]: embeddings[i] for i in misses})
+        return embeddings
+
+    def score_many(self, texts: Sequence[str], batch_size: int | None = None) -> np.ndarray:
+        """Return clipped cosine similarities for many job texts, in input order."""
+        return self.score_embeddings(self.embed_many(texts, batch_size=batch_size))
+
+    def score_embeddings(self, embeddings: np.ndarray) -> np.ndarray:
+        """Clipped cosine similarities of unit ``embeddings`` to the profile."""
+        return np.clip(embeddings @ self.profile_embedding, 0.0, None)
+
+
+def flush_embedding_cache(scorer) -> None:
+    """Write vectors ``scorer`` queued; call once the caller's transaction has committed."""
+    store = getattr(scorer, "store", None)
+    if store is None:
+        return
+    try:
+        store.flush()
+    except Exception as exc:
+        logger.warning("Embedding cache write failed: %s", exc)
 
 
-@lru_cache(maxsize=1)
 def get_nlp_scorer() -> Optional[NLPScorer]:
-    """Return a cached NLP scorer if configured."""
+    """Return a cached NLP scorer if configured, loading the model on first use."""
+    # serialized so a warm-up in flight and a direct caller load the model once
+    with _scorer_lock:
+        return _build_nlp_scorer()
+
+
+def warm_up_nlp_scorer(
+    loader: Callable[[], Optional[NLPScorer]] | None = None,
+) -> "Future[tuple[Optional[NLPScorer], float]]":
+    """Start loading the scorer in the background.
+
+    The future resolves to ``(scorer, load_ms)``; ``load_ms`` is near zero
+    when the scorer was already loaded in this process.
+    """
+    loader = loader or get_nlp_scorer
+
+    def load():
+        started = time.perf_counter()
+        scorer = loader()
+        return scorer, (time.perf_counter() - started) * 1000
+
+    return _warmup_executor.submit(load)
+
+
+@lru_cache(maxsize=1)
+def _build_nlp_scorer() -> Optional[NLPScorer]:
     if not settings.PROFILE_TEXT:
         logger.info("PROFILE_TEXT not configured; skipping NLP scoring.")
         return None
 
-    if SentenceTransformer is None:
+    client = connect_embedding_service()
+    if client is not None:
+        logger.info("Using embedding service at %s (%s)", client.socket_path, client.model_id)
+        try:
+            return NLPScorer(
+                profile_text=settings.PROFILE_TEXT,
+                model_name=settings.NLP_MODEL_NAME,
+                store=EmbeddingStore(SessionLocal, client.model_id) if settings.EMBEDDING_CACHE_ENABLED else None,
+                encoder=client,
+            )
+        except Exception as exc:
+            logger.warning("Embedding service failed; loading model locally: %s", exc)
+
+    if settings.NLP_BACKEND == "torch" and not _module_available("sentence_transformers"):
         logger.warning(
             "sentence-transformers is unavailable. Install it to enable NLP scoring."
         )
         return None
 
+    if settings.NLP_BACKEND != "torch" and not _module_available("onnxruntime"):
+        logger.warning("onnxruntime is unavailable. Install it to use NLP_BACKEND=%s.", settings.NLP_BACKEND)
+        return None
+
     try:
-        return NLPScorer(profile_text=settings.PROFILE_TEXT, model_name=settings.NLP_MODEL_NAME)
+        store = None
+        if settings.EMBEDDING_CACHE_ENABLED:
+            store = EmbeddingStore(
+                SessionLocal, embedding_model_id(settings.NLP_MODEL_NAME, settings.NLP_BACKEND)
+            )
+        return NLPScorer(
+            profile_text=settings.PROFILE_TEXT,
+            model_name=settings.NLP_MODEL_NAME,
+            store=store,
+            backend=settings.NLP_BACKEND,
+        )
     except Exception as exc:  # pragma: no cover - defensive fallback
         logger.error("Failed to initialize NLP scorer: %s", exc)
         return None
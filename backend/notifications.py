@@ -2,15 +2,19 @@ import json
 import logging
 import smtplib
 from email.mime.text import MIMEText
-from typing import Iterable, List
+from typing import Iterable, List, Set
 
 import requests
+from sqlalchemy.orm import Session
 
 from .config import settings
 from .models import CrawlRun, Job
 
 logger = logging.getLogger(__name__)
 
+# duplicate_group_id values per IN (...) lookup
+_GROUP_CHUNK = 500
+
 
 class NotificationService:
     """Handles optional email and Telegram digests for new jobs."""
@@ -18,19 +22,52 @@ class NotificationService:
     def __init__(self):
         self.notifications_enabled = settings.ENABLE_NOTIFICATIONS
 
-    def _filter_jobs(self, jobs: Iterable[Job]) -> List[Job]:
-        return [
-            job
-            for job in jobs
-            if job.relevance_score >= settings.NOTIFICATION_MIN_SCORE
-        ]
+    def _filter_jobs(self, jobs: Iterable[Job], db: Session | None = None) -> List[Job]:
+        """Keep jobs above the threshold, one per near-duplicate group.
+
+        With ``db``, groups that already had a stored member above the
+        threshold (reported by an earlier digest) are skipped too.
+        """
+        filtered: List[Job] = []
+        seen_groups = set()
+        ranked = sorted(jobs, key=lambda job: job.relevance_score or 0.0, reverse=True)
+        for job in ranked:
+            if job.relevance_score < settings.NOTIFICATION_MIN_SCORE:
+                continue
+            group_id = getattr(job, "duplicate_group_id", None)
+            if group_id:
+                if group_id in seen_groups:
+                    continue
+                seen_groups.add(group_id)
+            filtered.append(job)
+        if db is not None and seen_groups:
+            notified = self._previously_notified_groups(db, seen_groups, {job.job_key for job in ranked})
+            filtered = [job for job in filtered if getattr(job, "duplicate_group_id", None) not in notified]
+        return filtered
+
+    @staticmethod
+    def _previously_notified_groups(db: Session, group_ids: Set[str], batch_keys: Set[str]) -> Set[str]:
+        """Groups with a member outside this batch that met the notification threshold."""
+        notified: Set[str] = set()
+        group_list = sorted(group_ids)
+        for start in range(0, len(group_list), _GROUP_CHUNK):
+            rows = (
+                db.query(Job.duplicate_group_id, Job.job_key)
+                .filter(
+                    Job.duplicate_group_id.in_(group_list[start : start + _GROUP_CHUNK]),
+                    Job.relevance_score >= settings.NOTIFICATION_MIN_SCORE,
+                )
+                .all()
+            )
+            notified.update(group_id for group_id, job_key in rows if job_key not in batch_keys)
+        return notified
 
-    def send_daily_digest(self, jobs: Iterable[Job]) -> None:
+    def send_daily_digest(self, jobs: Iterable[Job], db: Session | None = None) -> None:
         if not self.notifications_enabled:
             logger.debug("Notifications disabled; skipping digest.")
             return
 
-        filtered_jobs = self._filter_jobs(jobs)
+        filtered_jobs = self._filter_jobs(jobs, db)
         if not filtered_jobs:
             logger.info("No jobs met the notification threshold.")
             return
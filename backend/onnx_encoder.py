@@ -0,0 +1,132 @@
+"""ONNX Runtime sentence encoder for CPU-only crawl workers.
+
+Runs an exported transformer (fp32 ``model.onnx`` or dynamically quantized
+``model_int8.onnx``) from a local directory with the same mean pooling and
+L2 normalization as sentence-transformers, so ``NLPScorer`` can use it in
+place of a PyTorch ``SentenceTransformer`` without loading torch.
+
+Export a model directory once with::
+
+    python -m backend.onnx_encoder --out models/minilm-onnx [--int8]
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+
+try:
+    import onnxruntime as ort
+    from tokenizers import Tokenizer
+except ImportError:  # pragma: no cover - handled gracefully when dependency missing
+    ort = None  # type: ignore
+    Tokenizer = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+FP32_FILENAME = "model.onnx"
+INT8_FILENAME = "model_int8.onnx"
+TOKENIZER_FILENAME = "tokenizer.json"
+
+
+class OnnxEncoder:
+    """``SentenceTransformer.encode``-compatible encoder backed by ONNX Runtime."""
+
+    def __init__(self, model_dir: str, quantized: bool = False, max_seq_length: int = 256):
+        if ort is None or Tokenizer is None:
+            raise RuntimeError(
+                "onnxruntime and tokenizers are not installed. Install them to use the ONNX backend."
+            )
+        path = Path(model_dir)
+        model_path = path / (INT8_FILENAME if quantized else FP32_FILENAME)
+        if not model_path.exists():
+            raise FileNotFoundError(f"ONNX model not found: {model_path}")
+
+        self.tokenizer = Tokenizer.from_file(str(path / TOKENIZER_FILENAME))
+        self.tokenizer.enable_truncation(max_length=max_seq_length)
+        self.tokenizer.enable_padding()
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            str(model_path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+    def _forward(self, texts: Sequence[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(list(texts))
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.array([e.type_ids for e in encodings], dtype=np.int64)
+        token_embeddings = self.session.run(None, feeds)[0]
+        # mean pooling over real tokens, as in sentence-transformers' Pooling module
+        mask = attention_mask[..., None].astype(np.float32)
+        summed = (token_embeddings * mask).sum(axis=1)
+        return summed / np.clip(mask.sum(axis=1), 1e-9, None)
+
+    def encode(
+        self,
+        texts: Sequence[str],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False,
+        show_progress_bar: bool = False,
+    ) -> np.ndarray:
+        batches = [self._forward(texts[i : i + batch_size]) for i in range(0, len(texts), batch_size)]
+        embeddings = np.concatenate(batches, axis=0) if batches else np.zeros((0, 0), dtype=np.float32)
+        if normalize_embeddings and len(embeddings):
+            embeddings = embeddings / np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        return embeddings.astype(np.float32)
+
+
+def export_model(model_name: str, out_dir: str, quantize: bool = False) -> Path:
+    """Export a Hugging Face encoder to ONNX (and optionally int8) in ``out_dir``.
+
+    Needs torch and transformers, which the crawl workers themselves do not.
+    """
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModel.from_pretrained(model_name).eval()
+    tokenizer.save_pretrained(out)
+
+    sample = tokenizer(["export sample"], return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+    torch.onnx.export(
+        model,
+        tuple(sample[name] for name in input_names),
+        out / FP32_FILENAME,
+        input_names=input_names,
+        output_names=["last_hidden_state"],
+        dynamic_axes=dynamic_axes,
+        opset_version=14,
+    )
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantize_dynamic(out / FP32_FILENAME, out / INT8_FILENAME, weight_type=QuantType.QInt8)
+    logger.info("Exported %s to %s", model_name, out)
+    return out
+
+
+if __name__ == "__main__":
+    from .config import settings
+
+    parser = argparse.ArgumentParser(description="Export the NLP model for the ONNX backend.")
+    parser.add_argument("--model", default=settings.NLP_MODEL_NAME)
+    parser.add_argument("--out", default=settings.NLP_ONNX_MODEL_DIR or os.path.join("models", "onnx"))
+    parser.add_argument("--int8", action="store_true", help="also write a dynamically quantized model")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    export_model(args.model, args.out, quantize=args.int8)
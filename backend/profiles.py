@@ -0,0 +1,145 @@
+"""Named scoring profiles.
+
+Each profile's embedding is one column of a ``(dim, n_profiles)`` matrix,
+so a batch of job embeddings is scored against every profile with a
+single matrix multiply and stored in ``job_profile_scores``. Job
+embeddings come from ``NLPScorer.embed_many``, whose cache is keyed by text, so
+adding a profile backfills from the embedding cache instead of
+re-crawling or re-encoding the corpus.
+"""
+from __future__ import annotations
+
+import logging
+from typing import List, NamedTuple, Sequence
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+
+from .config import settings
+from .http_cache import bump_data_version
+from .models import Job, JobProfileScore, Profile
+from .nlp import flush_embedding_cache
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_CHUNK_SIZE = 500
+
+
+class ProfileMatrix(NamedTuple):
+    profile_ids: List[int]
+    matrix: np.ndarray  # (dim, n_profiles)
+
+    def __bool__(self) -> bool:
+        return bool(self.profile_ids)
+
+
+def _profile_vector(db: Session, scorer, profile: Profile) -> np.ndarray:
+    """Return the profile's embedding, (re)computing it if the model changed."""
+    if profile.embedding is not None and profile.embedding_model == scorer.model_id:
+        return np.frombuffer(profile.embedding, dtype=np.float32)
+    vector = scorer.embed_many([profile.profile_text])[0].astype(np.float32)
+    profile.embedding = vector.tobytes()
+    profile.embedding_model = scorer.model_id
+    db.commit()
+    return vector
+
+
+def load_profile_matrix(db: Session, scorer, profiles: Sequence[Profile] | None = None) -> ProfileMatrix:
+    if profiles is None:
+        profiles = db.query(Profile).order_by(Profile.id).all()
+    if not profiles or scorer is None:
+        return ProfileMatrix([], np.zeros((0, 0), dtype=np.float32))
+    vectors = [_profile_vector(db, scorer, profile) for profile in profiles]
+    return ProfileMatrix([p.id for p in profiles], np.stack(vectors, axis=1))
+
+
+def job_text(job) -> str:
+    return f"{job.title} {job.description}"
+
+
+def compute_profile_scores(scorer, profile_matrix: ProfileMatrix, jobs: Sequence) -> np.ndarray:
+    """Score ``jobs`` (anything with title/description) against all profiles."""
+    embeddings = scorer.embed_many(
+        [job_text(job) for job in jobs],
+        batch_size=settings.NLP_BATCH_SIZE,
+    )
+    return np.clip(embeddings @ profile_matrix.matrix, 0.0, None)
+
+
+def write_profile_scores(
+    db: Session, profile_matrix: ProfileMatrix, job_keys: Sequence[str], scores: np.ndarray
+) -> None:
+    rows = [
+        {"profile_id": profile_id, "job_key": job_key, "score": float(scores[i, j])}
+        for i, job_key in enumerate(job_keys)
+        for j, profile_id in enumerate(profile_matrix.profile_ids)
+    ]
+    if not rows:
+        return
+    stmt = insert(JobProfileScore)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[JobProfileScore.profile_id, JobProfileScore.job_key],
+            set_={"score": stmt.excluded.score},
+        ),
+        rows,
+    )
+
+
+def copy_profile_scores(db: Session, pairs: Sequence[tuple[str, str]]) -> None:
+    """Give each ``(job_key, source_key)`` job the profile scores of its source.
+
+    Near-duplicate copies of a group scored in an earlier crawl take the
+    representative's stored scores instead of being encoded again.
+    """
+    if not pairs:
+        return
+    db.execute(
+        text(
+            "INSERT INTO job_profile_scores (profile_id, job_key, score) "
+            "SELECT profile_id, :job_key, score FROM job_profile_scores WHERE job_key = :source_key "
+            "ON CONFLICT (profile_id, job_key) DO UPDATE SET score = excluded.score"
+        ),
+        [{"job_key": job_key, "source_key": source_key} for job_key, source_key in pairs],
+    )
+
+
+def score_jobs_for_profiles(db: Session, scorer, jobs: Sequence, profile_matrix: ProfileMatrix | None = None) -> int:
+    """Score and store ``jobs`` for every profile; the caller commits."""
+    if scorer is None or not jobs:
+        return 0
+    profile_matrix = profile_matrix if profile_matrix is not None else load_profile_matrix(db, scorer)
+    if not profile_matrix:
+        return 0
+    scores = compute_profile_scores(scorer, profile_matrix, jobs)
+    write_profile_scores(db, profile_matrix, [job.job_key for job in jobs], scores)
+    return len(jobs)
+
+
+def backfill_profile(db: Session, scorer, profile: Profile) -> int:
+    """Score every stored job against one profile, in keyset-ordered chunks."""
+    profile_matrix = load_profile_matrix(db, scorer, [profile])
+    if not profile_matrix:
+        return 0
+    last_id = 0
+    total = 0
+    while True:
+        chunk = (
+            db.query(Job.id, Job.job_key, Job.title, Job.description)
+            .filter(Job.id > last_id)
+            .order_by(Job.id)
+            .limit(BACKFILL_CHUNK_SIZE)
+            .all()
+        )
+        if not chunk:
+            break
+        score_jobs_for_profiles(db, scorer, chunk, profile_matrix)
+        db.commit()
+        bump_data_version(db)
+        flush_embedding_cache(scorer)
+        total += len(chunk)
+        last_id = chunk[-1].id
+    logger.info("Backfilled %d job scores for profile %s", total, profile.name)
+    return total
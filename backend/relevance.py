@@ -0,0 +1,66 @@
+"""The stored ``relevance_score``, shared by the v2 crawl and re-scoring.
+
+With keywords a job scores its keyword points plus ``NLP_WEIGHT`` times the
+semantic score. With ``CRAWL_SCORING_CASCADE`` a job that matches no keyword
+(or, with ``CRAWL_CASCADE_MATCH_LOCATION``, no configured location unless it
+is remote) scores 0 and is never sent to the model. Without keywords the
+score is the semantic score alone. A re-score therefore stores exactly what
+a crawl with the same settings would have.
+"""
+from __future__ import annotations
+
+from typing import List, NamedTuple, Sequence
+
+from .config import settings
+from .keyword_matcher import get_keyword_matcher
+
+
+class KeywordStage(NamedTuple):
+    passed: bool  # False: store 0 and skip the model
+    score: float
+    matched: List[str]
+
+
+class RelevancePolicy:
+    def __init__(self, keywords: Sequence[str] | None = None, locations: Sequence[str] | None = None):
+        self.keyword_matcher = get_keyword_matcher(tuple(keywords)) if keywords else None
+        self.prefilter = settings.CRAWL_SCORING_CASCADE and self.keyword_matcher is not None
+        self.location_matcher = (
+            get_keyword_matcher(tuple(locations))
+            if self.prefilter and locations and settings.CRAWL_CASCADE_MATCH_LOCATION
+            else None
+        )
+        self.semantic_weight = settings.NLP_WEIGHT if self.keyword_matcher else 1.0
+
+    @property
+    def signature(self) -> str:
+        """Everything besides profile and model that changes the stored score."""
+        if self.keyword_matcher is None:
+            return ""
+        parts = [
+            "keywords=" + "|".join(sorted(self.keyword_matcher.keywords)),
+            f"prefilter={int(self.prefilter)}",
+            f"weight={self.semantic_weight!r}",
+        ]
+        if self.location_matcher is not None:
+            parts.append("locations=" + "|".join(sorted(self.location_matcher.keywords)))
+        return ";".join(parts)
+
+    def keyword_stage(
+        self, title: str | None, description: str | None, location: str | None = None, remote: bool | None = None
+    ) -> KeywordStage:
+        """Keyword points and whether the job goes on to the model."""
+        if self.keyword_matcher is None:
+            return KeywordStage(True, 0.0, [])
+        score, matched = self.keyword_matcher.score(title, description)
+        if not self.prefilter:
+            return KeywordStage(True, score, matched)
+        passed = bool(matched) and (
+            self.location_matcher is None
+            or (bool(remote) and "remote" in self.location_matcher.canonical)
+            or bool(self.location_matcher.find(location))
+        )
+        return KeywordStage(passed, score if passed else 0.0, matched)
+
+    def combine(self, keyword_score: float, semantic_score: float) -> float:
+        return keyword_score + float(semantic_score) * self.semantic_weight
@@ -0,0 +1,181 @@
+"""Re-score stored jobs after ``PROFILE_TEXT`` or the NLP model changes.
+
+Jobs are streamed in ``id``-keyset chunks, scored with
+``NLPScorer.score_many`` (cached embeddings are reused when only the
+profile changed, since the cache is keyed by model) and written back with
+one bulk UPDATE per chunk. Given the crawl keywords and locations, the
+stored score comes from the same ``RelevancePolicy`` as the v2 crawl, so
+jobs failing the keyword prefilter store 0 and skip the model. Progress is
+committed together with each chunk in ``rescore_runs``, so an interrupted
+re-score resumes where it stopped.
+
+    python -m backend.rescoring
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+from datetime import datetime, timezone
+from typing import List
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from .config import settings
+from .http_cache import bump_data_version
+from .models import Job, RescoreRun
+from .nlp import flush_embedding_cache
+from .relevance import RelevancePolicy
+from .settings_store import get_settings_snapshot
+
+logger = logging.getLogger(__name__)
+
+RESCORE_CHUNK_SIZE = 500
+
+
+def profile_hash(profile_text: str | None = None, policy: RelevancePolicy | None = None) -> str:
+    """Identity of what a re-score computes: the profile text plus the keyword scoring."""
+    value = profile_text if profile_text is not None else settings.PROFILE_TEXT
+    signature = policy.signature if policy is not None else ""
+    if signature:
+        value = f"{value}\0{signature}"
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+def stored_keywords(db: Session) -> List[str]:
+    """Keywords the crawler scores with (settings table, else the defaults)."""
+    return list(get_settings_snapshot(db).keywords)
+
+
+def stored_locations(db: Session) -> List[str]:
+    """Locations the crawler's cascade prefilter matches against."""
+    return list(get_settings_snapshot(db).locations)
+
+
+def latest_rescore(db: Session) -> RescoreRun | None:
+    return db.query(RescoreRun).order_by(RescoreRun.started_at.desc(), RescoreRun.run_id).first()
+
+
+def start_rescore(
+    db: Session,
+    model_id: str,
+    profile_text: str | None = None,
+    force: bool = False,
+    keywords: List[str] | None = None,
+    locations: List[str] | None = None,
+) -> RescoreRun:
+    """Return the existing re-score for this profile/model/keyword set, or queue a new one.
+
+    Pass the ``keywords`` and ``locations`` the run will be scored with, so
+    that changing them starts a new pass. Unfinished runs are always reused
+    so they resume; a finished one is reused unless ``force`` asks for a
+    fresh pass.
+    """
+    digest = profile_hash(profile_text, RelevancePolicy(keywords, locations))
+    statuses = ["queued", "running", "failed"] if force else ["queued", "running", "failed", "done"]
+    pending = (
+        db.query(RescoreRun)
+        .filter(
+            RescoreRun.profile_hash == digest,
+            RescoreRun.model_id == model_id,
+            RescoreRun.status.in_(statuses),
+        )
+        .order_by(RescoreRun.started_at.desc())
+        .first()
+    )
+    if pending:
+        return pending
+    run = RescoreRun(
+        profile_hash=digest,
+        model_id=model_id,
+        status="queued",
+        last_job_id=0,
+        processed_count=0,
+        total_count=db.query(Job).count(),
+    )
+    db.add(run)
+    db.commit()
+    return run
+
+
+def run_rescore(
+    db: Session,
+    run: RescoreRun,
+    scorer,
+    chunk_size: int = RESCORE_CHUNK_SIZE,
+    keywords: List[str] | None = None,
+    locations: List[str] | None = None,
+) -> RescoreRun:
+    """Score every job after ``run.last_job_id``; safe to call again after a crash.
+
+    Without ``keywords`` the stored score is the NLP similarity alone.
+    """
+    policy = RelevancePolicy(keywords, locations)
+    run.status = "running"
+    run.error = None
+    db.commit()
+    try:
+        while True:
+            chunk = (
+                db.query(Job.id, Job.title, Job.description, Job.location, Job.remote)
+                .filter(Job.id > run.last_job_id)
+                .order_by(Job.id)
+                .limit(chunk_size)
+                .all()
+            )
+            if not chunk:
+                break
+            stages = [policy.keyword_stage(job.title, job.description, job.location, job.remote) for job in chunk]
+            candidates = [job for job, stage in zip(chunk, stages) if stage.passed]
+            scores = iter(
+                scorer.score_many(
+                    [f"{job.title} {job.description}" for job in candidates],
+                    batch_size=settings.NLP_BATCH_SIZE,
+                )
+                if candidates
+                else []
+            )
+            rows = []
+            for job, stage in zip(chunk, stages):
+                semantic = float(next(scores)) if stage.passed else None
+                score = policy.combine(stage.score, semantic) if stage.passed else 0.0
+                row = {"id": job.id, "relevance_score": score, "semantic_score": semantic}
+                if policy.keyword_matcher is not None:
+                    row["keywords_matched"] = ", ".join(stage.matched)
+                rows.append(row)
+            db.execute(update(Job), rows)
+            run.last_job_id = chunk[-1].id
+            run.processed_count += len(chunk)
+            run.total_count = max(run.total_count, run.processed_count)
+            db.commit()
+            bump_data_version(db)
+            flush_embedding_cache(scorer)
+        run.status = "done"
+        run.finished_at = datetime.now(timezone.utc)
+        db.commit()
+        logger.info("Re-scored %d jobs for model %s", run.processed_count, run.model_id)
+    except Exception as exc:
+        db.rollback()
+        run.status = "failed"
+        run.error = str(exc)
+        db.commit()
+        logger.error("Re-score %s failed at job id %s: %s", run.run_id, run.last_job_id, exc)
+    return run
+
+
+if __name__ == "__main__":
+    from .database import SessionLocal, init_db
+    from .nlp import get_nlp_scorer
+
+    logging.basicConfig(level=logging.INFO)
+    init_db()
+    scorer = get_nlp_scorer()
+    if scorer is None:
+        raise SystemExit("NLP scoring is not configured; nothing to re-score")
+    session = SessionLocal()
+    try:
+        keywords, locations = stored_keywords(session), stored_locations(session)
+        run = start_rescore(session, scorer.model_id, keywords=keywords, locations=locations)
+        run_rescore(session, run, scorer, keywords=keywords, locations=locations)
+    finally:
+        session.close()
@@ -1,6 +1,7 @@
+import argparse
 import logging
 
-from .crawl_runner import execute_crawl
+from .crawl_runner import execute_crawl, find_resumable_run, resume_run
 from .database import SessionLocal, init_db
 from .main import init_default_settings
 
@@ -8,17 +9,35 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def run_once() -> None:
-    """Initialize the DB (if needed) and execute one crawl cycle."""
+def run_once(resume_run_id: str | None = None, resume_latest: bool = False) -> None:
+    """Initialize the DB (if needed) and execute one crawl cycle.
+
+    ``resume_run_id`` continues a specific interrupted run; ``resume_latest``
+    continues the most recent interrupted v2 run if there is one, else starts fresh.
+    """
     init_db()
     db = SessionLocal()
     try:
         init_default_settings(db)
-        result = execute_crawl(db, send_notifications=True)
+        if resume_latest and not resume_run_id:
+            pending = find_resumable_run(db)
+            resume_run_id = pending.run_id if pending else None
+        if resume_run_id:
+            result = resume_run(db, resume_run_id)
+        else:
+            result = execute_crawl(db, send_notifications=True)
         logger.info(result.message)
     finally:
         db.close()
 
 
 if __name__ == "__main__":
-    run_once()
+    parser = argparse.ArgumentParser(description="Run one crawl cycle.")
+    parser.add_argument("--resume", metavar="RUN_ID", help="continue an interrupted crawl run")
+    parser.add_argument(
+        "--resume-latest",
+        action="store_true",
+        help="continue the latest interrupted v2 run (last 24h, checkpoints stale) instead of starting a new one",
+    )
+    args = parser.parse_args()
+    run_once(resume_run_id=args.resume, resume_latest=args.resume_latest)
@@ -1,7 +1,6 @@
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 import logging
-import json
 
 logger = logging.getLogger(__name__)
 
@@ -29,19 +28,12 @@ def scheduled_crawl(app):
 def start_scheduler(app):
     """Start the background scheduler"""
     from .database import SessionLocal
-    from .models import Settings as SettingsModel
-    from .config import settings
+    from .settings_store import get_settings_snapshot
     
     db = SessionLocal()
     try:
-        schedule_setting = db.query(SettingsModel).filter(SettingsModel.key == "schedule").first()
-        if schedule_setting:
-            schedule_data = json.loads(schedule_setting.value)
-            hour = schedule_data.get("hour", settings.CRAWL_SCHEDULE_HOUR)
-            minute = schedule_data.get("minute", settings.CRAWL_SCHEDULE_MINUTE)
-        else:
-            hour = settings.CRAWL_SCHEDULE_HOUR
-            minute = settings.CRAWL_SCHEDULE_MINUTE
+        snapshot = get_settings_snapshot(db)
+        hour, minute = snapshot.crawl_hour, snapshot.crawl_minute
         
         scheduler.add_job(
             scheduled_crawl,
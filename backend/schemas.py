@@ -23,6 +23,8 @@ class JobBase(BaseModel):
 
 class JobCreate(JobBase):
     job_hash: str
+    job_key: Optional[str] = None
+    job_fingerprint: Optional[str] = None
     relevance_score: float = 0.0
     keywords_matched: Optional[str] = None
 
@@ -37,6 +39,8 @@ class JobResponse(JobBase):
     keywords_matched: Optional[str] = None
     source_detail: Optional[str] = None
     source_meta: Optional[Dict[str, Any]] = None
+    duplicate_group_id: Optional[str] = None
+    profile_score: Optional[float] = None
     applied: bool
     notes: Optional[str] = None
     created_at: datetime
@@ -45,6 +49,60 @@ class JobResponse(JobBase):
     class Config:
         from_attributes = True
 
+class JobListItem(BaseModel):
+    """A job card in ``/api/jobs``; ``fields=`` may omit any key but ``id``."""
+    id: int
+    title: Optional[str] = None
+    company: Optional[str] = None
+    location: Optional[str] = None
+    url: Optional[str] = None
+    source: Optional[str] = None
+    remote: Optional[bool] = None
+    post_date: Optional[str] = None
+    relevance_score: Optional[float] = None
+    keywords_matched: Optional[str] = None
+    duplicate_group_id: Optional[str] = None
+    profile_score: Optional[float] = None
+    applied: Optional[bool] = None
+    created_at: Optional[datetime] = None
+    snippet: Optional[str] = None
+
+class ProfileCreate(BaseModel):
+    name: str = Field(min_length=1)
+    profile_text: str = Field(min_length=1)
+
+
+class ProfileUpdate(BaseModel):
+    name: Optional[str] = Field(default=None, min_length=1)
+    profile_text: Optional[str] = Field(default=None, min_length=1)
+
+
+class ProfileResponse(BaseModel):
+    id: int
+    name: str
+    profile_text: str
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class RescoreStatus(BaseModel):
+    run_id: str
+    status: str
+    model_id: str
+    processed_count: int
+    total_count: int
+    error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
 class SettingsSchema(BaseModel):
     keywords: List[str]
     locations: List[str]
@@ -57,6 +115,11 @@ class SettingsSchema(BaseModel):
     crawl_hour: int
     crawl_minute: int
 
+class CrawlJobStatus(BaseModel):
+    run_id: str
+    status: str  # queued, running, done, failed
+    coalesced: bool = False  # joined a crawl that was already queued or running
+
 class CrawlResult(BaseModel):
     status: str
     jobs_found: int
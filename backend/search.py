@@ -0,0 +1,148 @@
+"""Full-text job search backed by an SQLite FTS5 index.
+
+``jobs_fts`` is an external-content FTS5 table over the title, company,
+description and location of ``jobs``. Triggers keep it in sync with every
+insert, delete and content update, whichever code path writes the row.
+Matches are ranked by BM25 blended with ``relevance_score``. A search
+matching more than ``SEARCH_RANK_MAX_HITS`` jobs is only filtered and keeps
+the plain ``relevance_score`` order, which the score index serves without
+ranking every hit. Databases without the index (an SQLite build lacking
+FTS5, or a schema that was never migrated) fall back to ``ilike``
+substring filters.
+"""
+from __future__ import annotations
+
+import logging
+import re
+import weakref
+from typing import Optional, Tuple
+
+from sqlalchemy import column, func, literal_column, select, table, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Query, Session
+
+from .config import settings
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+# bm25() weights, in jobs_fts column order: title, company, description, location
+BM25_WEIGHTS = (10.0, 5.0, 1.0, 2.0)
+
+_FTS_COLUMNS = "title, company, description, location"
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+_jobs_fts = table("jobs_fts", column("rowid"))
+_indexed_binds: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def ensure_search_index(engine) -> bool:
+    """Create ``jobs_fts`` and its sync triggers; backfill it on first creation."""
+    try:
+        with engine.begin() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'")
+            ).first()
+            conn.execute(
+                text(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5({_FTS_COLUMNS}, "
+                    "content='jobs', content_rowid='id', tokenize='unicode61 remove_diacritics 2')"
+                )
+            )
+            conn.execute(
+                text(
+                    "CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN "
+                    f"INSERT INTO jobs_fts(rowid, {_FTS_COLUMNS}) "
+                    "VALUES (new.id, new.title, new.company, new.description, new.location); END"
+                )
+            )
+            conn.execute(
+                text(
+                    "CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN "
+                    f"INSERT INTO jobs_fts(jobs_fts, rowid, {_FTS_COLUMNS}) "
+                    "VALUES ('delete', old.id, old.title, old.company, old.description, old.location); END"
+                )
+            )
+            # only content columns: last_seen_at/score updates do not touch the index
+            conn.execute(
+                text(
+                    f"CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE OF {_FTS_COLUMNS} ON jobs BEGIN "
+                    f"INSERT INTO jobs_fts(jobs_fts, rowid, {_FTS_COLUMNS}) "
+                    "VALUES ('delete', old.id, old.title, old.company, old.description, old.location); "
+                    f"INSERT INTO jobs_fts(rowid, {_FTS_COLUMNS}) "
+                    "VALUES (new.id, new.title, new.company, new.description, new.location); END"
+                )
+            )
+            if not exists:
+                conn.execute(text("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')"))
+    except OperationalError as exc:
+        logger.warning("Full-text search unavailable, using substring search: %s", exc)
+        return False
+    _indexed_binds[engine] = True
+    return True
+
+
+def has_search_index(db: Session) -> bool:
+    bind = db.get_bind()
+    if _indexed_binds.get(bind):
+        return True
+    found = db.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'")
+    ).first()
+    if found:
+        _indexed_binds[bind] = True
+    return bool(found)
+
+
+def match_expression(q: str) -> Optional[str]:
+    """FTS5 query for free text: every word must match, the last one as a prefix.
+
+    Words are quoted, so FTS5 operators and punctuation in user input are inert.
+    """
+    tokens = _TOKEN_RE.findall(q)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"' for token in tokens) + "*"
+
+
+def apply_search(db: Session, query: Query, q: str) -> Tuple[Query, Optional[object]]:
+    """Restrict ``query`` to jobs matching ``q``.
+
+    Returns the filtered query and, when results should be ranked by text
+    relevance, the hits subquery whose ``rank`` column (BM25, lower is
+    better) can order them.
+    """
+    expression = match_expression(q)
+    if expression is None or not has_search_index(db):
+        pattern = f"%{q}%"
+        return (
+            query.filter(
+                Job.title.ilike(pattern) | Job.company.ilike(pattern) | Job.description.ilike(pattern)
+            ),
+            None,
+        )
+    match = text("jobs_fts MATCH :fts_query").bindparams(fts_query=expression)
+    hit_count = db.execute(select(func.count()).select_from(_jobs_fts).where(match)).scalar()
+    if hit_count > settings.SEARCH_RANK_MAX_HITS:
+        # unary + keeps SQLite walking the relevance_score index (early exit at LIMIT)
+        return query.filter(literal_column("+jobs.id").in_(select(_jobs_fts.c.rowid).where(match))), None
+    weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+    hits = (
+        select(
+            _jobs_fts.c.rowid.label("id"),
+            literal_column(f"bm25(jobs_fts, {weights})").label("rank"),
+        )
+        .select_from(_jobs_fts)
+        .where(match)
+        .subquery("search_hits")
+    )
+    return query.join(hits, hits.c.id == Job.id), hits
+
+
+def search_score(hits):
+    """Blend text relevance into the stored score (bm25 is negative; better is lower)."""
+    return Job.relevance_score - hits.c.rank * settings.SEARCH_BM25_WEIGHT
+
+
+def search_order(hits):
+    return search_score(hits).desc()
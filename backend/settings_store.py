@@ -0,0 +1,185 @@
+"""Typed, cached view of the ``settings`` table.
+
+``load_settings`` reads every row with one query into a frozen
+``SettingsSnapshot`` (defaults filled in, JSON decoded once). SQLite
+triggers bump a ``settings_version`` row on any insert, update or delete
+in ``settings``, whichever process or code path writes it. So
+``get_settings_snapshot`` only has to compare that single row against the
+cached snapshot and reloads when it moved. The cached snapshot is shared by
+every caller, so its lists are tuples and its dicts read-only mappings;
+``thaw`` returns mutable copies. Without the triggers (not
+SQLite, or never migrated) there is no version row and every call loads.
+Writes go through ``save_settings`` in one transaction.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import weakref
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from .config import settings
+from .models import Settings as SettingsModel
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "settings_version"
+
+_BUMP = (
+    f"INSERT INTO settings(key, value) VALUES ('{VERSION_KEY}', '1') "
+    "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+)
+
+_snapshots: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    keywords: Tuple[str, ...]
+    locations: Tuple[str, ...]
+    sources: Mapping[str, bool]  # stored flags over the JOB_SOURCES defaults
+    greenhouse_boards: Tuple[Any, ...]
+    india_mode: bool
+    linkedin_mode: str
+    linkedin_email: Mapping[str, Any]
+    linkedin_crawl: Mapping[str, Any]
+    crawl_hour: int
+    crawl_minute: int
+    version: Optional[str] = field(default=None, compare=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Mutable copy of every setting (``version`` excluded)."""
+        return {f.name: thaw(getattr(self, f.name)) for f in fields(self) if f.name != "version"}
+
+
+def _freeze(value):
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    """Deep copy of a snapshot value with lists and dicts again."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+def _defaults() -> Dict[str, Any]:
+    return {
+        "keywords": settings.DEFAULT_KEYWORDS,
+        "locations": settings.DEFAULT_LOCATIONS,
+        "sources": settings.JOB_SOURCES,
+        "schedule": {"hour": settings.CRAWL_SCHEDULE_HOUR, "minute": settings.CRAWL_SCHEDULE_MINUTE},
+        "greenhouse_boards": settings.GREENHOUSE_BOARDS,
+        "india_mode": settings.INDIA_MODE,
+        "linkedin_mode": settings.LINKEDIN_MODE,
+        "linkedin_email": settings.LINKEDIN_EMAIL,
+        "linkedin_crawl": settings.LINKEDIN_CRAWL,
+    }
+
+
+def ensure_settings_version(engine) -> bool:
+    """Create the triggers that bump ``settings_version`` on every settings write."""
+    if engine.url.get_backend_name() != "sqlite":
+        return False
+    guard = f"WHEN {{row}}.key != '{VERSION_KEY}'"
+    try:
+        with engine.begin() as conn:
+            for name, event, row in (("ai", "INSERT", "new"), ("au", "UPDATE", "new"), ("ad", "DELETE", "old")):
+                conn.execute(
+                    text(
+                        f"CREATE TRIGGER IF NOT EXISTS settings_version_{name} AFTER {event} ON settings "
+                        f"{guard.format(row=row)} BEGIN {_BUMP}; END"
+                    )
+                )
+            conn.execute(
+                text(f"INSERT INTO settings(key, value) VALUES ('{VERSION_KEY}', '1') ON CONFLICT(key) DO NOTHING")
+            )
+    except OperationalError as exc:
+        logger.warning("Settings version triggers unavailable, settings are read per call: %s", exc)
+        return False
+    return True
+
+
+def _decode(key: str, value: Optional[str], default):
+    if not value:
+        return default
+    try:
+        return json.loads(value)
+    except ValueError:
+        logger.warning("Ignoring malformed %s setting", key)
+        return default
+
+
+def load_settings(db: Session) -> SettingsSnapshot:
+    """Read every setting with one query."""
+    stored = {row.key: row.value for row in db.query(SettingsModel.key, SettingsModel.value)}
+    values = {key: _decode(key, stored.get(key), default) for key, default in _defaults().items()}
+    schedule = values["schedule"]
+    return SettingsSnapshot(
+        keywords=_freeze(values["keywords"]),
+        locations=_freeze(values["locations"]),
+        sources=_freeze({**settings.JOB_SOURCES, **(values["sources"] or {})}),
+        greenhouse_boards=_freeze(values["greenhouse_boards"] or settings.GREENHOUSE_BOARDS),
+        india_mode=values["india_mode"],
+        linkedin_mode=values["linkedin_mode"],
+        linkedin_email=_freeze(values["linkedin_email"]),
+        linkedin_crawl=_freeze(values["linkedin_crawl"]),
+        crawl_hour=schedule.get("hour", settings.CRAWL_SCHEDULE_HOUR),
+        crawl_minute=schedule.get("minute", settings.CRAWL_SCHEDULE_MINUTE),
+        version=stored.get(VERSION_KEY),
+    )
+
+
+def get_settings_snapshot(db: Session) -> SettingsSnapshot:
+    """The cached snapshot for this database, reloaded when its version moved."""
+    bind = db.get_bind()
+    version = db.query(SettingsModel.value).filter(SettingsModel.key == VERSION_KEY).scalar()
+    with _lock:
+        cached = _snapshots.get(bind)
+    if version is not None and cached is not None and cached.version == version:
+        return cached
+    snapshot = load_settings(db)
+    if snapshot.version is not None:
+        with _lock:
+            _snapshots[bind] = snapshot
+    return snapshot
+
+
+def save_settings(db: Session, values: Dict[str, Any]) -> None:
+    """Write ``{key: JSON-able value}`` in one transaction."""
+    rows = {row.key: row for row in db.query(SettingsModel).filter(SettingsModel.key.in_(list(values)))}
+    for key, value in values.items():
+        encoded = json.dumps(value)
+        if key in rows:
+            rows[key].value = encoded
+        else:
+            db.add(SettingsModel(key=key, value=encoded))
+    db.commit()
+
+
+def init_default_settings(db: Session) -> None:
+    """Store defaults for missing settings and merge in newly added sources."""
+    stored = {row.key: row.value for row in db.query(SettingsModel.key, SettingsModel.value)}
+    defaults = _defaults()
+    values = {key: default for key, default in defaults.items() if not stored.get(key)}
+    if stored.get("sources"):
+        values["sources"] = {**settings.JOB_SOURCES, **_decode("sources", stored["sources"], {})}
+    if stored.get("greenhouse_boards") and not _decode("greenhouse_boards", stored["greenhouse_boards"], None):
+        values["greenhouse_boards"] = settings.GREENHOUSE_BOARDS
+    # the INDIA_MODE environment variable always wins
+    values["india_mode"] = settings.INDIA_MODE
+    save_settings(db, values)
@@ -0,0 +1,168 @@
+"""Request latency on the dashboard endpoints as concurrent users grow.
+
+Builds a throwaway SQLite file with synthetic postings and drives the real
+FastAPI app in-process (httpx over ASGI, no network). Each simulated user
+sends ``--requests`` /api/jobs queries one after another; every query
+string is unique, so the response cache never answers. Reports p50/p99
+latency and throughput per concurrency level, plus the p99 of a cheap
+single-job lookup sent alongside the load and the p99 event-loop lag (how
+late a 5 ms timer fires). When database work runs on the event loop, the
+lag grows to the length of a query and every request, however cheap, waits
+for the queries already queued ahead of it. Throughput is bounded by the
+CPU either way: with one core, moving queries to the threadpool keeps the
+loop responsive but does not make /api/jobs faster.
+
+    python -m benchmarks.bench_concurrency [--rows 50000] [--users 1 10] [--requests 20]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import ensure_schema, get_db
+from backend.main import app
+from backend.models import Base, Job
+
+WORDS = (
+    "design operate services platform team remote build customers product data pipelines scale "
+    "reliable mentor review code cloud infrastructure deploy monitor support growth startup"
+).split()
+TECH = "python golang rust react kubernetes postgres kafka terraform django fastapi".split()
+SOURCES = ["remoteok", "greenhouse", "weworkremotely", "linkedin"]
+
+
+def build(path: Path, rows: int) -> sessionmaker:
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    ensure_schema(engine)
+    rng = random.Random(rows)
+    with engine.begin() as conn:
+        for start in range(0, rows, 10000):
+            conn.execute(
+                insert(Job),
+                [
+                    {
+                        "job_key": f"k{i}",
+                        "job_hash": f"k{i}",
+                        "title": f"Engineer {i} ({rng.choice(TECH)})",
+                        "company": f"Company {i % 2000}",
+                        "location": "Remote",
+                        "description": " ".join(rng.choices(WORDS, k=80) + rng.sample(TECH, 3)),
+                        "url": f"https://example.com/{i}",
+                        "source": SOURCES[i % len(SOURCES)],
+                        "remote": i % 3 == 0,
+                        "applied": i % 7 == 0,
+                        "relevance_score": rng.random() * 10,
+                    }
+                    for i in range(start, min(rows, start + 10000))
+                ],
+            )
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def queries(rows: int):
+    """Endless, never-repeating mix of the dashboard's /api/jobs requests."""
+    pages = max(1, rows // 100)
+    for n in itertools.count():
+        offset = (n % pages) * 100
+        yield (
+            f"/api/jobs?limit=100&offset={offset}&n={n}",
+            f"/api/jobs?limit=100&source={SOURCES[n % len(SOURCES)]}&applied=false&n={n}",
+            f"/api/jobs?limit=50&q={TECH[n % len(TECH)]}&n={n}",
+        )[n % 3]
+
+
+async def run_level(users: int, requests: int, rows: int):
+    paths = queries(rows)
+    latencies = []
+    probes = []
+    lags = []
+    running = True
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def user():
+            for _ in range(requests):
+                path = next(paths)
+                started = time.perf_counter()
+                response = await client.get(path)
+                latencies.append((time.perf_counter() - started) * 1000)
+                response.raise_for_status()
+
+        async def probe():
+            # a cheap single-row lookup, as a detail view would send mid-scroll
+            while running:
+                started = time.perf_counter()
+                response = await client.get("/api/jobs/1")
+                probes.append((time.perf_counter() - started) * 1000)
+                response.raise_for_status()
+                await asyncio.sleep(0.01)
+
+        async def ticker():
+            while running:
+                started = time.perf_counter()
+                await asyncio.sleep(0.005)
+                lags.append((time.perf_counter() - started) * 1000 - 5)
+
+        async def load():
+            nonlocal running
+            await asyncio.gather(*(user() for _ in range(users)))
+            running = False
+
+        started = time.perf_counter()
+        await asyncio.gather(load(), probe(), ticker())
+        wall = time.perf_counter() - started
+    return (
+        percentile(latencies, 50),
+        percentile(latencies, 99),
+        len(latencies) / wall,
+        percentile(probes, 99),
+        percentile(lags, 99),
+    )
+
+
+def percentile(samples, pct: int) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--users", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        Session = build(Path(tmp) / "concurrency.db", args.rows)
+
+        def override_get_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = override_get_db
+        try:
+            print(f"/api/jobs over {args.rows} jobs, {args.requests} requests per user")
+            print(
+                f"  {'users':>5} {'p50 ms':>8} {'p99 ms':>8} {'req/s':>8} {'lookup p99 ms':>14} {'loop lag p99 ms':>16}"
+            )
+            for users in args.users:
+                p50, p99, rate, probe_p99, lag_p99 = asyncio.run(run_level(users, args.requests, args.rows))
+                print(f"  {users:5} {p50:8.1f} {p99:8.1f} {rate:8.1f} {probe_p99:14.1f} {lag_p99:16.1f}")
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+
+
+if __name__ == "__main__":
+    main()
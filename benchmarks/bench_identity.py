@@ -0,0 +1,89 @@
+"""Micro-benchmark for per-job identity hashing.
+
+Compares the previous call pattern (generate_key + generate_hash +
+canonical_url + fingerprint, each parsing/hashing on its own) with the
+single-pass ``compute_identity`` stage.
+
+    python -m benchmarks.bench_identity [--jobs 100000] [--repeat-ratio 0.3]
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import random
+import time
+
+from backend.crawl_engine.identity import canonical_url, compute_identity, content_fingerprint
+
+_uncached_canonical = canonical_url.__wrapped__
+
+
+def _legacy_key(title, company, url, source, post_date=None, location=None) -> str:
+    normalized_url = _uncached_canonical(url) if url else ""
+    if normalized_url:
+        return hashlib.sha256(f"{source or ''}|{normalized_url}".lower().encode()).hexdigest()
+    parts = [(source or "").lower(), title.lower(), company.lower(), (location or "").lower(), (post_date or "").lower()]
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+def legacy_identity(job: dict):
+    args = (job["title"], job["company"], job["url"], job["source"], job["post_date"], job["location"])
+    job_key = _legacy_key(*args)  # compute_keys -> generate_key
+    job_hash = _legacy_key(*args)  # compute_keys -> generate_hash -> generate_key
+    url = _uncached_canonical(job["url"])  # build_normalized -> canonical_url
+    fp = content_fingerprint(job["title"], job["company"], job["location"], job["description"])
+    return url, job_key, job_hash, fp
+
+
+def single_pass_identity(job: dict):
+    return compute_identity(
+        job["title"], job["company"], job["url"], job["source"], job["post_date"], job["location"], job["description"]
+    )
+
+
+def synthetic_jobs(n: int, repeat_ratio: float, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(n):
+        # a share of items repeat URLs (re-seen postings, query overlap)
+        ref = rng.randrange(max(1, i)) if i and rng.random() < repeat_ratio else i
+        jobs.append(
+            {
+                "title": f"Senior Python Engineer {ref % 997}",
+                "company": f"Company {ref % 313}",
+                "url": f"https://jobs.example{ref % 17}.com/postings/{ref}?utm_source=feed&ref=abc#apply",
+                "source": f"source{ref % 9}",
+                "post_date": "2024-06-01",
+                "location": "Remote",
+                "description": "Build APIs and data pipelines. " * 20,
+            }
+        )
+    return jobs
+
+
+def _time(fn, jobs) -> float:
+    start = time.perf_counter()
+    for job in jobs:
+        fn(job)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--repeat-ratio", type=float, default=0.3)
+    args = parser.parse_args()
+
+    jobs = synthetic_jobs(args.jobs, args.repeat_ratio)
+    canonical_url.cache_clear()
+    legacy = _time(legacy_identity, jobs)
+    single = _time(single_pass_identity, jobs)
+    info = canonical_url.cache_info()
+    print(f"jobs={len(jobs)} repeat_ratio={args.repeat_ratio}")
+    print(f"legacy       {legacy:.3f}s  {legacy / len(jobs) * 1e6:.2f} us/job")
+    print(f"single-pass  {single:.3f}s  {single / len(jobs) * 1e6:.2f} us/job  (x{legacy / single:.2f})")
+    print(f"canonical_url cache hits={info.hits} misses={info.misses}")
+
+
+if __name__ == "__main__":
+    main()
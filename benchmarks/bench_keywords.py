@@ -0,0 +1,83 @@
+"""Keyword scoring: per-keyword substring scans vs the compiled matcher.
+
+    python -m benchmarks.bench_keywords [--jobs 2000] [--keywords 50 300 1000]
+
+Descriptions are ~800 words of filler with a few percent tech terms, roughly
+what scraped postings look like once the markup is included.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from backend.keyword_matcher import KeywordMatcher
+
+VOCAB = (
+    "python java golang rust react vue angular django fastapi flask kubernetes docker terraform aws gcp azure "
+    "postgres mysql redis kafka spark airflow dbt snowflake pandas numpy pytorch tensorflow backend frontend "
+    "platform data machine learning engineer developer senior staff principal lead devops sre security mobile"
+).split()
+
+
+FILLER = (
+    "the and with our you will team work for a to of in on is are we as be experience role "
+    "company remote office build help customers product years strong skills <li> </li> <p> </p>"
+).split()
+
+
+def legacy_score(keywords, title, description):
+    title, description = title.lower(), description.lower()
+    score, matched = 0.0, []
+    for keyword in keywords:
+        kw = keyword.lower()
+        if kw in title:
+            score += 2.0
+            matched.append(keyword)
+        elif kw in description:
+            score += 1.0
+            matched.append(keyword)
+    return score, matched
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--keywords", type=int, nargs="+", default=[50, 300, 1000])
+    args = parser.parse_args()
+    rng = random.Random(0)
+    words = FILLER * 12 + VOCAB
+    jobs = [
+        (
+            " ".join(rng.choices(VOCAB + FILLER, k=5)),
+            "<div>" + " ".join(rng.choices(words, k=800)) + "</div>",
+        )
+        for _ in range(args.jobs)
+    ]
+    terms = VOCAB + [f"{a} {b}" for a in VOCAB for b in VOCAB if a != b]
+    print(f"{args.jobs} jobs (~{len(jobs[0][1])} chars each)")
+
+    for n_keywords in args.keywords:
+        keywords = rng.sample(terms, min(n_keywords, len(terms)))
+
+        start = time.perf_counter()
+        for title, description in jobs:
+            legacy_score(keywords, title, description)
+        legacy_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matcher = KeywordMatcher(keywords)
+        build_s = time.perf_counter() - start
+        start = time.perf_counter()
+        for title, description in jobs:
+            matcher.score(title, description)
+        matcher_s = time.perf_counter() - start
+
+        print(
+            f"{len(keywords):5d} keywords  substring loop {legacy_s:6.2f}s  "
+            f"matcher {matcher_s:6.2f}s (+{build_s * 1000:.0f} ms build)  x{legacy_s / matcher_s:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
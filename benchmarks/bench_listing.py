@@ -0,0 +1,130 @@
+"""Cost of one 500-row /api/jobs page: full ``JobResponse`` rows vs list items.
+
+Builds a throwaway SQLite file with synthetic postings (HTML descriptions of
+a few KB, requirements and ``source_meta`` like the real sources store),
+then times the first page both ways: the SQL fetch, the Python side
+(ORM hydration or list rows, response-model validation
+and JSON) and the payload size.
+
+    python -m benchmarks.bench_listing [--rows 20000] [--limit 500] [--repeat 5]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import ensure_schema
+from backend.listing import LIST_COLUMNS, LIST_FIELDS, make_snippet
+from backend.main import _coerce_source_meta
+from backend.models import Base, Job
+from backend.schemas import JobListItem, JobResponse
+
+WORDS = (
+    "design operate services platform team remote build customers product data pipelines scale "
+    "reliable mentor review code cloud infrastructure deploy monitor support growth startup"
+).split()
+
+
+def build(path: Path, rows: int) -> sessionmaker:
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    ensure_schema(engine)
+    rng = random.Random(rows)
+    with engine.begin() as conn:
+        for start in range(0, rows, 5000):
+            conn.execute(
+                insert(Job),
+                [
+                    {
+                        "job_key": f"k{i}",
+                        "job_hash": f"k{i}",
+                        "title": f"Engineer {i}",
+                        "company": f"Company {i % 500}",
+                        "location": "Remote",
+                        "description": "".join(
+                            f"<p>{' '.join(rng.choices(WORDS, k=40))}</p>" for _ in range(12)
+                        ),
+                        "requirements": " ".join(rng.choices(WORDS, k=120)),
+                        "source_meta": json.dumps({"departments": ["Engineering"], "offices": ["Remote"], "id": i}),
+                        "url": f"https://example.com/{i}",
+                        "source": "bench",
+                        "relevance_score": rng.random() * 10,
+                        "keywords_matched": "python, aws",
+                    }
+                    for i in range(start, min(rows, start + 5000))
+                ],
+            )
+    return sessionmaker(bind=engine)
+
+
+def full_page(db, limit: int):
+    started = time.perf_counter()
+    rows = db.execute(select(Job).order_by(Job.relevance_score.desc()).limit(limit)).fetchall()
+    fetched = time.perf_counter()
+    adapter = TypeAdapter(List[JobResponse])
+    jobs = adapter.validate_python([_coerce_source_meta(row[0]) for row in rows], from_attributes=True)
+    return fetched - started, adapter.dump_json(jobs)
+
+
+def list_page(db, limit: int):
+    columns = [name for name in LIST_FIELDS if name in LIST_COLUMNS]
+    started = time.perf_counter()
+    rows = (
+        db.query(Job)
+        .with_entities(*(LIST_COLUMNS[name] for name in columns))
+        .order_by(Job.relevance_score.desc())
+        .limit(limit)
+        .all()
+    )
+    fetched = time.perf_counter()
+    items = []
+    for row in rows:
+        item = dict(zip(columns, row))
+        item["snippet"] = make_snippet(item["snippet"])
+        items.append(item)
+    adapter = TypeAdapter(List[JobListItem])
+    return fetched - started, adapter.dump_json(adapter.validate_python(items), exclude_unset=True)
+
+
+def measure(Session, page, limit: int, repeat: int):
+    fetch, build_ms, size = [], [], 0
+    for _ in range(repeat):
+        db = Session()
+        start = time.perf_counter()
+        fetch_s, payload = page(db, limit)
+        fetch.append(fetch_s * 1000)
+        build_ms.append((time.perf_counter() - start - fetch_s) * 1000)
+        size = len(payload)
+        db.close()
+    return statistics.median(fetch), statistics.median(build_ms), size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        Session = build(Path(tmp) / "listing.db", args.rows)
+        full = measure(Session, full_page, args.limit, args.repeat)
+        listed = measure(Session, list_page, args.limit, args.repeat)
+    print(f"{args.limit}-row page of {args.rows} jobs, median of {args.repeat}")
+    print(f"  {'':18} {'sql ms':>8} {'python ms':>10} {'KiB':>9}")
+    for name, (fetch_ms, build_ms, size) in (("full JobResponse", full), ("JobListItem", listed)):
+        print(f"  {name:18} {fetch_ms:8.1f} {build_ms:10.1f} {size / 1024:9.1f}")
+    print(f"  python x{full[1] / listed[1]:.1f} less, payload x{full[2] / listed[2]:.1f} smaller")
+
+
+if __name__ == "__main__":
+    main()
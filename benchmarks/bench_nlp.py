@@ -0,0 +1,54 @@
+"""Throughput of per-job ``NLPScorer.score`` vs batched ``score_many``.
+
+Needs sentence-transformers and the configured model.
+
+    python -m benchmarks.bench_nlp [--jobs 2000] [--batch-size 32]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+
+from backend.config import settings
+from backend.nlp import NLPScorer, _module_available
+
+WORDS = (
+    "python backend engineer remote api cloud aws kubernetes data pipeline "
+    "react frontend design senior staff platform reliability sql postgres"
+).split()
+
+
+def _texts(n: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(WORDS, k=rng.randint(10, 250))) for _ in range(n)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=settings.NLP_BATCH_SIZE)
+    args = parser.parse_args()
+    if not _module_available("sentence_transformers"):
+        sys.exit("sentence-transformers is not installed")
+
+    scorer = NLPScorer(settings.PROFILE_TEXT)
+    texts = _texts(args.jobs)
+
+    start = time.perf_counter()
+    single = [scorer.score(t) for t in texts]
+    single_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = scorer.score_many(texts, batch_size=args.batch_size)
+    batched_s = time.perf_counter() - start
+
+    drift = max(abs(a - b) for a, b in zip(single, batched))
+    print(f"score      {single_s:.2f}s  {args.jobs / single_s:.0f} jobs/s")
+    print(f"score_many {batched_s:.2f}s  {args.jobs / batched_s:.0f} jobs/s  (batch {args.batch_size})")
+    print(f"speedup x{single_s / batched_s:.1f}, max score drift {drift:.2e}")
+
+
+if __name__ == "__main__":
+    main()
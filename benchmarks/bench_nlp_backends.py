@@ -0,0 +1,44 @@
+"""Load time, throughput and peak RSS of one NLPScorer backend.
+
+Run once per backend so RSS figures are not mixed between them:
+
+    python -m benchmarks.bench_nlp_backends --backend torch
+    NLP_ONNX_MODEL_DIR=models/onnx python -m benchmarks.bench_nlp_backends --backend int8
+"""
+from __future__ import annotations
+
+import argparse
+import resource
+import time
+
+from backend.config import settings
+from backend.nlp import NLP_BACKENDS, NLPScorer
+
+from .bench_nlp import _texts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", choices=NLP_BACKENDS, default=settings.NLP_BACKEND)
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=settings.NLP_BATCH_SIZE)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    scorer = NLPScorer(settings.PROFILE_TEXT, backend=args.backend)
+    load_s = time.perf_counter() - start
+
+    texts = _texts(args.jobs)
+    start = time.perf_counter()
+    scorer.score_many(texts, batch_size=args.batch_size)
+    score_s = time.perf_counter() - start
+
+    peak_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f"{args.backend:6s} load {load_s:.2f}s  "
+        f"{args.jobs / score_s:.0f} jobs/s (batch {args.batch_size})  peak RSS {peak_mib:.0f} MiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark the engine's per-job stage objects.
+
+``pydantic`` reproduces the previous hot path: RawJob -> compute_keys(raw.model_dump())
+-> NormalizedJob (HttpUrl validation) -> norm.dict() -> Job(**payload).
+``record`` is the current path: JobRecord.from_payload -> to_row() -> Job(**row).
+Reports wall time and tracemalloc peak / retained memory per batch, with all
+stage outputs held in a list as the engine does for one batch.
+
+    python -m benchmarks.bench_records [--jobs 10000]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from backend.crawl_engine.dedupe import compute_keys
+from backend.crawl_engine.normalize import build_normalized
+from backend.crawl_engine.types import JobRecord, RawJob
+from backend.models import Job
+
+
+def synthetic_payloads(n: int) -> list[dict]:
+    return [
+        {
+            "title": f"Backend Engineer {i}",
+            "company": f"Company {i % 500}",
+            "location": "Remote",
+            "description": "Design and operate Python services. " * 15,
+            "url": f"https://jobs.example.com/postings/{i}?utm_source=feed",
+            "source": "remotive",
+            "post_date": "2024-06-01T00:00:00",
+            "remote": True,
+            "source_meta": {"category": "Software Development", "remotive_id": i},
+        }
+        for i in range(n)
+    ]
+
+
+def pydantic_path(payload: dict) -> Job:
+    raw = RawJob(**payload)
+    job_key, job_hash = compute_keys(raw.model_dump())
+    norm = build_normalized(raw, job_hash, job_key)
+    row = norm.model_dump()
+    row["url"] = str(row["url"])
+    row["source_meta"] = json.dumps(row["source_meta"])
+    return Job(**row)
+
+
+def record_path(payload: dict) -> Job:
+    return Job(**JobRecord.from_payload(payload).to_row())
+
+
+def pydantic_stage(payload: dict):
+    raw = RawJob(**payload)
+    job_key, job_hash = compute_keys(raw.model_dump())
+    return build_normalized(raw, job_hash, job_key)
+
+
+def record_stage(payload: dict):
+    return JobRecord.from_payload(payload)
+
+
+def measure(fn, payloads: list[dict]) -> tuple[float, int, int]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    held = [fn(p) for p in payloads]
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return elapsed, peak, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=10_000)
+    args = parser.parse_args()
+    payloads = synthetic_payloads(args.jobs)
+
+    print(f"jobs={args.jobs} (times measured under tracemalloc)")
+    for label, fn in (
+        ("stage objects, pydantic", pydantic_stage),
+        ("stage objects, record", record_stage),
+        ("through Job(), pydantic", pydantic_path),
+        ("through Job(), record", record_path),
+    ):
+        elapsed, peak, retained = measure(fn, payloads)
+        print(
+            f"{label:<26} {elapsed:7.3f}s  peak={peak / 1024:9.0f} KiB  "
+            f"retained/job={retained / args.jobs:7.0f} B"
+        )
+
+
+if __name__ == "__main__":
+    main()
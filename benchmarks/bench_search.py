@@ -0,0 +1,102 @@
+"""Search latency on /api/jobs?q=: ``ilike`` substring scan vs the FTS5 index.
+
+Builds a throwaway SQLite file per size with synthetic postings (~600
+character descriptions), then times the first page (limit 100) of each
+query the way ``get_jobs`` runs it.
+
+    python -m benchmarks.bench_search [--rows 100000 1000000] [--repeat 5]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import ensure_schema
+from backend.models import Base, Job
+from backend.search import apply_search, search_order
+
+WORDS = (
+    "design operate services platform team remote build customers product data pipelines scale "
+    "reliable mentor review code cloud infrastructure deploy monitor support growth startup "
+    "collaborate ownership roadmap quality testing security performance api mobile web"
+).split()
+TECH = "python golang rust react kubernetes postgres kafka terraform django fastapi spark airflow".split()
+TITLES = ["Backend Engineer", "Data Engineer", "Frontend Developer", "SRE", "Product Designer", "Account Manager"]
+# broad terms (~25% of rows), a two-word AND, one company, and a miss
+QUERIES = ["python", "kube", "data engineer", "fastapi postgres", "company 4242", "haskell"]
+
+
+def build(path: Path, rows: int) -> sessionmaker:
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    ensure_schema(engine)
+    rng = random.Random(rows)
+    with engine.begin() as conn:
+        for start in range(0, rows, 10000):
+            conn.execute(
+                insert(Job),
+                [
+                    {
+                        "job_key": f"k{i}",
+                        "title": f"{rng.choice(TITLES)} ({rng.choice(TECH)})",
+                        "company": f"Company {i % 5000}",
+                        "location": "Remote",
+                        "description": " ".join(rng.choices(WORDS, k=70) + rng.sample(TECH, 3)),
+                        "url": f"https://example.com/{i}",
+                        "source": "bench",
+                        "relevance_score": rng.random() * 10,
+                    }
+                    for i in range(start, min(rows, start + 10000))
+                ],
+            )
+    return sessionmaker(bind=engine)
+
+
+def time_query(Session, q: str, use_fts: bool, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        db = Session()
+        start = time.perf_counter()
+        query = db.query(Job)
+        if use_fts:
+            query, hits = apply_search(db, query, q)
+            if hits is not None:
+                query = query.order_by(search_order(hits), Job.created_at.desc())
+            else:
+                query = query.order_by(Job.relevance_score.desc(), Job.created_at.desc())
+        else:
+            pattern = f"%{q}%"
+            query = query.filter(
+                Job.title.ilike(pattern) | Job.company.ilike(pattern) | Job.description.ilike(pattern)
+            ).order_by(Job.relevance_score.desc(), Job.created_at.desc())
+        query.limit(100).all()
+        samples.append((time.perf_counter() - start) * 1000)
+        db.close()
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            started = time.perf_counter()
+            Session = build(Path(tmp) / f"search_{rows}.db", rows)
+            print(f"{rows} rows (built in {time.perf_counter() - started:.0f}s), median ms for the first 100 hits")
+            for q in QUERIES:
+                ilike_ms = time_query(Session, q, False, args.repeat)
+                fts_ms = time_query(Session, q, True, args.repeat)
+                print(f"  {q!r:22} ilike {ilike_ms:8.1f}   fts5 {fts_ms:8.1f}   x{ilike_ms / fts_ms:.1f}")
+
+
+if __name__ == "__main__":
+    main()
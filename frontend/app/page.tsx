@@ -2,17 +2,20 @@
 
 import { useState, useEffect } from 'react';
 import Link from 'next/link';
-import { fetchJobs, triggerRescan, fetchRuns, Job, CrawlResult, CrawlRun } from '@/lib/api';
+import { fetchJobsPage, triggerRescan, watchRun, fetchRuns, JobSummary, CrawlResult, CrawlRun } from '@/lib/api';
 import JobCard from '@/components/JobCard';
 import FilterBar from '@/components/FilterBar';
 
 export default function HomePage() {
-  const [jobs, setJobs] = useState<Job[]>([]);
-  const [filteredJobs, setFilteredJobs] = useState<Job[]>([]);
+  const [jobs, setJobs] = useState<JobSummary[]>([]);
+  const [filteredJobs, setFilteredJobs] = useState<JobSummary[]>([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [scanning, setScanning] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const [scanResult, setScanResult] = useState<CrawlResult | null>(null);
+  const [scanProgress, setScanProgress] = useState<Record<string, number>>({});
   const [lastRun, setLastRun] = useState<CrawlRun | null>(null);
   
   const [searchQuery, setSearchQuery] = useState('');
@@ -32,8 +35,9 @@ export default function HomePage() {
     try {
       setLoading(true);
       setError(null);
-      const data = await fetchJobs();
-      setJobs(data);
+      const page = await fetchJobsPage();
+      setJobs(page.jobs);
+      setNextCursor(page.nextCursor);
     } catch (err) {
       setError('Failed to load jobs. Make sure the backend is running.');
       console.error('Error loading jobs:', err);
@@ -42,6 +46,21 @@ export default function HomePage() {
     }
   };
 
+  const loadMoreJobs = async () => {
+    if (!nextCursor) return;
+    try {
+      setLoadingMore(true);
+      const page = await fetchJobsPage({ cursor: nextCursor });
+      setJobs(prev => [...prev, ...page.jobs]);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      setError('Failed to load more jobs. Make sure the backend is running.');
+      console.error('Error loading more jobs:', err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const loadLastRun = async () => {
     try {
       const runs = await fetchRuns({ limit: 1 });
@@ -60,7 +79,7 @@ export default function HomePage() {
         job =>
           job.title.toLowerCase().includes(query) ||
           job.company.toLowerCase().includes(query) ||
-          job.description.toLowerCase().includes(query)
+          (job.snippet ?? '').toLowerCase().includes(query)
       );
     }
 
@@ -80,7 +99,11 @@ export default function HomePage() {
     try {
       setScanning(true);
       setScanResult(null);
-      const result = await triggerRescan();
+      setScanProgress({});
+      const job = await triggerRescan();
+      const result = await watchRun(job.run_id, progress =>
+        setScanProgress(prev => ({ ...prev, [progress.source]: progress.jobs_inserted_count ?? 0 }))
+      );
       setScanResult(result);
       await loadJobs();
       await loadLastRun();
@@ -120,6 +143,14 @@ export default function HomePage() {
       </header>
 
       <main className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-8">
+        {scanning && Object.keys(scanProgress).length > 0 && (
+          <div className="mb-6 bg-blue-50 border border-blue-200 rounded-lg p-4 text-sm text-blue-800">
+            Crawling:{' '}
+            {Object.entries(scanProgress)
+              .map(([source, inserted]) => `${source} (${inserted} new)`)
+              .join(', ')}
+          </div>
+        )}
         {scanResult && (
           <div className="mb-6 bg-green-50 border border-green-200 rounded-lg p-4">
             <div className="flex">
@@ -222,6 +253,18 @@ export default function HomePage() {
             ))}
           </div>
         )}
+
+        {!loading && nextCursor && (
+          <div className="flex justify-center mt-8">
+            <button
+              onClick={loadMoreJobs}
+              disabled={loadingMore}
+              className="px-6 py-2 border border-gray-300 text-sm font-medium rounded-md text-gray-700 bg-white hover:bg-gray-50 disabled:opacity-50"
+            >
+              {loadingMore ? 'Loading...' : 'Load more'}
+            </button>
+          </div>
+        )}
       </main>
     </div>
   );
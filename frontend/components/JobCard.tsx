@@ -1,10 +1,10 @@
 'use client';
 
 import Link from 'next/link';
-import { Job } from '@/lib/api';
+import { JobSummary } from '@/lib/api';
 
 interface JobCardProps {
-  job: Job;
+  job: JobSummary;
 }
 
 export default function JobCard({ job }: JobCardProps) {
@@ -48,7 +48,7 @@ export default function JobCard({ job }: JobCardProps) {
           </div>
         )}
         
-        <p className="text-gray-600 text-sm line-clamp-2">{job.description}</p>
+        <p className="text-gray-600 text-sm line-clamp-2">{job.snippet}</p>
         
         <div className="mt-4 text-xs text-gray-500">
           Posted: {new Date(job.created_at).toLocaleDateString()}
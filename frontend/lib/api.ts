@@ -24,12 +24,33 @@ export interface Job {
   job_hash: string;
   relevance_score: number;
   keywords_matched?: string;
+  duplicate_group_id?: string;
+  profile_score?: number;
   applied: boolean;
   notes?: string;
   created_at: string;
   updated_at?: string;
 }
 
+// Row of the /api/jobs listing; the full record comes from fetchJob.
+export interface JobSummary {
+  id: number;
+  title: string;
+  company: string;
+  location: string;
+  url: string;
+  source: string;
+  remote: boolean;
+  post_date?: string;
+  relevance_score: number;
+  keywords_matched?: string;
+  duplicate_group_id?: string;
+  profile_score?: number;
+  applied: boolean;
+  created_at: string;
+  snippet?: string;
+}
+
 export interface Settings {
   keywords: string[];
   locations: string[];
@@ -48,12 +69,28 @@ export interface CrawlResult {
   jobs_found: number;
   jobs_added: number;
   message: string;
+  run_id?: string;
+}
+
+export interface CrawlJob {
+  run_id: string;
+  status: string;
+  coalesced: boolean;
+}
+
+export interface CrawlProgress {
+  source: string;
+  stage: string;
+  jobs_parsed_count?: number;
+  jobs_inserted_count?: number;
+  errors?: string[];
 }
 
 export interface Stats {
   total_jobs: number;
   applied_jobs: number;
   pending_jobs: number;
+  remote_jobs: number;
   sources: Record<string, number>;
 }
 
@@ -81,19 +118,44 @@ export interface SourceStateView {
   last_metrics?: Record<string, any>;
 }
 
-export const fetchJobs = async (params?: {
+export interface Profile {
+  id: number;
+  name: string;
+  profile_text: string;
+  created_at?: string;
+  updated_at?: string;
+}
+
+export interface JobQueryParams {
   q?: string;
   location?: string;
   applied?: boolean;
   source?: string[] | string;
   remote?: boolean;
+  collapse?: boolean;
+  profile?: string;
   limit?: number;
   offset?: number;
-}): Promise<Job[]> => {
-  const response = await api.get('/api/jobs', { params: { ...params, _t: Date.now() } });
+  cursor?: string;
+  fields?: string;
+}
+
+export interface JobsPage {
+  jobs: JobSummary[];
+  nextCursor: string | null;
+}
+
+export const fetchJobs = async (params?: JobQueryParams): Promise<JobSummary[]> => {
+  const response = await api.get('/api/jobs', { params });
   return response.data;
 };
 
+// Pass nextCursor back as `cursor` for the following page; null means no more rows.
+export const fetchJobsPage = async (params?: JobQueryParams): Promise<JobsPage> => {
+  const response = await api.get('/api/jobs', { params });
+  return { jobs: response.data, nextCursor: response.headers['x-next-cursor'] ?? null };
+};
+
 export const fetchJob = async (id: number): Promise<Job> => {
   const response = await api.get(`/api/jobs/${id}`);
   return response.data;
@@ -104,11 +166,53 @@ export const updateJob = async (id: number, data: { applied?: boolean; notes?: s
   return response.data;
 };
 
-export const triggerRescan = async (): Promise<CrawlResult> => {
+// Queues a crawl (or joins the one already running); follow it with watchRun.
+export const triggerRescan = async (): Promise<CrawlJob> => {
   const response = await api.post('/api/rescan');
   return response.data;
 };
 
+// Streams /api/runs/{id}/events until the crawl finishes.
+export const watchRun = (runId: string, onProgress?: (progress: CrawlProgress) => void): Promise<CrawlResult> =>
+  new Promise((resolve, reject) => {
+    const source = new EventSource(`${API_BASE_URL}/api/runs/${runId}/events`);
+    source.addEventListener('progress', event => onProgress?.(JSON.parse((event as MessageEvent).data)));
+    source.addEventListener('done', event => {
+      source.close();
+      resolve(JSON.parse((event as MessageEvent).data));
+    });
+    source.addEventListener('failed', event => {
+      source.close();
+      reject(new Error(JSON.parse((event as MessageEvent).data).error));
+    });
+    source.onerror = () => {
+      source.close();
+      reject(new Error('Lost connection to the crawl event stream'));
+    };
+  });
+
+export const fetchProfiles = async (): Promise<Profile[]> => {
+  const response = await api.get('/api/profiles');
+  return response.data;
+};
+
+export const createProfile = async (data: { name: string; profile_text: string }): Promise<Profile> => {
+  const response = await api.post('/api/profiles', data);
+  return response.data;
+};
+
+export const updateProfile = async (
+  id: number,
+  data: { name?: string; profile_text?: string }
+): Promise<Profile> => {
+  const response = await api.put(`/api/profiles/${id}`, data);
+  return response.data;
+};
+
+export const deleteProfile = async (id: number): Promise<void> => {
+  await api.delete(`/api/profiles/${id}`);
+};
+
 export const fetchSettings = async (): Promise<Settings> => {
   const response = await api.get('/api/settings');
   return response.data;
@@ -124,7 +228,7 @@ export const fetchStats = async (): Promise<Stats> => {
   return response.data;
 };
 
-export const fetchRuns = async (params?: { limit?: number; offset?: number }): Promise<CrawlRun[]> => {
+export const fetchRuns = async (params?: { limit?: number; offset?: number; cursor?: string }): Promise<CrawlRun[]> => {
   const response = await api.get('/api/runs', { params });
   return response.data;
 };
@@ -0,0 +1,181 @@
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend import crawl_jobs as crawl_jobs_module, crawl_runner, main
+from backend.config import settings
+from backend.crawl_engine.state import ensure_state_table
+from backend.crawl_jobs import crawl_jobs
+from backend.database import get_db
+from backend.models import Base, CrawlRun, Job, Settings as SettingsModel
+from backend.schemas import CrawlResult, JobCreate
+
+
+def _events(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_rescan_returns_at_once_coalesces_and_streams_progress(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path/'jobs.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    only_remoteok = {name: name == "remoteok" for name in settings.JOB_SOURCES}
+    db.add(SettingsModel(key="sources", value=json.dumps(only_remoteok)))
+    db.commit()
+    db.close()
+
+    release = threading.Event()
+
+    def slow_remoteok(self):
+        release.wait(10)
+        return [
+            JobCreate(
+                title="Python Engineer",
+                company="Acme",
+                location="Remote",
+                description="Python",
+                url="https://example.com/1",
+                source="RemoteOK",
+                job_hash="h1",
+            )
+        ]
+
+    monkeypatch.setattr(crawl_runner.JobCrawler, "crawl_remoteok", slow_remoteok)
+
+    def override_db():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    main.app.dependency_overrides[get_db] = override_db
+    try:
+        client = TestClient(main.app)
+        first = client.post("/api/rescan")
+        second = client.post("/api/rescan")
+        release.set()
+        run_id = first.json()["run_id"]
+        events = _events(client.get(f"/api/runs/{run_id}/events").text)
+        replay = _events(client.get(f"/api/runs/{run_id}/events").text)
+        missing = client.get("/api/runs/nope/events")
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert first.status_code == 202 and first.json()["status"] in ("queued", "running")
+    assert second.json()["run_id"] == run_id and second.json()["coalesced"] is True
+    names = [name for name, _ in events]
+    assert names[0] == "status" and names[-1] == "done"
+    progress = [data for name, data in events if name == "progress"]
+    assert {data["stage"] for data in progress} >= {"started", "done"}
+    assert all(data["source"] == "remoteok" for data in progress)
+    assert events[-1][1]["run_id"] == run_id and events[-1][1]["jobs_added"] == 1
+    assert replay == events
+    assert missing.status_code == 404
+    check = Session()
+    assert check.query(CrawlRun).filter(CrawlRun.run_id == run_id).count() == 1
+    assert check.query(Job).count() == 1
+    assert crawl_jobs.get(run_id).status == "done"
+
+
+def test_runs_from_other_processes_are_joined_and_followed_to_the_end(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path/'jobs.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    ensure_state_table(engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    now = datetime.now(timezone.utc)
+    db.add_all(
+        [
+            CrawlRun(run_id="finished", started_at=now, finished_at=now, fetched_count=3, inserted_new_count=2),
+            CrawlRun(run_id="abandoned", started_at=now - timedelta(hours=2)),
+            CrawlRun(run_id="live", started_at=now),
+        ]
+    )
+    db.commit()
+    db.close()
+    monkeypatch.setattr(main, "RUN_POLL_SECONDS", 0.05)
+
+    def override_db():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    def finish_live():
+        time.sleep(0.3)
+        with Session() as session:
+            session.query(CrawlRun).filter(CrawlRun.run_id == "live").update(
+                {CrawlRun.finished_at: datetime.now(timezone.utc), CrawlRun.inserted_new_count: 1}
+            )
+            session.commit()
+
+    main.app.dependency_overrides[get_db] = override_db
+    try:
+        client = TestClient(main.app)
+        joined = client.post("/api/rescan").json()
+        finished = _events(client.get("/api/runs/finished/events").text)
+        abandoned = _events(client.get("/api/runs/abandoned/events").text)
+        finisher = threading.Thread(target=finish_live)
+        finisher.start()
+        live = _events(client.get("/api/runs/live/events").text)
+        finisher.join()
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert joined == {"run_id": "live", "status": "running", "coalesced": True}
+    # same CrawlResult payload as a crawl this process ran
+    assert finished == [
+        (
+            "done",
+            {
+                "status": "success",
+                "jobs_found": 3,
+                "jobs_added": 2,
+                "message": "Found 3 jobs, added 2 new jobs",
+                "run_id": "finished",
+            },
+        )
+    ]
+    assert [name for name, _ in abandoned] == ["failed"]
+    assert [name for name, _ in live] == ["status", "done"]
+    assert live[-1][1]["jobs_added"] == 1
+
+
+def test_job_finishes_only_once_its_terminal_event_is_published(monkeypatch):
+    seen = []
+
+    class SpyJob(crawl_jobs_module.CrawlJob):
+        def __setattr__(self, name, value):
+            super().__setattr__(name, value)
+            if name == "status" and self.finished:
+                seen.append([event["event"] for event in self.events])
+
+    def execute_crawl(db, run_id, progress, **options):
+        if options.get("fail"):
+            raise RuntimeError("boom")
+        return CrawlResult(status="success", jobs_found=0, jobs_added=0, message="", run_id=run_id)
+
+    monkeypatch.setattr(crawl_jobs_module, "CrawlJob", SpyJob)
+    monkeypatch.setattr(crawl_runner, "execute_crawl", execute_crawl)
+    monkeypatch.setattr(crawl_jobs_module.CrawlJobManager, "_running_elsewhere", staticmethod(lambda bind, ignore: None))
+    manager = crawl_jobs_module.CrawlJobManager()
+    done, _ = manager.submit(None)
+    manager._executor.shutdown(wait=True)
+    manager = crawl_jobs_module.CrawlJobManager()
+    failed, _ = manager.submit(None, fail=True)
+    manager._executor.shutdown(wait=True)
+
+    assert seen == [["status", "status", "done"], ["status", "status", "failed"]]
+    assert done.finished and failed.finished
@@ -58,3 +58,22 @@ def test_scheduler_not_started_in_workflow_mode(monkeypatch):
         main.settings.CRAWL_MODE = original_mode
 
     assert started["flag"] is False
+
+
+def test_database_handlers_run_in_threadpool():
+    """An ``async def`` handler using the sync Session would block the event loop."""
+    import inspect
+
+    from fastapi.routing import APIRoute
+
+    from backend.database import get_db
+
+    def uses_db(dependant):
+        return any(dep.call is get_db or uses_db(dep) for dep in dependant.dependencies)
+
+    blocking = [
+        route.path
+        for route in main.app.routes
+        if isinstance(route, APIRoute) and uses_db(route.dependant) and inspect.iscoroutinefunction(route.endpoint)
+    ]
+    assert blocking == []
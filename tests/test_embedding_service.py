@@ -0,0 +1,59 @@
+import threading
+
+import numpy as np
+
+from backend.embedding_service import EmbeddingClient, EmbeddingServer, connect_embedding_service
+
+
+class RecordingEncoder:
+    def __init__(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def encode(self, texts, **kwargs):
+        with self.lock:
+            self.batches.append(len(texts))
+        vectors = np.array([[len(t), 1.0, 0.0] for t in texts], dtype=np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _serve(tmp_path, **kwargs):
+    encoder = RecordingEncoder()
+    server = EmbeddingServer(str(tmp_path / "embed.sock"), encoder, "fake-model", **kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, encoder
+
+
+def test_concurrent_clients_share_one_forward_pass(tmp_path):
+    server, encoder = _serve(tmp_path, max_batch=64, max_wait_ms=200)
+    try:
+        client = EmbeddingClient(server.socket_path)
+        assert client.model_id == "fake-model"
+        encoder.batches.clear()
+
+        barrier = threading.Barrier(4)
+        results = {}
+
+        def call(i):
+            texts = ["x" * (i + 1)] * (i + 1)
+            barrier.wait()
+            results[i] = client.encode(texts, normalize_embeddings=True)
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert encoder.batches == [10]
+        for i, embeddings in results.items():
+            expected = np.array([i + 1, 1.0, 0.0]) / np.linalg.norm([i + 1, 1.0, 0.0])
+            assert embeddings.shape == (i + 1, 3)
+            np.testing.assert_allclose(embeddings, np.tile(expected, (i + 1, 1)), rtol=1e-6)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_connect_returns_none_without_daemon(tmp_path):
+    assert connect_embedding_service(str(tmp_path / "missing.sock")) is None
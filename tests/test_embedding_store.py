@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.embedding_store import EmbeddingStore, prune_embeddings, text_key
+from backend.models import Base, JobEmbedding
+from backend.nlp import NLPScorer
+
+
+class FakeModel:
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts, **kwargs):
+        self.encoded.extend(texts)
+        vectors = np.array([[len(t), 1.0] for t in texts], dtype=np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path/'emb.db'}")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def _scorer(store):
+    scorer = NLPScorer.__new__(NLPScorer)
+    scorer.model = FakeModel()
+    scorer.store = store
+    scorer.profile_embedding = np.array([0.0, 1.0], dtype=np.float32)
+    return scorer
+
+
+def test_scorer_reuses_cached_embeddings_by_exact_text(tmp_path):
+    store = EmbeddingStore(_session_factory(tmp_path), "fake-model")
+    shared_prefix = "python engineer " + "x" * 300
+    texts = [shared_prefix + " remote", "data engineer role"]
+
+    first_scorer = _scorer(store)
+    first = first_scorer.score_many(texts)
+    assert store.flush() == 2
+    second_scorer = _scorer(EmbeddingStore(store.session_factory, "fake-model"))
+    second = second_scorer.score_many(texts + [shared_prefix + " onsite"])
+
+    # same leading text but a different ending is a different input: encoded again
+    assert second_scorer.model.encoded == [shared_prefix + " onsite"]
+    np.testing.assert_allclose(second[:2], first, atol=1e-3)
+    # a different model never sees these vectors
+    assert EmbeddingStore(store.session_factory, "other-model").get_many([text_key(texts[1])]) == {}
+
+
+def test_vectors_are_written_on_flush_and_pruned_by_last_use(tmp_path):
+    Session = _session_factory(tmp_path)
+    store = EmbeddingStore(Session, "fake-model")
+    store.put_many({"fresh": np.ones(2), "stale": np.ones(2)})
+    db = Session()
+    assert db.query(JobEmbedding).count() == 0
+    store.flush()
+    db.query(JobEmbedding).filter(JobEmbedding.text_hash == "stale").update(
+        {JobEmbedding.last_used_at: datetime.now(timezone.utc) - timedelta(days=40)}
+    )
+    db.commit()
+
+    assert prune_embeddings(db, max_age_days=30) == 1
+    assert [row.text_hash for row in db.query(JobEmbedding)] == ["fresh"]
@@ -0,0 +1,116 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import main
+from backend.database import ensure_schema, get_db
+from backend.http_cache import bump_data_version, response_cache
+from backend.models import Base, CrawlRun, Job
+
+
+def _setup():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    ensure_schema(engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    db.add(
+        Job(
+            job_key="k1",
+            title="Backend Engineer",
+            company="Acme",
+            location="Remote",
+            description="desc",
+            url="https://example.com/1",
+            source="s",
+            relevance_score=1.0,
+        )
+    )
+    db.add(CrawlRun(run_id="r1"))
+    db.commit()
+    db.close()
+
+    def override_db():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    main.app.dependency_overrides[get_db] = override_db
+    response_cache.clear()
+    return TestClient(main.app), engine, statements
+
+
+def test_matching_etag_gets_304_without_queries_until_data_changes():
+    client, engine, statements = _setup()
+    try:
+        first = {path: client.get(path) for path in ("/api/jobs", "/api/jobs?q=backend", "/api/stats", "/api/runs")}
+        statements.clear()
+        revalidated = {
+            path: client.get(path, headers={"If-None-Match": response.headers["etag"]})
+            for path, response in first.items()
+        }
+        queries_for_304 = list(statements)
+        other_query = client.get(
+            "/api/jobs", params={"limit": 5}, headers={"If-None-Match": first["/api/jobs"].headers["etag"]}
+        )
+
+        job_id = first["/api/jobs"].json()[0]["id"]
+        client.patch(f"/api/jobs/{job_id}", json={"applied": True})
+        changed = client.get("/api/jobs", headers={"If-None-Match": first["/api/jobs"].headers["etag"]})
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert all(response.status_code == 304 for response in revalidated.values())
+    assert all(r.headers["etag"] == first[p].headers["etag"] for p, r in revalidated.items())
+    assert queries_for_304 == []
+    assert other_query.status_code == 200
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != first["/api/jobs"].headers["etag"]
+    assert changed.json()[0]["applied"] is True
+
+
+def test_rendered_body_is_reused_for_the_same_version():
+    client, engine, statements = _setup()
+    try:
+        first = client.get("/api/stats")
+        statements.clear()
+        again = client.get("/api/stats")
+        queries_for_hit = list(statements)
+        bump_data_version(engine)
+        fresh = client.get("/api/stats")
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert again.content == first.content and again.headers["etag"] == first.headers["etag"]
+    assert queries_for_hit == []
+    assert fresh.headers["etag"] != first.headers["etag"]
+    assert fresh.json() == {
+        "total_jobs": 1, "applied_jobs": 0, "pending_jobs": 1, "remote_jobs": 0, "sources": {"s": 1}
+    }
+
+
+def test_invalid_parameters_are_rejected_before_the_etag_check():
+    client, _, _ = _setup()
+    any_etag = {"If-None-Match": "*"}
+    try:
+        runs_cursor = client.get("/api/runs", params={"limit": 1}).headers["x-next-cursor"]
+        bad_fields = client.get("/api/jobs", params={"fields": "nope"}, headers=any_etag)
+        foreign_cursor = client.get("/api/jobs", params={"cursor": runs_cursor}, headers=any_etag)
+        bad_runs_cursor = client.get("/api/runs", params={"cursor": "garbage"}, headers=any_etag)
+        unknown_profile = client.get("/api/jobs", params={"profile": "nobody"}, headers=any_etag)
+        search_cursor = client.get("/api/jobs", params={"q": "backend", "cursor": runs_cursor}, headers=any_etag)
+        valid = client.get("/api/jobs", headers=any_etag)
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert bad_fields.status_code == 400
+    assert foreign_cursor.status_code == 400
+    assert bad_runs_cursor.status_code == 400
+    assert unknown_profile.status_code == 404
+    assert search_cursor.status_code == 400
+    assert valid.status_code == 304
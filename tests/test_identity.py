@@ -0,0 +1,46 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.crawl_engine.identity import canonical_url, compute_identity
+from backend.crawl_engine.normalize import build_normalized, fingerprint
+from backend.crawl_engine.types import RawJob
+from backend.models import Base, Job
+
+
+def test_identity_matches_model_keys():
+    args = ("Python Engineer", "Co", "https://Example.com/jobs/1/?utm_source=x&id=5#top", "remotive")
+    identity = compute_identity(*args, description="Build APIs")
+    assert identity.canonical_url == "https://example.com/jobs/1/?id=5"
+    assert identity.job_key == Job.generate_key(*args)
+    assert identity.job_hash == Job.generate_hash(*args)
+
+
+def test_identity_falls_back_without_url():
+    identity = compute_identity("Title", None, "", "source", location="Remote")
+    assert identity.canonical_url == ""
+    assert identity.job_key == Job.generate_key("Title", "", "", "source", None, "Remote")
+
+
+def test_canonical_url_is_memoized():
+    canonical_url.cache_clear()
+    canonical_url("https://example.com/a")
+    canonical_url("https://example.com/a")
+    assert canonical_url.cache_info().hits == 1
+
+
+def test_build_normalized_reuses_identity():
+    raw = RawJob(title="T", company="C", url="https://example.com/x?utm_medium=y", source="s", description="d")
+    norm = build_normalized(raw)
+    assert str(norm.url).rstrip("/") == "https://example.com/x"
+    assert norm.job_key == norm.job_hash == Job.generate_key("T", "C", raw.url, "s")
+    assert norm.job_fingerprint == fingerprint(raw)
+
+
+def test_before_insert_derives_hash_from_key(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path/'identity.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    job = Job(title="T", company="C", url="https://example.com/job", source="s")
+    session.add(job)
+    session.commit()
+    assert job.job_key == job.job_hash == Job.generate_key("T", "C", "https://example.com/job", "s")
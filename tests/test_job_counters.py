@@ -0,0 +1,78 @@
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import ensure_schema
+from backend.job_counters import job_stats, job_total, rebuild_job_counters
+from backend.models import Base, Job
+
+
+def _job(i, source="s", remote=False, applied=False):
+    return Job(
+        job_key=f"k{i}",
+        title=f"Job {i}",
+        company="Acme",
+        location="Remote",
+        description="desc",
+        url=f"https://example.com/{i}",
+        source=source,
+        remote=remote,
+        applied=applied,
+    )
+
+
+def _counted(db):
+    """What /api/stats reported before the counters: plain COUNT queries."""
+    total = db.query(Job).count()
+    applied = db.query(Job).filter(Job.applied == True).count()
+    return {
+        "total_jobs": total,
+        "applied_jobs": applied,
+        "pending_jobs": total - applied,
+        "remote_jobs": db.query(Job).filter(Job.remote == True).count(),
+        "sources": {
+            source: db.query(Job).filter(Job.source == source).count()
+            for (source,) in db.query(Job.source).distinct()
+        },
+    }
+
+
+def test_counters_track_every_write_path():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    db.add_all([_job(1, remote=True), _job(2, source="t", applied=True)])
+    db.commit()
+    ensure_schema(engine)  # existing rows are counted when the triggers are created
+
+    db.add(_job(3, source="t"))
+    db.bulk_save_objects([_job(4, remote=True), _job(5, source="u")])
+    db.commit()
+    job = db.query(Job).filter(Job.job_key == "k3").one()
+    job.applied = True
+    job.source = "u"
+    db.query(Job).filter(Job.job_key == "k1").delete()
+    db.query(Job).filter(Job.job_key == "k4").update({Job.relevance_score: 3.0})
+    db.commit()
+
+    assert job_stats(db) == _counted(db)
+    assert job_stats(db)["sources"] == {"s": 1, "t": 1, "u": 2}
+    assert job_total(db) == 4
+
+
+def test_rebuild_repairs_drift_and_missing_counters_fall_back_to_count():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    db.add_all([_job(1), _job(2, applied=True)])
+    db.commit()
+    assert job_stats(db) == _counted(db)  # no triggers yet: COUNT fallback
+
+    ensure_schema(engine)
+    db.execute(text("UPDATE job_counters SET value = 7 WHERE name = 'applied'"))
+    db.commit()
+    drift = rebuild_job_counters(db)
+
+    assert drift == {"applied": (7, 1)}
+    assert job_stats(db) == _counted(db)
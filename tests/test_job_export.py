@@ -0,0 +1,76 @@
+import csv
+import io
+import json
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import export, main
+from backend.database import ensure_schema, get_db
+from backend.models import Base, Job
+
+
+def _setup(count=5):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    ensure_schema(engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    for i in range(count):
+        db.add(
+            Job(
+                job_key=f"k{i}",
+                title=f"Engineer {i}",
+                company="Acme",
+                location="Remote",
+                description=f"Line one, \"quoted\"\nline two {i}",
+                source_meta='{"team": "core"}',
+                url=f"https://example.com/{i}",
+                source="greenhouse" if i % 2 else "remoteok",
+                relevance_score=float(i),
+            )
+        )
+    db.commit()
+    db.close()
+
+    def override_db():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    main.app.dependency_overrides[get_db] = override_db
+    return TestClient(main.app)
+
+
+def test_export_streams_filtered_rows_in_listing_order(monkeypatch):
+    monkeypatch.setattr(export, "EXPORT_BATCH_SIZE", 2)
+    client = _setup()
+    try:
+        ndjson = client.get("/api/jobs/export", params={"source": "greenhouse,remoteok"})
+        filtered = client.get("/api/jobs/export", params={"format": "csv", "source": "greenhouse"})
+        listed = client.get("/api/jobs", params={"source": "greenhouse"}).json()
+        bad_format = client.get("/api/jobs/export", params={"format": "xml"})
+        unknown_profile = client.get("/api/jobs/export", params={"profile": "nope"})
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert ndjson.status_code == 200
+    assert ndjson.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert [row["title"] for row in rows] == [f"Engineer {i}" for i in (4, 3, 2, 1, 0)]
+    assert rows[0]["source_meta"] == {"team": "core"}
+    assert rows[0]["description"].endswith("line two 4")
+    assert "lsh_bands" not in rows[0]
+
+    assert filtered.headers["content-disposition"] == 'attachment; filename="jobs.csv"'
+    records = list(csv.DictReader(io.StringIO(filtered.text)))
+    assert [int(record["id"]) for record in records] == [item["id"] for item in listed]
+    assert records[0]["description"] == 'Line one, "quoted"\nline two 3'
+    assert records[0]["source_meta"] == '{"team": "core"}'
+
+    assert bad_format.status_code == 422
+    assert unknown_profile.status_code == 404
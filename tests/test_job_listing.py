@@ -0,0 +1,69 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import main
+from backend.database import ensure_schema, get_db
+from backend.listing import SNIPPET_CHARS, make_snippet
+from backend.models import Base, Job
+
+
+def _setup():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    ensure_schema(engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    db.add(
+        Job(
+            job_key="k1",
+            title="Backend Engineer",
+            company="Acme",
+            location="Remote",
+            description="<p>Build <b>APIs</b></p>" + " lots of detail" * 200,
+            requirements="Python",
+            notes="call back",
+            source_meta='{"team": "core"}',
+            url="https://example.com/1",
+            source="s",
+            relevance_score=3.0,
+        )
+    )
+    db.commit()
+    db.close()
+
+    def override_db():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    main.app.dependency_overrides[get_db] = override_db
+    return TestClient(main.app)
+
+
+def test_listing_returns_compact_items_and_detail_stays_full():
+    client = _setup()
+    try:
+        listed = client.get("/api/jobs").json()
+        sparse = client.get("/api/jobs", params={"fields": "title,relevance_score"}).json()
+        unknown = client.get("/api/jobs", params={"fields": "title,notes"})
+        detail = client.get(f"/api/jobs/{listed[0]['id']}").json()
+    finally:
+        main.app.dependency_overrides.clear()
+
+    item = listed[0]
+    assert item["title"] == "Backend Engineer"
+    assert not {"description", "requirements", "notes", "source_meta"} & set(item)
+    assert item["snippet"].startswith("Build APIs lots of detail")
+    assert len(item["snippet"]) <= SNIPPET_CHARS + 1
+    assert sparse == [{"id": item["id"], "title": "Backend Engineer", "relevance_score": 3.0}]
+    assert unknown.status_code == 400
+    assert detail["notes"] == "call back" and detail["source_meta"] == {"team": "core"}
+
+
+def test_make_snippet_strips_markup():
+    assert make_snippet("<div>Short <i>role</i></div>") == "Short role"
+    assert make_snippet(None) is None
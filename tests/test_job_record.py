@@ -0,0 +1,72 @@
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.crawl_engine import engine as engine_module
+from backend.crawl_engine.engine import EngineV2
+from backend.crawl_engine.state import StateBase
+from backend.crawl_engine.types import JobRecord
+from backend.models import Base, Job
+
+
+def test_from_payload_normalizes_once():
+    record = JobRecord.from_payload(
+        {
+            "title": "Engineer",
+            "url": "https://Example.com/job/1?utm_source=x",
+            "source": "remotive",
+            "source_meta": {"id": 1},
+        }
+    )
+    assert record.url == "https://example.com/job/1"
+    assert record.company == "Unknown"
+    assert record.location == "Remote"
+    assert record.description == "Engineer"
+    assert record.job_key == record.job_hash == Job.generate_key("Engineer", None, record.url, "remotive")
+    row = record.to_row()
+    assert json.loads(row["source_meta"]) == {"id": 1}
+    assert not hasattr(record, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"title": "No url", "source": "s"},
+        {"title": "Relative", "url": "/jobs/1", "source": "s"},
+        {"title": 5, "url": "https://example.com", "source": "s"},
+    ],
+)
+def test_from_payload_rejects_invalid_items(payload):
+    with pytest.raises(ValueError):
+        JobRecord.from_payload(payload)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("false", False), ("0", False), ("No", False), ("true", True), ("1", True), (1, True), (None, False)],
+)
+def test_from_payload_parses_remote_flag(value, expected):
+    record = JobRecord.from_payload({"title": "T", "url": "https://example.com/1", "source": "s", "remote": value})
+    assert record.remote is expected
+
+
+def test_engine_skips_invalid_items_without_failing_source(monkeypatch):
+    monkeypatch.setattr(engine_module, "get_nlp_scorer", lambda: None)
+    db_engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(db_engine)
+    StateBase.metadata.create_all(db_engine)
+    session = sessionmaker(bind=db_engine)()
+
+    items = [
+        {"title": "Good", "url": "https://example.com/good", "source": "test"},
+        {"title": "Bad", "url": "not a url", "source": "test"},
+    ]
+    eng = EngineV2(db=session, ignore_cooldown=True)
+    asyncio.run(eng._run_source("test", lambda cursor=None: items))
+
+    assert session.query(Job).count() == 1
+    assert eng.metrics.source["test"]["jobs_parsed_count"] == 1
+    assert any("url" in e for e in eng.metrics.source["test"]["errors"])
@@ -0,0 +1,121 @@
+import asyncio
+import json
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend import crawl_runner
+from backend.crawl_engine import engine as engine_module
+from backend.crawl_engine.engine import EngineV2
+from backend.crawl_engine.key_index import BloomFilter, KnownKeyIndex, hash64
+from backend.crawl_engine.state import StateBase
+from backend.models import Base, Job, Settings as SettingsModel
+from backend.sources import remotive
+
+
+def _session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path/'index.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    StateBase.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000)
+    values = [hash64(f"key-{i}") for i in range(1000)]
+    bloom.add_many(values[:500])
+    for v in values[500:]:
+        bloom.add(v)
+    assert all(v in bloom for v in values)
+
+
+def test_known_key_index_tracks_keys_and_fingerprints():
+    index = KnownKeyIndex([("k1", "fp1"), ("k2", None)])
+    assert index.contains("k1")
+    assert index.contains("k2")
+    assert not index.contains("k3")
+    assert index.is_unchanged("k1", "fp1")
+    assert not index.is_unchanged("k1", "fp-changed")
+    assert not index.is_unchanged("k2", "fp2")
+
+    index.add("k3", "fp3")
+    assert index.contains("k3")
+    assert index.is_unchanged("k3", "fp3")
+    assert len(index) == 3
+
+
+def test_known_key_index_loads_from_jobs_table(tmp_path):
+    session = _session(tmp_path)
+    session.add(
+        Job(
+            job_key="stored-key",
+            job_hash="stored-key",
+            title="T",
+            company="C",
+            url="https://example.com/1",
+            source="s",
+            job_fingerprint="fp",
+        )
+    )
+    session.commit()
+    index = KnownKeyIndex.load(session)
+    assert index.contains("stored-key")
+    assert index.is_unchanged("stored-key", "fp")
+
+
+def test_engine_dedupes_repeats_within_one_batch(tmp_path, monkeypatch):
+    monkeypatch.setattr(engine_module, "get_nlp_scorer", lambda: None)
+    session = _session(tmp_path)
+    job = {
+        "title": "Python Developer",
+        "company": "Co",
+        "location": "Remote",
+        "description": "Build APIs",
+        "url": "https://example.com/jobs/1",
+        "source": "test",
+    }
+
+    eng = EngineV2(db=session, ignore_cooldown=True)
+    asyncio.run(eng._run_source("test", lambda cursor=None: [job, dict(job)]))
+
+    assert session.query(Job).count() == 1
+    assert eng.metrics.source["test"]["jobs_inserted_count"] == 1
+    assert eng.metrics.source["test"]["jobs_deduped_count"] == 1
+
+
+def test_v1_path_uses_index_for_dedupe(tmp_path, monkeypatch):
+    session = _session(tmp_path)
+    session.add(SettingsModel(key="sources", value=json.dumps({"remotive": True})))
+    session.commit()
+    fixture_jobs = [
+        {
+            "title": "Python Developer",
+            "company": "RemotiveCo",
+            "location": "Remote",
+            "description": "Build APIs",
+            "url": "https://remotive.com/job/1",
+            "source": "remotive",
+        }
+    ] * 2
+
+    monkeypatch.setattr(crawl_runner.settings, "CRAWL_ENGINE", "v1")
+    monkeypatch.setattr(remotive, "fetch_jobs", lambda settings: fixture_jobs)
+    monkeypatch.setattr(crawl_runner, "get_nlp_scorer", lambda: None)
+
+    first = crawl_runner.execute_crawl(session, override_sources={"remotive": True})
+    second = crawl_runner.execute_crawl(session, override_sources={"remotive": True})
+
+    assert first.jobs_added == 1
+    assert second.jobs_added == 0
+    assert session.query(Job).count() == 1
+
+
+def test_known_key_index_load_spans_chunks(monkeypatch):
+    from backend.crawl_engine import key_index
+
+    monkeypatch.setattr(key_index, "_LOAD_CHUNK", 4)
+    rows = [(f"k{i % 7}", f"fp{i % 7}") for i in range(20)]
+    index = key_index.KnownKeyIndex(rows)
+    assert len(index) == 7
+    assert all(index.is_unchanged(f"k{i}", f"fp{i}") for i in range(7))
+    assert not index.contains("k7")
@@ -0,0 +1,33 @@
+from backend.keyword_matcher import KeywordMatcher, get_keyword_matcher
+
+
+def test_matches_whole_words_only():
+    matcher = KeywordMatcher(["AI", "Java", "Node.js", "C++"])
+
+    assert matcher.find("We maintain JavaScript apps") == set()
+    assert matcher.find("<p>AI, Java and node.js; some C++.</p>") == {"AI", "Java", "Node.js", "C++"}
+
+
+def test_reports_overlapping_keywords_in_one_pass():
+    matcher = KeywordMatcher(["Machine", "Machine Learning", "Learning", "Engineer", "Data Engineer"])
+
+    assert matcher.find("Senior machine learning / data engineer") == {
+        "Machine",
+        "Machine Learning",
+        "Learning",
+        "Engineer",
+        "Data Engineer",
+    }
+
+
+def test_score_counts_title_hits_double_and_keeps_keyword_order():
+    matcher = KeywordMatcher(["Python", "FastAPI", "Go", "python"])
+
+    score, matched = matcher.score("Senior Python Engineer", "FastAPI services, Python 3")
+
+    assert score == 3.0
+    assert matched == ["Python", "FastAPI"]
+
+
+def test_matcher_is_compiled_once_per_keyword_set():
+    assert get_keyword_matcher(("a", "b")) is get_keyword_matcher(("a", "b"))
@@ -0,0 +1,203 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import main
+from backend.crawl_engine import engine as engine_module
+from backend.crawl_engine.engine import EngineV2
+from backend.crawl_engine.near_dupes import NearDuplicateIndex, lsh_bands
+from backend.crawl_engine.state import StateBase
+from backend.database import get_db
+from backend.models import Base, Job
+
+DESCRIPTION = (
+    "<p>We are hiring a senior backend engineer to design and operate Python services, "
+    "build FastAPI endpoints, own our PostgreSQL schema, and mentor the platform team. "
+    "You will work remotely with a distributed group across Europe and the Americas.</p>"
+)
+
+
+class CountingScorer:
+    def __init__(self):
+        self.calls = 0
+
+    def score(self, text: str) -> float:
+        self.calls += 1
+        return 0.7
+
+    def score_many(self, texts, batch_size=None):
+        self.calls += len(texts)
+        return [0.7] * len(texts)
+
+
+def _session():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    StateBase.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def test_lsh_bands_collide_for_near_duplicates_only():
+    index = NearDuplicateIndex()
+    original = lsh_bands("Senior Backend Engineer", "Acme", DESCRIPTION)
+    reposted = lsh_bands("Senior Backend Engineer", "Acme", DESCRIPTION.replace("<p>", "").replace("</p>", " Apply now."))
+    unrelated = lsh_bands("Frontend Designer", "Other Co", "Design marketing pages in Figma and Webflow.")
+
+    assert index.assign(original, "group-a") == "group-a"
+    assert index.lookup(reposted) == "group-a"
+    assert index.lookup(unrelated) is None
+
+
+def test_engine_groups_cross_source_copies_and_reuses_score(monkeypatch):
+    scorer = CountingScorer()
+    monkeypatch.setattr(engine_module, "get_nlp_scorer", lambda: scorer)
+    session = _session()()
+
+    def posting(source, url):
+        return lambda cursor=None: [
+            {
+                "title": "Senior Backend Engineer",
+                "company": "Acme",
+                "location": "Remote",
+                "description": DESCRIPTION,
+                "url": url,
+                "source": source,
+            }
+        ]
+
+    eng = EngineV2(db=session, ignore_cooldown=True)
+    asyncio.run(eng._run_source("remotive", posting("remotive", "https://remotive.com/jobs/1")))
+    asyncio.run(eng._run_source("workingnomads", posting("workingnomads", "https://workingnomads.com/j/9")))
+
+    jobs = session.query(Job).all()
+    assert len(jobs) == 2
+    assert jobs[0].duplicate_group_id == jobs[1].duplicate_group_id
+    assert scorer.calls == 1
+    assert eng.metrics.source["workingnomads"]["jobs_near_duplicate_count"] == 1
+
+
+def _copies(extra=""):
+    return [
+        {
+            "title": "Senior Backend Engineer",
+            "company": "Acme",
+            "location": "Remote",
+            "description": DESCRIPTION + text,
+            "url": f"https://board{i}.example.com/jobs/1",
+            "source": "s",
+        }
+        for i, text in enumerate(["", extra])
+    ]
+
+
+def test_near_duplicate_copies_share_only_the_semantic_score(monkeypatch):
+    scorer = CountingScorer()
+    monkeypatch.setattr(engine_module, "get_nlp_scorer", lambda: scorer)
+    monkeypatch.setattr(engine_module.settings, "CRAWL_SCORING_CASCADE", False)
+    session = _session()()
+
+    eng = EngineV2(db=session, ignore_cooldown=True, keywords=["kubernetes"])
+    asyncio.run(eng._run_source("s", lambda cursor=None: _copies(" Kubernetes experience is a plus.")))
+
+    plain, with_keyword = session.query(Job).order_by(Job.url).all()
+    assert plain.duplicate_group_id == with_keyword.duplicate_group_id
+    assert scorer.calls == 1
+    assert plain.semantic_score == with_keyword.semantic_score == 0.7
+    assert plain.relevance_score == eng.relevance.combine(0.0, 0.7)
+    assert with_keyword.relevance_score > plain.relevance_score
+    assert with_keyword.keywords_matched == "kubernetes"
+
+
+def test_near_duplicate_copies_without_a_model_keep_their_keyword_score(monkeypatch):
+    monkeypatch.setattr(engine_module, "get_nlp_scorer", lambda: None)
+    monkeypatch.setattr(engine_module.settings, "CRAWL_SCORING_CASCADE", False)
+    session = _session()()
+    session.add(
+        Job(
+            job_key="earlier", title="Senior Backend Engineer", company="Acme", location="Remote",
+            description=DESCRIPTION, url="https://old.example.com/1", source="s", relevance_score=5.0,
+            semantic_score=0.9, lsh_bands=lsh_bands("Senior Backend Engineer", "Acme", DESCRIPTION),
+        )
+    )
+    session.commit()
+
+    eng = EngineV2(db=session, ignore_cooldown=True, keywords=["kubernetes"])
+    asyncio.run(eng._run_source("s", lambda cursor=None: _copies(" Kubernetes experience is a plus.")))
+
+    plain, with_keyword = session.query(Job).filter(Job.job_key != "earlier").order_by(Job.url).all()
+    assert plain.duplicate_group_id == with_keyword.duplicate_group_id == "earlier"
+    assert plain.relevance_score == 0.0
+    assert with_keyword.relevance_score > 0.0
+    assert plain.semantic_score is None and with_keyword.semantic_score is None
+
+
+def test_get_jobs_collapse_returns_one_row_per_group():
+    Session = _session()
+    session = Session()
+    for i, score in enumerate([1.0, 3.0]):
+        session.add(
+            Job(
+                job_key=f"k{i}",
+                job_hash=f"k{i}",
+                title="Backend Engineer",
+                company="Acme",
+                location="Remote",
+                description="desc",
+                url=f"https://example.com/{i}",
+                source=f"s{i}",
+                relevance_score=score,
+                duplicate_group_id="g1",
+            )
+        )
+    session.commit()
+
+    def override_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    main.app.dependency_overrides[get_db] = override_db
+    try:
+        client = TestClient(main.app)
+        assert len(client.get("/api/jobs").json()) == 2
+        collapsed = client.get("/api/jobs", params={"collapse": True}).json()
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert len(collapsed) == 1
+    assert collapsed[0]["relevance_score"] == 3.0
+    assert collapsed[0]["duplicate_group_id"] == "g1"
+
+
+def test_digest_skips_groups_reported_by_an_earlier_run(monkeypatch):
+    from backend.config import settings
+    from backend.notifications import NotificationService
+
+    monkeypatch.setattr(settings, "NOTIFICATION_MIN_SCORE", 1.0)
+    session = _session()()
+    earlier = Job(
+        job_key="old", job_hash="old", title="Backend Engineer", company="Acme", location="Remote",
+        description="desc", url="https://example.com/old", source="s0", relevance_score=3.0,
+        duplicate_group_id="g1",
+    )
+    session.add(earlier)
+    batch = [
+        Job(
+            job_key=f"new{i}", job_hash=f"new{i}", title="Backend Engineer", company="Acme", location="Remote",
+            description="desc", url=f"https://example.com/{i}", source="s1", relevance_score=2.0,
+            duplicate_group_id=group,
+        )
+        for i, group in enumerate(["g1", "g2", "g2"])
+    ]
+    session.add_all(batch)
+    session.commit()
+
+    kept = NotificationService()._filter_jobs(batch, session)
+    assert [job.job_key for job in kept] == ["new1"]
@@ -0,0 +1,53 @@
+import numpy as np
+
+from backend.crawler import JobCrawler
+from backend.nlp import NLPScorer
+
+
+class FakeModel:
+    """Embeds text as a unit vector whose angle depends on its length."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, batch_size=32, **kwargs):
+        self.calls.append((list(texts), batch_size))
+        angles = np.array([len(t) / 100.0 for t in texts])
+        return np.stack([np.cos(angles), np.sin(angles)], axis=1).astype(np.float32)
+
+
+def _scorer():
+    scorer = NLPScorer.__new__(NLPScorer)
+    scorer.model = FakeModel()
+    scorer.store = None
+    scorer.profile_embedding = np.array([1.0, 0.0], dtype=np.float32)
+    return scorer
+
+
+def test_score_many_encodes_once_sorted_and_keeps_input_order():
+    scorer = _scorer()
+    texts = ["a much longer job description text", "", "short", "   "]
+
+    scores = scorer.score_many(texts, batch_size=8)
+
+    assert len(scorer.model.calls) == 1
+    encoded, batch_size = scorer.model.calls[0]
+    assert encoded == ["short", "a much longer job description text"]
+    assert batch_size == 8
+    assert scores[1] == scores[3] == 0.0
+    assert scores[2] > scores[0] > 0.0
+    assert scorer.score("short") == np.float32(scores[2])
+
+
+def test_crawler_batch_scores_match_single_scores():
+    crawler = JobCrawler(keywords=["Python"], locations=["Remote"], nlp_scorer=_scorer())
+    jobs = [
+        {"title": "Python Engineer", "description": "APIs"},
+        {"title": "Designer", "description": "Figma and Python"},
+        {"title": "Chef", "description": ""},
+    ]
+
+    batched = crawler.calculate_relevance_scores(jobs)
+
+    assert batched == [crawler.calculate_relevance_score(job) for job in jobs]
+    assert len(crawler.nlp_scorer.model.calls) == 1 + len(jobs)
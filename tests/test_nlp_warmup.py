@@ -0,0 +1,54 @@
+import asyncio
+import subprocess
+import sys
+import threading
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.crawl_engine import engine as engine_module
+from backend.crawl_engine.engine import EngineV2
+from backend.crawl_engine.state import StateBase
+from backend.models import Base, Job
+
+
+class FixedScorer:
+    def score_many(self, texts, batch_size=None):
+        return [0.4] * len(texts)
+
+
+def test_importing_the_api_does_not_load_model_libraries():
+    code = (
+        "import sys, backend.main; "
+        "print(any(m in sys.modules for m in ('sentence_transformers', 'torch', 'onnxruntime')))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_engine_fetches_while_model_loads(monkeypatch):
+    fetch_started = threading.Event()
+    loaded_after_fetch = []
+
+    def slow_loader():
+        loaded_after_fetch.append(fetch_started.wait(timeout=5))
+        return FixedScorer()
+
+    monkeypatch.setattr(engine_module, "get_nlp_scorer", slow_loader)
+    db_engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(db_engine)
+    StateBase.metadata.create_all(db_engine)
+    session = sessionmaker(bind=db_engine)()
+
+    def source(cursor=None):
+        fetch_started.set()
+        return [{"title": "Engineer", "url": "https://example.com/1", "source": "test", "description": "x"}]
+
+    eng = EngineV2(db=session, ignore_cooldown=True)
+    asyncio.run(eng._run_source("test", source))
+
+    assert loaded_after_fetch == [True]
+    assert session.query(Job).one().relevance_score == 0.4
+    metrics = eng.metrics.source["test"]
+    assert metrics["nlp_load_ms"] is not None
+    assert metrics["nlp_wait_ms"] >= 0
@@ -0,0 +1,80 @@
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from backend.onnx_encoder import OnnxEncoder
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _fixture_texts():
+    texts = []
+    for name, key in (("remotive.json", "description"), ("greenhouse.json", "content")):
+        for job in json.loads(FIXTURES.joinpath(name).read_text(encoding="utf-8"))["jobs"]:
+            texts.append(f"{job['title']} {job[key]}")
+    for job in json.loads(FIXTURES.joinpath("workingnomads.json").read_text(encoding="utf-8")):
+        texts.append(f"{job['title']} {job['description']}")
+    texts.append("Seasoned software engineer focused on backend APIs and data engineering.")
+    return texts
+
+
+class FakeTokenizer:
+    def encode_batch(self, texts):
+        width = max(len(t.split()) for t in texts)
+        out = []
+        for t in texts:
+            ids = [len(w) for w in t.split()]
+            pad = width - len(ids)
+            out.append(
+                SimpleNamespace(ids=ids + [0] * pad, attention_mask=[1] * len(ids) + [0] * pad, type_ids=[0] * width)
+            )
+        return out
+
+
+class FakeSession:
+    def run(self, _outputs, feeds):
+        ids = feeds["input_ids"].astype(np.float32)
+        return [np.stack([ids, np.ones_like(ids)], axis=-1)]
+
+
+def test_encode_mean_pools_real_tokens_and_normalizes():
+    encoder = OnnxEncoder.__new__(OnnxEncoder)
+    encoder.tokenizer = FakeTokenizer()
+    encoder.session = FakeSession()
+    encoder.input_names = {"input_ids", "attention_mask"}
+
+    embeddings = encoder.encode(["aa bbbb", "cccccc"], batch_size=1, normalize_embeddings=True)
+
+    # padding must not pull the mean towards zero
+    expected = np.array([[3.0, 1.0], [6.0, 1.0]])
+    expected /= np.linalg.norm(expected, axis=1, keepdims=True)
+    np.testing.assert_allclose(embeddings, expected, rtol=1e-6)
+
+
+@pytest.mark.parametrize("backend,min_cosine", [("onnx", 0.999), ("int8", 0.98)])
+def test_onnx_backends_match_sentence_transformers(backend, min_cosine):
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("tokenizers")
+    st = pytest.importorskip("sentence_transformers")
+    model_dir = os.getenv("NLP_ONNX_MODEL_DIR")
+    if not model_dir:
+        pytest.skip("NLP_ONNX_MODEL_DIR with an exported model is required")
+    filename = "model_int8.onnx" if backend == "int8" else "model.onnx"
+    # set (as in the onnx-parity CI job) means the export must be there
+    assert Path(model_dir, filename).exists(), f"run: python -m backend.onnx_encoder --out {model_dir} --int8"
+
+    from backend.config import settings
+
+    texts = _fixture_texts()
+    reference = st.SentenceTransformer(settings.NLP_MODEL_NAME).encode(
+        texts, convert_to_numpy=True, normalize_embeddings=True
+    )
+    encoder = OnnxEncoder(model_dir, quantized=backend == "int8", max_seq_length=settings.NLP_MAX_SEQ_LENGTH)
+    embeddings = encoder.encode(texts, normalize_embeddings=True)
+
+    cosines = (reference * embeddings).sum(axis=1)
+    assert cosines.min() >= min_cosine
@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import main
+from backend.database import ensure_schema, get_db
+from backend.models import Base, CrawlRun, Job
+
+
+def _job(i, score):
+    return Job(
+        job_key=f"k{i}",
+        title=f"Job {i}",
+        company="Acme",
+        location="Remote",
+        description="desc",
+        url=f"https://example.com/{i}",
+        source="s",
+        relevance_score=score,
+    )
+
+
+def _setup():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    ensure_schema(engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    # few distinct scores and server-default created_at: plenty of ties
+    db.add_all([_job(i, float(i % 3)) for i in range(25)])
+    start = datetime(2024, 1, 1)
+    db.add_all([CrawlRun(run_id=f"r{i:02d}", started_at=start + timedelta(hours=i // 2)) for i in range(7)])
+    db.commit()
+    db.close()
+
+    def override_db():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    main.app.dependency_overrides[get_db] = override_db
+    return TestClient(main.app), Session
+
+
+def _walk(client, path, limit):
+    ids, cursor, pages = [], None, 0
+    while True:
+        response = client.get(path, params={"limit": limit, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        ids.extend(item.get("id", item.get("run_id")) for item in response.json())
+        pages += 1
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            return ids, pages
+
+
+def test_cursor_pages_match_offset_order_without_gaps():
+    client, _ = _setup()
+    try:
+        by_offset = [job["id"] for job in client.get("/api/jobs", params={"limit": 500}).json()]
+        by_cursor, pages = _walk(client, "/api/jobs", 10)
+        runs_by_offset = [run["run_id"] for run in client.get("/api/runs", params={"limit": 100}).json()]
+        runs_by_cursor, _ = _walk(client, "/api/runs", 3)
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert by_cursor == by_offset and len(set(by_cursor)) == 25
+    assert pages == 3
+    assert runs_by_cursor == runs_by_offset == [f"r{i:02d}" for i in reversed(range(7))]
+
+
+def test_inserts_between_pages_do_not_shift_the_next_page():
+    client, Session = _setup()
+    try:
+        first = client.get("/api/jobs", params={"limit": 10})
+        db = Session()
+        db.add(_job(99, 5.0))
+        db.commit()
+        db.close()
+        second = client.get("/api/jobs", params={"limit": 10, "cursor": first.headers["x-next-cursor"]})
+        bad = client.get("/api/jobs", params={"cursor": "not-a-cursor"})
+        foreign = client.get("/api/runs", params={"cursor": first.headers["x-next-cursor"]})
+    finally:
+        main.app.dependency_overrides.clear()
+
+    first_ids = {job["id"] for job in first.json()}
+    assert len(second.json()) == 10
+    assert not first_ids & {job["id"] for job in second.json()}
+    assert bad.status_code == 400 and foreign.status_code == 400
+
+
+def test_cursor_query_is_an_index_range_scan():
+    _, Session = _setup()
+    main.app.dependency_overrides.clear()
+    db = Session()
+    plan = db.execute(
+        text(
+            "EXPLAIN QUERY PLAN SELECT id FROM jobs WHERE (relevance_score, created_at, id) < (1.0, '2024-01-01', 5) "
+            "ORDER BY relevance_score DESC, created_at DESC, id DESC LIMIT 10"
+        )
+    ).fetchall()
+    details = " ".join(row[3] for row in plan)
+    assert "idx_jobs_relevance_created" in details
+    assert "TEMP B-TREE" not in details
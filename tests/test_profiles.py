@@ -0,0 +1,138 @@
+import asyncio
+
+import numpy as np
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import main
+from backend.crawl_engine import engine as engine_module
+from backend.crawl_engine.engine import EngineV2
+from backend.crawl_engine.state import StateBase
+from backend.database import get_db
+from backend.models import Base, Job, JobProfileScore, Profile
+
+VOCAB = ("python", "react", "design")
+
+
+class KeywordScorer:
+    """Embeds text as normalized keyword counts; counts texts it embeds."""
+
+    model_id = "keyword-model"
+
+    def __init__(self):
+        self.embedded = 0
+
+    def embed_many(self, texts, batch_size=None):
+        self.embedded += len(texts)
+        vectors = np.array([[t.lower().count(w) for w in VOCAB] + [0.1] for t in texts], dtype=np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    def score_many(self, texts, batch_size=None):
+        return self.score_embeddings(self.embed_many(texts))
+
+    def score_embeddings(self, embeddings):
+        return embeddings[:, 0]
+
+
+def _sessionmaker():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    StateBase.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def _client(Session):
+    def override_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    main.app.dependency_overrides[get_db] = override_db
+    return TestClient(main.app)
+
+
+def test_profiles_backfill_and_rank_jobs(monkeypatch):
+    scorer = KeywordScorer()
+    monkeypatch.setattr(main, "get_nlp_scorer", lambda: scorer)
+    Session = _sessionmaker()
+    db = Session()
+    for i, (title, desc) in enumerate([("Python Engineer", "python apis"), ("React Developer", "react ui")]):
+        db.add(
+            Job(
+                job_key=f"k{i}",
+                title=title,
+                company="c",
+                location="Remote",
+                url=f"https://x/{i}",
+                source="s",
+                description=desc,
+                job_fingerprint=f"f{i}",
+            )
+        )
+    db.commit()
+
+    client = _client(Session)
+    try:
+        assert client.post("/api/profiles", json={"name": "backend", "profile_text": "python"}).status_code == 201
+        assert client.post("/api/profiles", json={"name": "frontend", "profile_text": "react"}).status_code == 201
+        backend_id = client.get("/api/profiles").json()[0]["id"]
+        clash = client.put(f"/api/profiles/{backend_id}", json={"name": "frontend"})
+        backend_jobs = client.get("/api/jobs", params={"profile": "backend"}).json()
+        frontend_jobs = client.get("/api/jobs", params={"profile": "frontend"}).json()
+        missing = client.get("/api/jobs", params={"profile": "nobody"})
+        detail = client.get(f"/api/jobs/{backend_jobs[0]['id']}", params={"profile": "backend"}).json()
+        plain_detail = client.get(f"/api/jobs/{backend_jobs[0]['id']}").json()
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert [j["title"] for j in backend_jobs] == ["Python Engineer", "React Developer"]
+    assert [j["title"] for j in frontend_jobs] == ["React Developer", "Python Engineer"]
+    assert backend_jobs[0]["profile_score"] > backend_jobs[1]["profile_score"]
+    assert detail["profile_score"] == backend_jobs[0]["profile_score"]
+    assert plain_detail["profile_score"] is None
+    assert missing.status_code == 404
+    assert clash.status_code == 409
+
+
+def test_engine_scores_new_jobs_for_every_profile(monkeypatch):
+    scorer = KeywordScorer()
+    monkeypatch.setattr(engine_module, "get_nlp_scorer", lambda: scorer)
+    session = _sessionmaker()()
+    session.add_all([Profile(name="backend", profile_text="python"), Profile(name="design", profile_text="design")])
+    session.commit()
+
+    jobs = [
+        {"title": f"Role {i}", "description": "python design", "url": f"https://x.example.com/{i}", "source": "s"}
+        for i in range(3)
+    ]
+    eng = EngineV2(db=session, ignore_cooldown=True)
+    asyncio.run(eng._run_source("s", lambda cursor=None: jobs))
+
+    assert eng.profile_matrix.matrix.shape == (4, 2)
+    assert session.query(JobProfileScore).count() == 6
+    assert scorer.embedded == 2 + 3  # the profiles, then one encode per job for both scores
+    assert sum(eng.scoring.batch_sizes) == 3
+
+
+def test_engine_skips_profile_scores_for_prefilter_rejects(monkeypatch):
+    scorer = KeywordScorer()
+    monkeypatch.setattr(engine_module, "get_nlp_scorer", lambda: scorer)
+    monkeypatch.setattr(engine_module.settings, "CRAWL_SCORING_CASCADE", True)
+    session = _sessionmaker()()
+    session.add(Profile(name="backend", profile_text="python"))
+    session.commit()
+
+    jobs = [
+        {"title": "Python Engineer", "description": "python apis", "url": "https://x.example.com/1", "source": "s"},
+        {"title": "Sales Lead", "description": "quota and pipeline", "url": "https://x.example.com/2", "source": "s"},
+    ]
+    eng = EngineV2(db=session, ignore_cooldown=True, keywords=["python"])
+    asyncio.run(eng._run_source("s", lambda cursor=None: jobs))
+
+    python_key = session.query(Job.job_key).filter(Job.title == "Python Engineer").scalar()
+    assert [row.job_key for row in session.query(JobProfileScore)] == [python_key]
+    assert scorer.embedded == 1 + 1
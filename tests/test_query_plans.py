@@ -0,0 +1,124 @@
+"""EXPLAIN QUERY PLAN checks for the queries the endpoints actually send.
+
+Each case runs a real request, captures the final SELECT and asserts the
+index SQLite picks and that no temp B-tree sorts the result, so dropping
+or reshaping an index fails here instead of in production.
+"""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import main
+from backend.crawl_engine.near_dupes import NearDuplicateIndex
+from backend.database import ensure_schema, get_db
+from backend.models import Base, Job, Profile
+
+
+@pytest.fixture
+def planned():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    ensure_schema(engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    db.add(Profile(name="p", profile_text="python"))
+    for i in range(3):
+        db.add(
+            Job(
+                job_key=f"k{i}",
+                title=f"Engineer {i}",
+                company="Acme",
+                location="Remote",
+                description="python",
+                url=f"https://example.com/{i}",
+                source="remoteok",
+                remote=i > 0,
+                relevance_score=float(i),
+            )
+        )
+    db.commit()
+    db.close()
+
+    def override_db():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    def plan(statement, parameters):
+        with engine.connect() as conn:
+            return [row[3] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)]
+
+    def run(path, **params):
+        statements.clear()
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            response = client.get(path, params=params)
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+        assert response.status_code == 200, response.text
+        return response, plan(*statements[-1])
+
+    def run_near_dupes():
+        statements.clear()
+        event.listen(engine, "before_cursor_execute", capture)
+        db = Session()
+        try:
+            NearDuplicateIndex.load(db)
+        finally:
+            db.close()
+            event.remove(engine, "before_cursor_execute", capture)
+        return plan(*statements[-1])
+
+    main.app.dependency_overrides[get_db] = override_db
+    client = TestClient(main.app)
+    run.near_dupes = run_near_dupes
+    try:
+        yield run
+    finally:
+        main.app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize(
+    "params, index",
+    [
+        ({}, "idx_jobs_relevance_created"),
+        ({"applied": "false"}, "idx_jobs_applied_rank"),
+        ({"applied": "true"}, "idx_jobs_applied_rank"),
+        ({"source": "remoteok"}, "idx_jobs_source_rank"),
+        ({"remote": "true"}, "idx_jobs_remote_rank"),
+        ({"source": "remoteok", "applied": "false"}, "idx_jobs_unapplied_source_rank"),
+    ],
+)
+def test_job_listing_is_served_in_index_order(planned, params, index):
+    first, plan = planned("/api/jobs", limit=1, **params)
+    pages = [plan]
+    cursor = first.headers.get("X-Next-Cursor")
+    if cursor:
+        pages.append(planned("/api/jobs", limit=1, cursor=cursor, **params)[1])
+
+    for plan in pages:
+        assert any(f"USING INDEX {index}" in step for step in plan), plan
+        assert not any("TEMP B-TREE" in step for step in plan), plan
+
+
+def test_profile_ranking_and_runs_and_near_dupes_use_their_indexes(planned):
+    _, profile_plan = planned("/api/jobs", profile="p")
+    _, runs_plan = planned("/api/runs")
+    near_dupes_plan = planned.near_dupes()
+
+    assert any("idx_job_profile_scores_profile_score" in step for step in profile_plan), profile_plan
+    # only ties on score are sorted, not the whole result
+    assert "USE TEMP B-TREE FOR ORDER BY" not in profile_plan
+    assert any("idx_crawl_runs_started_run" in step for step in runs_plan), runs_plan
+    assert not any("TEMP B-TREE" in step for step in runs_plan), runs_plan
+    assert any("idx_jobs_lsh_recent" in step for step in near_dupes_plan), near_dupes_plan
@@ -0,0 +1,121 @@
+import numpy as np
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import main
+from backend.database import get_db
+from backend.models import Base, Job
+from backend.rescoring import run_rescore, start_rescore
+
+
+class LengthScorer:
+    def __init__(self, fail_on_call=None):
+        self.calls = 0
+        self.fail_on_call = fail_on_call
+        self.texts = []
+
+    def score_many(self, texts, batch_size=None):
+        self.calls += 1
+        if self.calls == self.fail_on_call:
+            raise RuntimeError("model crashed")
+        self.texts.extend(texts)
+        return np.array([len(t) / 100 for t in texts])
+
+
+def _session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    for i in range(5):
+        db.add(
+            Job(
+                job_key=f"k{i}",
+                title="t" * (i + 1),
+                company="c",
+                location="Remote",
+                url=f"https://x/{i}",
+                source="s",
+                description="d",
+                job_fingerprint=f"f{i}",
+                relevance_score=9.0,
+            )
+        )
+    db.commit()
+    db.close()
+    return Session
+
+
+def test_rescore_resumes_after_failure_from_last_chunk():
+    db = _session_factory()()
+    run = start_rescore(db, "model-a", profile_text="new profile")
+
+    run_rescore(db, run, LengthScorer(fail_on_call=2), chunk_size=2)
+    assert run.status == "failed"
+    assert run.last_job_id == 2 and run.processed_count == 2
+
+    scorer = LengthScorer()
+    assert start_rescore(db, "model-a", profile_text="new profile").run_id == run.run_id
+    run_rescore(db, run, scorer, chunk_size=2)
+
+    assert run.status == "done"
+    assert run.processed_count == run.total_count == 5
+    assert scorer.texts == ["ttt d", "tttt d", "ttttt d"]
+    scores = [job.relevance_score for job in db.query(Job).order_by(Job.id)]
+    assert scores == [(i + 3) / 100 for i in range(5)]
+
+
+def test_rescore_api_runs_in_background_and_reports_progress(monkeypatch):
+    Session = _session_factory()
+    monkeypatch.setattr(main, "get_nlp_scorer", lambda: LengthScorer())
+
+    def override_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    main.app.dependency_overrides[get_db] = override_db
+    try:
+        client = TestClient(main.app)
+        started = client.post("/api/rescore")
+        status = client.get("/api/rescore").json()
+        again = client.post("/api/rescore").json()
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert started.status_code == 202
+    assert status["status"] == "done"
+    assert status["processed_count"] == 5
+    assert again["run_id"] == status["run_id"]
+
+
+def test_rescore_with_keywords_matches_crawler_scoring(monkeypatch):
+    monkeypatch.setattr("backend.rescoring.settings.NLP_WEIGHT", 2.0)
+    db = _session_factory()()
+    db.query(Job).filter(Job.id == 1).update({Job.title: "Python Engineer"})
+    db.commit()
+
+    scorer = LengthScorer()
+    run_rescore(db, start_rescore(db, "model-b"), scorer, keywords=["Python"])
+
+    first, *rest = db.query(Job).order_by(Job.id)
+    assert first.relevance_score == 2.0 + len("Python Engineer d") / 100 * 2.0
+    assert first.keywords_matched == "Python"
+    # like the crawl cascade: no keyword match stores 0 without a model call
+    assert scorer.texts == ["Python Engineer d"]
+    assert [job.relevance_score for job in rest] == [0.0] * 4
+
+
+def test_rescore_run_is_keyed_on_the_keyword_set():
+    db = _session_factory()()
+    run = start_rescore(db, "model-a", keywords=["Python", "Go"])
+    run_rescore(db, run, LengthScorer(), keywords=["Python", "Go"])
+
+    assert start_rescore(db, "model-a", keywords=["Go", "Python"]).run_id == run.run_id
+    changed = start_rescore(db, "model-a", keywords=["Python", "Rust"])
+    assert changed.run_id != run.run_id and changed.status == "queued"
+    assert start_rescore(db, "model-a").run_id not in {run.run_id, changed.run_id}
@@ -0,0 +1,130 @@
+import json
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend import crawl_runner
+from backend.crawl_engine import engine as engine_module
+from backend.crawl_engine.identity import identity_from_payload
+from backend.crawl_engine.state import StateBase, SourceState, get_checkpoint, set_checkpoint
+from backend.models import Base, CrawlRun, Job, Settings as SettingsModel
+from backend.sources import remotive, workingnomads
+
+
+def _session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path/'resume.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    StateBase.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+def _job(source: str, n: int) -> dict:
+    return {
+        "title": f"Engineer {n}",
+        "company": f"{source} co",
+        "location": "Remote",
+        "description": f"Role number {n} at {source}",
+        "url": f"https://{source}.example.com/jobs/{n}",
+        "source": source,
+    }
+
+
+def test_checkpoint_records_committed_batches(tmp_path, monkeypatch):
+    session = _session(tmp_path)
+    monkeypatch.setattr(engine_module, "get_nlp_scorer", lambda: None)
+    monkeypatch.setattr(engine_module.settings, "CRAWL_COMMIT_BATCH_SIZE", 1)
+    monkeypatch.setattr(remotive, "fetch_jobs", lambda settings: [_job("remotive", 1), _job("remotive", 2)])
+
+    result = crawl_runner.execute_crawl(session, override_sources={"remotive": True})
+
+    state = session.query(SourceState).filter(SourceState.source_id == "remotive").one()
+    checkpoint = get_checkpoint(state, result.run_id)
+    assert checkpoint["status"] == "done"
+    assert checkpoint["batches_committed"] == 2
+    assert checkpoint["items_committed"] == 2
+
+
+def test_resume_run_continues_only_unfinished_sources(tmp_path, monkeypatch):
+    session = _session(tmp_path)
+    session.add(SettingsModel(key="sources", value=json.dumps({"remotive": True, "workingnomads": True})))
+    run = CrawlRun(
+        run_id="interrupted",
+        started_at=datetime.now(timezone.utc),
+        sources_attempted=json.dumps(["remotive", "workingnomads"]),
+        fetched_count=0,
+        inserted_new_count=0,
+    )
+    session.add(run)
+    done = SourceState(source_id="remotive", consecutive_failures=0)
+    set_checkpoint(
+        done,
+        {"run_id": "interrupted", "status": "done", "metrics": {"jobs_parsed_count": 3, "jobs_inserted_count": 3}},
+    )
+    partial = SourceState(source_id="workingnomads", consecutive_failures=0)
+    set_checkpoint(partial, {"run_id": "interrupted", "status": "running", "batches_committed": 1, "items_committed": 1})
+    session.add_all([done, partial])
+    # the first workingnomads batch was committed before the crash
+    session.add(
+        Job(
+            job_key=identity_from_payload(_job("workingnomads", 1)).job_key,
+            job_hash="wn-1",
+            title="Engineer 1",
+            company="c",
+            url="https://x/1",
+            source="workingnomads",
+            last_seen_at=datetime.now(timezone.utc),
+        )
+    )
+    session.commit()
+
+    def remotive_must_not_run(settings):
+        raise AssertionError("finished source was crawled again")
+
+    monkeypatch.setattr(engine_module, "get_nlp_scorer", lambda: None)
+    monkeypatch.setattr(remotive, "fetch_jobs", remotive_must_not_run)
+    monkeypatch.setattr(
+        workingnomads,
+        "fetch_jobs",
+        # a posting that arrived after the crash is listed first
+        lambda settings: [_job("workingnomads", 3), _job("workingnomads", 1), _job("workingnomads", 2)],
+    )
+
+    result = crawl_runner.resume_run(session, "interrupted")
+
+    session.refresh(run)
+    assert run.finished_at is not None
+    metrics = json.loads(run.source_metrics)
+    assert metrics["remotive"]["jobs_inserted_count"] == 3
+    assert metrics["workingnomads"]["jobs_resumed_skipped_count"] == 1
+    assert metrics["workingnomads"]["jobs_inserted_count"] == 2
+    assert result.jobs_added == 5
+    titles = {job.title for job in session.query(Job).filter(Job.source == "workingnomads")}
+    assert titles == {"Engineer 1", "Engineer 2", "Engineer 3"}
+
+
+def test_resume_refuses_v1_and_live_runs(tmp_path):
+    import pytest
+
+    session = _session(tmp_path)
+    now = datetime.now(timezone.utc)
+    session.add_all(
+        [
+            CrawlRun(run_id="v1-run", started_at=now, fetched_count=0, inserted_new_count=0),
+            CrawlRun(run_id="live-run", started_at=now, fetched_count=0, inserted_new_count=0),
+        ]
+    )
+    live = SourceState(source_id="remotive", consecutive_failures=0)
+    set_checkpoint(live, {"run_id": "live-run", "status": "running", "updated_at": now.isoformat()})
+    session.add(live)
+    session.commit()
+
+    with pytest.raises(ValueError, match="no v2 checkpoints"):
+        crawl_runner.resume_run(session, "v1-run")
+    with pytest.raises(ValueError, match="may still be running"):
+        crawl_runner.resume_run(session, "live-run")
+    assert crawl_runner.find_resumable_run(session) is None
+
+    set_checkpoint(live, {"run_id": "live-run", "status": "running", "updated_at": "2000-01-01T00:00:00+00:00"})
+    session.commit()
+    assert crawl_runner.find_resumable_run(session).run_id == "live-run"
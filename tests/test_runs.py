@@ -1,5 +1,6 @@
 import json
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from sqlalchemy import create_engine
@@ -79,6 +80,48 @@ def test_execute_crawl_records_failed_source(tmp_path, monkeypatch):
     assert any(item["source"] == "greenhouse" for item in failures)
 
 
+def test_v1_run_is_visible_and_heartbeats_while_fetching(tmp_path, monkeypatch):
+    session = _build_session(tmp_path)
+    observer = sessionmaker(bind=session.get_bind())()
+    monkeypatch.setattr(crawl_runner.settings, "CRAWL_ENGINE", "v1")
+    monkeypatch.setattr(crawl_runner.settings, "CRAWL_HEARTBEAT_SECONDS", 0.02)
+    monkeypatch.setattr(crawl_runner, "get_nlp_scorer", lambda: None)
+    seen = {}
+
+    def slow_fetch(self):
+        started = crawl_runner.find_live_run(observer)
+        seen["live"] = started.run_id if started else None
+        first_beat = started.heartbeat_at
+        time.sleep(0.2)  # a slow fetch moves no checkpoint
+        observer.expire_all()
+        seen["beat"] = observer.get(CrawlRun, started.run_id).heartbeat_at > first_beat
+        return [_stub_job("RemoteOK")]
+
+    monkeypatch.setattr(crawl_runner.JobCrawler, "crawl_remoteok", slow_fetch)
+
+    result = crawl_runner.execute_crawl(session, send_notifications=False, override_sources={"remoteok": True})
+
+    assert seen == {"live": result.run_id, "beat": True}
+    observer.expire_all()
+    assert crawl_runner.find_live_run(observer) is None
+
+
+def test_run_is_live_follows_the_heartbeat(tmp_path):
+    from backend.crawl_engine.state import StateBase
+
+    session = _build_session(tmp_path)
+    StateBase.metadata.create_all(session.get_bind())
+    long_ago = datetime.now(timezone.utc) - timedelta(hours=2)
+    run = CrawlRun(run_id="slow", started_at=long_ago, heartbeat_at=datetime.now(timezone.utc))
+    session.add(run)
+    session.commit()
+
+    assert crawl_runner.run_is_live(session, run)
+    run.heartbeat_at = long_ago
+    session.commit()
+    assert not crawl_runner.run_is_live(session, run)
+
+
 def test_notifications_gated_when_disabled(monkeypatch):
     from backend.notifications import NotificationService
     from backend.models import CrawlRun
@@ -0,0 +1,104 @@
+import asyncio
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.crawl_engine import engine as engine_module
+from backend.crawl_engine.engine import EngineV2
+from backend.crawl_engine.state import StateBase
+from backend.models import Base, Job
+
+
+class RecordingScorer:
+    def __init__(self):
+        self.texts = []
+
+    def score_many(self, texts, batch_size=None):
+        self.texts.extend(texts)
+        return [0.5] * len(texts)
+
+
+def _session():
+    db_engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(db_engine)
+    StateBase.metadata.create_all(db_engine)
+    return sessionmaker(bind=db_engine)()
+
+
+def _source(cursor=None):
+    return [
+        {"title": "Python Engineer", "url": "https://example.com/1", "source": "t", "description": "APIs"},
+        {"title": "Platform Engineer", "url": "https://example.com/2", "source": "t", "description": "Python, Go"},
+        {"title": "Sales Manager", "url": "https://example.com/3", "source": "t", "description": "Quota"},
+    ]
+
+
+def test_prefilter_skips_model_and_threshold_applies_before_storing(monkeypatch):
+    scorer = RecordingScorer()
+    monkeypatch.setattr(engine_module, "get_nlp_scorer", lambda: scorer)
+    monkeypatch.setattr(engine_module.settings, "NLP_WEIGHT", 3.0)
+    session = _session()
+
+    eng = EngineV2(db=session, ignore_cooldown=True, keywords=["Python"], min_store_score=3.0)
+    asyncio.run(eng._run_source("t", _source))
+
+    assert len(scorer.texts) == 2
+    assert not any("Sales" in text for text in scorer.texts)
+    stored = session.query(Job).one()
+    assert stored.title == "Python Engineer"
+    assert stored.relevance_score == 2.0 + 0.5 * 3.0
+    assert stored.keywords_matched == "Python"
+    metrics = eng.metrics.source["t"]
+    assert metrics["jobs_prefilter_checked_count"] == 3
+    assert metrics["jobs_prefilter_passed_count"] == 2
+    assert metrics["jobs_above_threshold_count"] == 1
+    assert metrics["stage_pass_rates"] == {"prefilter": 0.6667, "model": 1.0, "store": 0.3333}
+
+
+def test_rejected_jobs_are_stored_unscored_at_zero_threshold(monkeypatch):
+    scorer = RecordingScorer()
+    monkeypatch.setattr(engine_module, "get_nlp_scorer", lambda: scorer)
+    session = _session()
+
+    eng = EngineV2(db=session, ignore_cooldown=True, keywords=["Python"], min_store_score=0.0)
+    asyncio.run(eng._run_source("t", _source))
+
+    assert len(scorer.texts) == 2
+    assert session.query(Job).filter(Job.title == "Sales Manager").one().relevance_score == 0.0
+
+
+def test_cascade_can_be_disabled(monkeypatch):
+    scorer = RecordingScorer()
+    monkeypatch.setattr(engine_module, "get_nlp_scorer", lambda: scorer)
+    monkeypatch.setattr(engine_module.settings, "CRAWL_SCORING_CASCADE", False)
+    session = _session()
+
+    eng = EngineV2(db=session, ignore_cooldown=True, keywords=["Python"], min_store_score=0.0)
+    asyncio.run(eng._run_source("t", _source))
+
+    assert len(scorer.texts) == 3
+    assert session.query(Job).filter(Job.title == "Sales Manager").one().relevance_score == 1.5
+
+
+def test_location_prefilter_keeps_remote_and_matching_locations(monkeypatch):
+    monkeypatch.setattr(engine_module, "get_nlp_scorer", lambda: None)
+    monkeypatch.setattr(engine_module.settings, "CRAWL_CASCADE_MATCH_LOCATION", True)
+    session = _session()
+
+    def source(cursor=None):
+        return [
+            {"title": "Python Dev", "url": "https://example.com/a", "source": "t", "location": "Berlin, Germany"},
+            {"title": "Python Dev", "url": "https://example.com/b", "source": "t", "location": "Austin, United States"},
+            {"title": "Python Dev", "url": "https://example.com/c", "source": "t", "location": "Anywhere", "remote": True},
+        ]
+
+    eng = EngineV2(
+        db=session,
+        ignore_cooldown=True,
+        keywords=["Python"],
+        locations=["Remote", "United States"],
+        min_store_score=1.0,
+    )
+    asyncio.run(eng._run_source("t", source))
+
+    assert sorted(job.url for job in session.query(Job)) == ["https://example.com/b", "https://example.com/c"]
@@ -0,0 +1,65 @@
+import asyncio
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.crawl_engine import engine as engine_module
+from backend.crawl_engine.engine import EngineV2
+from backend.crawl_engine.scoring import ScoringCoordinator
+from backend.crawl_engine.state import StateBase
+from backend.models import Base, Job
+
+
+class RecordingScorer:
+    def __init__(self):
+        self.calls = []
+
+    def score_many(self, texts, batch_size=None):
+        self.calls.append(list(texts))
+        return [0.1 * (i % 5) for i in range(len(texts))]
+
+
+def test_coordinator_flushes_full_batches_then_remainder_on_deadline():
+    scorer = RecordingScorer()
+
+    async def run():
+        coordinator = ScoringCoordinator(scorer, flush_size=4, max_wait_ms=10)
+        return await coordinator.score_many([f"text {i}" for i in range(10)]), coordinator
+
+    scores, coordinator = asyncio.run(run())
+
+    assert coordinator.batch_sizes == [4, 4, 2]
+    assert len(scores) == 10
+
+
+def test_engine_scores_concurrent_sources_in_one_batch(monkeypatch):
+    scorer = RecordingScorer()
+    monkeypatch.setattr(engine_module, "get_nlp_scorer", lambda: scorer)
+    monkeypatch.setattr(engine_module.settings, "NLP_SCORING_MAX_WAIT_MS", 300)
+    db_engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(db_engine)
+    StateBase.metadata.create_all(db_engine)
+    session = sessionmaker(bind=db_engine)()
+
+    def source(prefix, count, words):
+        return lambda cursor=None: [
+            {
+                "title": f"{prefix} role {i}",
+                "description": f"{words} opening number {i} {prefix}",
+                "url": f"https://{prefix}.example.com/{i}",
+                "source": prefix,
+            }
+            for i in range(count)
+        ]
+
+    eng = EngineV2(db=session, ignore_cooldown=True)
+    asyncio.run(
+        eng.run_sources(
+            {"small": source("small", 12, "python backend"), "large": source("large", 20, "react frontend")},
+            {"small": True, "large": True},
+        )
+    )
+
+    assert len(scorer.calls) == 1
+    assert len(scorer.calls[0]) == 32
+    assert session.query(Job).count() == 32
@@ -0,0 +1,106 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import main
+from backend.database import ensure_schema, get_db
+from backend.models import Base, Job
+from backend.search import match_expression
+
+
+def _job(i, title, description, score=0.0, company="Acme"):
+    return Job(
+        job_key=f"k{i}",
+        title=title,
+        company=company,
+        location="Remote",
+        description=description,
+        url=f"https://example.com/{i}",
+        source="s",
+        relevance_score=score,
+    )
+
+
+def _client(indexed=True):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    db.add_all(
+        [
+            _job(1, "Office Manager", "Keeps the office running", score=5.0),
+            _job(2, "Python Developer", "Backend services in Python and FastAPI", score=1.0),
+            _job(3, "Data Analyst", "SQL, dashboards and some python scripting", score=2.0),
+        ]
+        + [_job(10 + i, "Support Specialist", "Help customers by email and chat") for i in range(10)]
+    )
+    db.commit()
+    if indexed:
+        ensure_schema(engine)  # backfills rows that predate the index
+
+    def override_db():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    main.app.dependency_overrides[get_db] = override_db
+    return TestClient(main.app), Session
+
+
+def _titles(client, **params):
+    return [job["title"] for job in client.get("/api/jobs", params=params).json()]
+
+
+def test_match_expression_quotes_words_and_prefixes_the_last():
+    assert match_expression('python "dev') == '"python" "dev"*'
+    assert match_expression("C++ OR -") == '"C" "OR"*'
+    assert match_expression("  ") is None
+
+
+def test_fts_search_ranks_title_matches_and_prefixes():
+    client, _ = _client()
+    try:
+        assert _titles(client, q="python") == ["Python Developer", "Data Analyst"]
+        assert _titles(client, q="pyth") == ["Python Developer", "Data Analyst"]
+        assert _titles(client, q="python", collapse=True) == ["Python Developer", "Data Analyst"]
+        assert _titles(client, q="office manag") == ["Office Manager"]
+    finally:
+        main.app.dependency_overrides.clear()
+
+
+def test_triggers_keep_index_in_sync():
+    client, Session = _client()
+    try:
+        db = Session()
+        db.add(_job(4, "Rust Engineer", "Systems work"))
+        db.query(Job).filter(Job.job_key == "k2").update({Job.title: "Golang Developer", Job.description: "Go"})
+        db.query(Job).filter(Job.job_key == "k3").delete()
+        db.commit()
+        db.close()
+
+        assert _titles(client, q="rust") == ["Rust Engineer"]
+        assert _titles(client, q="python") == []
+        assert _titles(client, q="golang") == ["Golang Developer"]
+    finally:
+        main.app.dependency_overrides.clear()
+
+
+def test_falls_back_to_substring_search_without_index():
+    client, _ = _client(indexed=False)
+    try:
+        assert _titles(client, q="ytho") == ["Data Analyst", "Python Developer"]
+    finally:
+        main.app.dependency_overrides.clear()
+
+
+def test_broad_terms_keep_relevance_order(monkeypatch):
+    monkeypatch.setattr("backend.search.settings.SEARCH_RANK_MAX_HITS", 1)
+    client, _ = _client()
+    try:
+        assert _titles(client, q="python") == ["Data Analyst", "Python Developer"]
+        assert _titles(client, q="office") == ["Office Manager"]
+    finally:
+        main.app.dependency_overrides.clear()
@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import main
+from backend.config import settings
+from backend.database import ensure_schema, get_db
+from backend.models import Base, Settings as SettingsModel
+from backend.rescoring import stored_keywords
+from backend.settings_store import get_settings_snapshot, init_default_settings
+
+
+def _setup():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    ensure_schema(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return sessionmaker(bind=engine), statements
+
+
+def test_defaults_are_stored_once_and_snapshot_is_reused_until_a_write():
+    Session, statements = _setup()
+    db = Session()
+    db.add(SettingsModel(key="sources", value=json.dumps({"remoteok": False})))
+    db.commit()
+    init_default_settings(db)
+
+    stored = {row.key for row in db.query(SettingsModel)}
+    first = get_settings_snapshot(db)
+    statements.clear()
+    again = get_settings_snapshot(db)
+    reads_for_cached = len(statements)
+
+    # a write from any code path moves the version
+    row = db.query(SettingsModel).filter(SettingsModel.key == "keywords").one()
+    row.value = json.dumps(["Rust"])
+    db.commit()
+    changed = get_settings_snapshot(db)
+
+    assert {"keywords", "locations", "schedule", "india_mode", "linkedin_mode", "linkedin_crawl"} <= stored
+    assert first.sources["remoteok"] is False and first.sources.keys() == settings.JOB_SOURCES.keys()
+    assert again is first and reads_for_cached == 1
+    assert changed.keywords == ("Rust",) and changed.version != first.version
+
+
+def test_cached_snapshot_cannot_be_mutated_by_callers():
+    Session, _ = _setup()
+    db = Session()
+    db.add(SettingsModel(key="greenhouse_boards", value=json.dumps([{"name": "Acme", "board_url": "https://x"}])))
+    db.commit()
+    init_default_settings(db)
+    snapshot = get_settings_snapshot(db)
+
+    with pytest.raises(TypeError):
+        snapshot.sources["remoteok"] = False
+    with pytest.raises(TypeError):
+        snapshot.greenhouse_boards[0]["name"] = "Other"
+    keywords = stored_keywords(db)
+    keywords.append("Cobol")
+    copy = snapshot.to_dict()
+    copy["linkedin_crawl"]["changed"] = True
+
+    again = get_settings_snapshot(db)
+    assert again is snapshot
+    assert "Cobol" not in again.keywords and "changed" not in again.linkedin_crawl
+    assert copy["greenhouse_boards"] == [{"name": "Acme", "board_url": "https://x"}]
+
+
+def test_settings_api_round_trips_through_the_snapshot():
+    Session, _ = _setup()
+
+    def override_db():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    main.app.dependency_overrides[get_db] = override_db
+    try:
+        client = TestClient(main.app)
+        current = client.get("/api/settings").json()
+        current.update(keywords=["Go"], crawl_hour=5, greenhouse_boards=[{"name": "Acme", "board_url": "https://x"}])
+        assert client.put("/api/settings", json=current).status_code == 200
+        updated = client.get("/api/settings").json()
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert updated["keywords"] == ["Go"] and updated["crawl_hour"] == 5
+    assert updated["greenhouse_boards"] == [{"name": "Acme", "board_url": "https://x"}]